@@ -0,0 +1,127 @@
+"""
+Benchmark BaseScraper.filter_jobs on synthetic jobs
+
+Compares the original per-keyword any() loops, a single compiled regex
+alternation, and the precompiled KeywordMatcher now used by filter_jobs.
+
+Usage:
+    python benchmarks/bench_filter.py [--jobs 100000]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import INTERNSHIP_KEYWORDS, ROLE_KEYWORDS
+from scrapers.base_scraper import BaseScraper, Job
+
+TITLE_WORDS = [
+    "software", "hardware", "electrical", "engineer", "intern", "internship",
+    "analog", "digital", "design", "verification", "senior", "manager", "data",
+    "science", "product", "marketing", "sales", "firmware", "embedded", "co-op",
+    "summer", "2026", "fpga", "asic", "test", "operations", "finance", "account"
+]
+DESCRIPTION_WORDS = TITLE_WORDS + [
+    "the", "team", "will", "work", "with", "customers", "and", "partners", "on",
+    "performance", "systems", "across", "our", "organization", "experience"
+]
+
+
+def legacy_filter_jobs(jobs, filters):
+    """filter_jobs as it was before the precompiled matcher"""
+    filtered = []
+
+    for job in jobs:
+        title_lower = job.title.lower()
+        desc_lower = job.description.lower()
+
+        is_internship = any(keyword in title_lower or keyword in desc_lower
+                            for keyword in filters.get("internship_keywords", []))
+
+        has_role_keyword = any(keyword.lower() in title_lower or keyword.lower() in desc_lower
+                               for keyword in filters.get("role_keywords", []))
+
+        if is_internship and has_role_keyword:
+            filtered.append(job)
+
+    return filtered
+
+
+def regex_filter_jobs(jobs, filters):
+    """One compiled alternation per group, for reference"""
+    def compile_group(keywords):
+        ordered = sorted({k.lower() for k in keywords}, key=len, reverse=True)
+        return re.compile("|".join(re.escape(k) for k in ordered))
+
+    internship = compile_group(filters["internship_keywords"])
+    role = compile_group(filters["role_keywords"])
+    filtered = []
+
+    for job in jobs:
+        text = f"{job.title}\n{job.description}".lower()
+        if internship.search(text) and role.search(text):
+            filtered.append(job)
+
+    return filtered
+
+
+def make_jobs(count, seed=42):
+    """Synthetic jobs: short titles, about a third with a description"""
+    rng = random.Random(seed)
+    jobs = []
+
+    for i in range(count):
+        title = " ".join(rng.choices(TITLE_WORDS, k=rng.randint(3, 7))).title()
+        description = ""
+        if rng.random() < 0.35:
+            description = " ".join(rng.choices(DESCRIPTION_WORDS, k=rng.randint(20, 120)))
+
+        jobs.append(Job(title=title, company=f"Company {i % 500}", location="Austin, TX",
+                        url=f"https://example.com/jobs/{i}", description=description,
+                        source="Benchmark"))
+
+    return jobs
+
+
+def time_filter(name, filter_fn, jobs, filters, repeat):
+    best = float("inf")
+    result = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = filter_fn(jobs, filters)
+        best = min(best, time.perf_counter() - start)
+
+    print(f"  {name:<28} {best * 1000:8.1f} ms  ({len(jobs) / best:,.0f} jobs/s, {len(result)} kept)")
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark filter_jobs")
+    parser.add_argument("--jobs", type=int, default=100000, help="number of synthetic jobs")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per variant (best is reported)")
+    args = parser.parse_args()
+
+    filters = {
+        "internship_keywords": INTERNSHIP_KEYWORDS,
+        "role_keywords": ROLE_KEYWORDS
+    }
+    jobs = make_jobs(args.jobs)
+    scraper = BaseScraper("Benchmark")
+
+    print(f"Filtering {len(jobs):,} synthetic jobs (best of {args.repeat}):")
+    legacy_time, legacy_result = time_filter("legacy any() loops", legacy_filter_jobs, jobs, filters, args.repeat)
+    _, regex_result = time_filter("compiled regex alternation", regex_filter_jobs, jobs, filters, args.repeat)
+    matcher_time, matcher_result = time_filter("KeywordMatcher", scraper.filter_jobs, jobs, filters, args.repeat)
+
+    assert matcher_result == legacy_result == regex_result, "Filter variants disagree"
+    print(f"Speedup over legacy: {legacy_time / matcher_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark Job construction time and memory
+
+Compares the original dict-backed Job (per-instance __dict__, two strftime
+calls and an eager md5 per job) with the current __slots__ Job.
+
+Usage:
+    python benchmarks/bench_job.py [--jobs 100000]
+"""
+
+import argparse
+import gc
+import hashlib
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.base_scraper import Job
+
+COMPANIES = ["Intel", "AMD", "NVIDIA", "Qualcomm", "Texas Instruments", "Analog Devices",
+             "Apple", "Tesla", "SpaceX", "Micron", "Broadcom", "Marvell"]
+LOCATIONS = ["San Jose, CA", "Austin, TX", "Santa Clara, CA", "Boston, MA", "Remote", "Seattle, WA"]
+SOURCES = ["LinkedIn", "Simplify", "Indeed"]
+
+
+class LegacyJob:
+    """Job as it was before __slots__ / interning / lazy ids"""
+
+    def __init__(self, title, company, location, url, description="", posted_date="", source=""):
+        self.title = title
+        self.company = company
+        self.location = location
+        self.url = url
+        self.description = description
+        self.posted_date = posted_date or datetime.now().strftime("%Y-%m-%d")
+        self.source = source
+        self.scraped_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.id = self._generate_id()
+
+    def _generate_id(self):
+        unique_string = f"{self.title}{self.company}{self.url}"
+        return hashlib.md5(unique_string.encode()).hexdigest()
+
+
+def make_fields(count, seed=42):
+    """
+    Raw card fields; repeated values are fresh string objects each time,
+    the way .text.strip() on parsed HTML returns them
+    """
+    rng = random.Random(seed)
+    return [
+        (f"Hardware Engineering Intern {i}",
+         (rng.choice(COMPANIES) + " ").strip(),
+         (rng.choice(LOCATIONS) + " ").strip(),
+         f"https://example.com/jobs/{i}",
+         (rng.choice(SOURCES) + " ").strip())
+        for i in range(count)
+    ]
+
+
+def build(job_class, fields):
+    return [job_class(title=title, company=company, location=location, url=url, source=source)
+            for title, company, location, url, source in fields]
+
+
+def measure(name, job_class, fields):
+    # Timed run without tracemalloc, which would distort the timings
+    gc.collect()
+    start = time.perf_counter()
+    jobs = build(job_class, fields)
+    elapsed = time.perf_counter() - start
+    del jobs
+
+    gc.collect()
+    tracemalloc.start()
+    jobs = build(job_class, fields)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"  {name:<10} construct {elapsed * 1000:8.1f} ms   retained {retained / 1024 / 1024:7.1f} MiB")
+    return jobs, elapsed, retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Job construction")
+    parser.add_argument("--jobs", type=int, default=100000, help="number of jobs to build")
+    args = parser.parse_args()
+
+    fields = make_fields(args.jobs)
+    print(f"Building {len(fields):,} jobs (retained = memory held by the job list):")
+
+    legacy_jobs, legacy_time, legacy_memory = measure("legacy", LegacyJob, fields)
+    del legacy_jobs
+    jobs, job_time, job_memory = measure("slots", Job, fields)
+
+    print(f"Construction: {legacy_time / job_time:.1f}x faster, "
+          f"memory: {legacy_memory / job_memory:.1f}x smaller")
+
+    # Canonical URLs and ids are computed lazily, so only jobs that survive filtering pay for them
+    start = time.perf_counter()
+    for job in jobs:
+        job.id
+    print(f"Computing all canonical URLs and ids afterwards: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
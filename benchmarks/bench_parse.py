@@ -0,0 +1,101 @@
+"""
+Benchmark HTML card parsing per source on the saved fixture pages
+
+Compares the original full html.parser tree + find_all() with the
+strained find_cards() path, on html.parser and (if installed) lxml, and
+checks every variant finds the same cards.
+
+Usage:
+    python benchmarks/bench_parse.py [--repeat 10]
+    (regenerate fixtures with benchmarks/make_fixtures.py)
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+from scrapers.html_parsing import PARSER, find_cards
+from scrapers.builtin_scraper import BuiltInScraper
+from scrapers.company_discovery_scraper import CompanyDiscoveryScraper
+from scrapers.company_scraper import CompanyScraper
+from scrapers.glassdoor_scraper import GlassdoorScraper
+from scrapers.handshake_scraper import HandshakeScraper
+from scrapers.indeed_scraper import IndeedScraper
+from scrapers.linkedin_scraper import LinkedInScraper
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# label -> (fixture, selectors the scraper uses for that page)
+SOURCES = {
+    "linkedin": ("linkedin", LinkedInScraper.card_selectors),
+    "indeed": ("indeed", IndeedScraper.card_selectors),
+    "glassdoor": ("glassdoor", GlassdoorScraper.card_selectors),
+    "handshake": ("handshake", HandshakeScraper.card_selectors),
+    "builtin": ("builtin", BuiltInScraper.card_selectors),
+    "company": ("company", CompanyScraper.card_selectors),
+    # Later runs, once the company's profile has learned its card selector
+    "company (profiled)": ("company", (CompanyScraper.card_selectors[2],)),
+    "builtin_companies": ("builtin_companies", (CompanyDiscoveryScraper.BUILTIN_COMPANIES,)),
+    "ycombinator": ("ycombinator", (CompanyDiscoveryScraper.YC_COMPANIES,)),
+}
+
+
+def legacy_find_cards(content, *selectors):
+    """The original path: full html.parser tree, then find_all()"""
+    soup = BeautifulSoup(content, 'html.parser')
+    for selector in selectors:
+        cards = selector.find_all(soup)
+        if cards:
+            return cards
+    return []
+
+
+def best_time(fn, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark card parsing on fixture pages")
+    parser.add_argument("--repeat", type=int, default=10, help="runs per variant (best is reported)")
+    args = parser.parse_args()
+
+    variants = [("legacy html.parser", legacy_find_cards),
+                ("strained html.parser", lambda c, *s: find_cards(c, *s, parser="html.parser"))]
+    if PARSER == "lxml":
+        variants.append(("strained lxml", lambda c, *s: find_cards(c, *s, parser="lxml")))
+    else:
+        print("lxml not installed - only html.parser variants are timed")
+
+    print(f"Parse time per page in ms (best of {args.repeat}), default parser: {PARSER}")
+    print(f"  {'source':<20} {'KB':>5} {'cards':>5}" + "".join(f" {name:>21}" for name, _ in variants) + "  speedup")
+
+    for name, (fixture, selectors) in SOURCES.items():
+        with open(os.path.join(FIXTURE_DIR, f"{fixture}.html"), 'rb') as f:
+            content = f.read()
+
+        times = []
+        texts = None
+        for _, fn in variants:
+            elapsed, cards = best_time(lambda: fn(content, *selectors), args.repeat)
+            card_texts = [card.get_text(" ", strip=True) for card in cards]
+            assert texts is None or card_texts == texts, f"{name}: variants found different cards"
+            texts = card_texts
+            times.append(elapsed)
+
+        print(f"  {name:<20} {len(content) // 1024:>5} {len(texts):>5}"
+              + "".join(f" {t * 1000:>21.1f}" for t in times)
+              + f"  {times[0] / times[-1]:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+Offline benchmark of every scraper's parse path on the saved fixtures
+
+The fixtures are synthetic pages generated by make_fixtures.py, not
+recorded responses: they reproduce the markup each scraper reads inside
+realistic page bulk, so they track parser cost and catch selector
+regressions in our code, but not changes to the live sites.
+
+Each source runs its real parsing method (_scrape_query, _scrape_keyword,
+_scrape_builtin, _scrape_company, or the Simplify feed stream) with fetch()
+replaced by a stub that serves the fixture, so nothing touches the network
+or data/. Reports cards/s, memory blocks still held after the parse (the
+Jobs and whatever they keep alive) and peak traced memory, and writes them
+as JSON. With --compare, sources that got slower or stopped finding the
+same cards/jobs are flagged, against the committed baseline.json unless
+another results file is given. Card/job counts must match exactly; the
+speed and memory figures depend on the machine, so refresh the baseline
+(--output benchmarks/baseline.json) when comparing on different hardware.
+
+Usage:
+    python benchmarks/bench_scrapers.py [--repeat 5] [--output benchmarks/results.json]
+                                        [--compare [previous.json]] [--tolerance 0.25]
+    (regenerate fixtures with benchmarks/make_fixtures.py)
+"""
+
+import argparse
+import gc
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.builtin_scraper import BuiltInScraper
+from scrapers.company_profiles import CompanyProfiles
+from scrapers.company_scraper import CompanyScraper
+from scrapers.glassdoor_scraper import GlassdoorScraper
+from scrapers.handshake_scraper import HandshakeScraper
+from scrapers.html_parsing import PARSER
+from scrapers.http_cache import HttpCache
+from scrapers.indeed_scraper import IndeedScraper
+from scrapers.linkedin_scraper import LinkedInScraper
+from scrapers.query_planner import SearchQuery
+from scrapers.simplify_scraper import SimplifyScraper
+from scrapers.source_health import HealthTracker
+from scrapers.watermarks import Watermarks
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results.json")
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+KEYWORD = "hardware engineering"
+LOCATION = "United States"
+
+
+class FixtureResponse:
+    """Just enough of requests.Response for the scrapers: one fixture body, then empty pages"""
+
+    def __init__(self, content: bytes):
+        self.status_code = 200
+        self.content = content
+        self.headers: Dict[str, str] = {}
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size: int = 1):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def offline(scraper, content: bytes, directory: str):
+    """
+    Point a scraper at a fixture: the first fetch() returns it, later ones
+    (e.g. LinkedIn's next page) an empty page. Its persisted state lives
+    in `directory` instead of data/.
+    """
+    responses = iter([content])
+    scraper.fetch = lambda url, **kwargs: FixtureResponse(next(responses, b"<html></html>"))
+    scraper.health = HealthTracker(os.path.join(directory, "health.json"))
+    scraper.watermarks = Watermarks(os.path.join(directory, "watermarks.json"))
+    scraper.http_cache = HttpCache(os.path.join(directory, "http_cache.json"))
+    scraper.profiles = CompanyProfiles(os.path.join(directory, "profiles.json"))
+    return scraper
+
+
+def count_cards(scraper, content: bytes) -> int:
+    return len(scraper.find_cards(content))
+
+
+def count_listings(scraper, content: bytes) -> int:
+    return len(json.loads(content))
+
+
+# source -> (fixture, scraper class, parse call, card counter)
+SOURCES: Dict[str, tuple] = {
+    "linkedin": ("linkedin.html", LinkedInScraper,
+                 lambda s: s._scrape_query(SearchQuery(KEYWORD, [KEYWORD]), LOCATION), count_cards),
+    "indeed": ("indeed.html", IndeedScraper,
+               lambda s: s._scrape_query(SearchQuery(KEYWORD, [KEYWORD]), LOCATION), count_cards),
+    "glassdoor": ("glassdoor.html", GlassdoorScraper, lambda s: s._scrape_keyword(KEYWORD, LOCATION), count_cards),
+    "handshake": ("handshake.html", HandshakeScraper, lambda s: s._scrape_keyword(KEYWORD, LOCATION), count_cards),
+    "builtin": ("builtin.html", BuiltInScraper, lambda s: s._scrape_builtin(s.base_urls[0]), count_cards),
+    "company": ("company.html", CompanyScraper,
+                lambda s: s._scrape_company("Acme", {"url": "https://careers.acme.com/search"}), count_cards),
+    "simplify": ("simplify.json", SimplifyScraper, lambda s: s.scrape([KEYWORD], LOCATION), count_listings),
+}
+
+
+def run_once(scraper_class, parse: Callable, content: bytes) -> List:
+    """One parse on a fresh, offline scraper (its output is discarded)"""
+    with tempfile.TemporaryDirectory() as directory, redirect_stdout(io.StringIO()):
+        return parse(offline(scraper_class(), content, directory))
+
+
+def measure(name: str, repeat: int = 5) -> Dict:
+    """Time and memory figures for one source"""
+    fixture, scraper_class, parse, counter = SOURCES[name]
+    with open(os.path.join(FIXTURE_DIR, fixture), 'rb') as f:
+        content = f.read()
+
+    cards = counter(scraper_class(), content)
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        jobs = run_once(scraper_class, parse, content)
+        best = min(best, time.perf_counter() - start)
+
+    # Memory in a separate run: tracing slows everything down
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    jobs = run_once(scraper_class, parse, content)
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retained = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+
+    return {
+        "fixture_bytes": len(content),
+        "cards": cards,
+        "jobs": len(jobs),
+        "seconds": round(best, 6),
+        "cards_per_second": round(cards / best, 1) if best else 0.0,
+        "retained_blocks": retained,
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def compare(results: Dict, previous: Dict, tolerance: float) -> List[str]:
+    """Regressions against an earlier results file"""
+    problems = []
+
+    for name, current in results["sources"].items():
+        old = previous.get("sources", {}).get(name)
+        if not old:
+            continue
+        if (current["cards"], current["jobs"]) != (old["cards"], old["jobs"]):
+            problems.append(f"{name}: found {current['cards']} cards / {current['jobs']} jobs, "
+                            f"was {old['cards']} / {old['jobs']}")
+        if current["cards_per_second"] < old["cards_per_second"] * (1 - tolerance):
+            problems.append(f"{name}: {current['cards_per_second']:.0f} cards/s, was {old['cards_per_second']:.0f}")
+        if current["peak_kb"] > old["peak_kb"] * (1 + tolerance):
+            problems.append(f"{name}: peak {current['peak_kb']:.0f} KB, was {old['peak_kb']:.0f} KB")
+
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every scraper's parse path offline")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per source (best is reported)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="where to write the JSON results")
+    parser.add_argument("--compare", nargs="?", const=BASELINE,
+                        help="earlier results file to check for regressions (default: the committed baseline.json)")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown/memory growth (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    previous = None
+    if args.compare:
+        with open(args.compare) as f:  # Read first, in case --output overwrites it
+            previous = json.load(f)
+
+    results = {
+        "python": platform.python_version(),
+        "parser": PARSER,
+        "repeat": args.repeat,
+        "sources": {name: measure(name, args.repeat) for name in SOURCES},
+    }
+
+    print(f"Parse path per source (best of {args.repeat}), parser: {PARSER}")
+    print(f"  {'source':<10} {'KB':>6} {'cards':>6} {'jobs':>5} {'ms':>8} {'cards/s':>9} {'blocks':>8} {'peak KB':>8}")
+    for name, r in results["sources"].items():
+        print(f"  {name:<10} {r['fixture_bytes'] // 1024:>6} {r['cards']:>6} {r['jobs']:>5} {r['seconds'] * 1000:>8.1f} "
+              f"{r['cards_per_second']:>9.0f} {r['retained_blocks']:>8} {r['peak_kb']:>8.0f}")
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nWrote {args.output}")
+
+    if previous is not None:
+        problems = compare(results, previous, args.tolerance)
+        for problem in problems:
+            print(f"REGRESSION {problem}")
+        if problems:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""
+Generate the saved pages used by the parsing benchmarks
+
+The pages are synthetic, not recorded responses. Each page mimics the markup its scraper reads (card classes, data-testid
+attributes) wrapped in the bulk a real results page carries: inline
+scripts and styles, navigation, filters and footer. simplify.json mimics
+the Simplify listings feed. Output is deterministic so the fixtures only
+change when this script does.
+
+Usage:
+    python benchmarks/make_fixtures.py
+"""
+
+import json
+import os
+import random
+from html import escape
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+TITLES = [
+    "Hardware Engineering Intern", "Electrical Engineering Intern - Summer 2026",
+    "ASIC Design Verification Intern", "FPGA Engineer Intern", "Embedded Firmware Intern",
+    "Analog Circuit Design Co-op", "Software Engineer Intern", "Product Marketing Intern",
+    "RF Systems Engineering Intern", "Silicon Validation Intern", "Data Science Intern",
+    "PCB Layout Intern", "Mixed-Signal IC Design Intern", "Finance Intern",
+]
+COMPANIES = [
+    "Intel", "NVIDIA", "AMD", "Qualcomm", "Texas Instruments", "Analog Devices",
+    "Micron", "Skydio", "Shield AI", "Zipline", "Apple", "Broadcom", "Lumafield",
+]
+LOCATIONS = ["Santa Clara, CA", "Austin, TX", "San Diego, CA", "Boston, MA", "Remote", "Portland, OR"]
+WORDS = ("design verification silicon team build test lab customers systems board bring-up "
+         "layout tapeout firmware hardware schematic simulation measurement").split()
+
+
+def sentence(rng, n=18):
+    return " ".join(rng.choice(WORDS) for _ in range(n)).capitalize() + "."
+
+
+def page(rng, title, cards):
+    """Wrap cards in the boilerplate of a typical job board page"""
+    script = "\n".join(f"window.__state_{i} = {{\"k\": \"{'x' * 120}\", \"n\": {i}}};" for i in range(400))
+    style = "\n".join(f".c{i} {{ margin: {i % 9}px; padding: {i % 7}px; color: #{i:06x}; }}" for i in range(600))
+    nav = "\n".join(f'<li class="nav-item"><a class="nav-link" href="/browse/{i}">Category {i}</a></li>' for i in range(250))
+    filters = "\n".join(
+        f'<div class="filter"><label><input type="checkbox" name="f{i}"> {escape(sentence(rng, 3))}</label></div>'
+        for i in range(150)
+    )
+    footer = "\n".join(f'<p class="legal">{escape(sentence(rng, 30))}</p>' for i in range(60))
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{escape(title)}</title>
+<style>
+{style}
+</style>
+<script>
+{script}
+</script>
+</head>
+<body>
+<header><nav><ul class="nav">
+{nav}
+</ul></nav></header>
+<main>
+<aside class="filters">
+{filters}
+</aside>
+<section class="results">
+{cards}
+</section>
+</main>
+<footer>
+{footer}
+</footer>
+</body>
+</html>
+"""
+
+
+def job(rng):
+    return escape(rng.choice(TITLES)), escape(rng.choice(COMPANIES)), escape(rng.choice(LOCATIONS)), rng.randrange(10**9, 10**10)
+
+
+def linkedin_card(rng):
+    title, company, location, job_id = job(rng)
+    return f"""<li><div class="base-card relative w-full base-search-card job-search-card" data-entity-urn="urn:li:jobPosting:{job_id}">
+  <a class="base-card__full-link absolute" href="https://www.linkedin.com/jobs/view/{title.lower().replace(' ', '-')}-{job_id}?position=1&amp;pageNum=0&amp;refId=abc&amp;trackingId=def"><span class="sr-only">{title}</span></a>
+  <div class="search-entity-media"><img class="artdeco-entity-image" data-delayed-url="https://media.licdn.com/{job_id}.png" alt=""></div>
+  <div class="base-search-card__info">
+    <h3 class="base-search-card__title">{title}</h3>
+    <h4 class="base-search-card__subtitle"><a class="hidden-nested-link" href="https://www.linkedin.com/company/{job_id}">{company}</a></h4>
+    <div class="base-search-card__metadata">
+      <span class="job-search-card__location">{location}</span>
+      <time class="job-search-card__listdate" datetime="2026-10-0{rng.randrange(1, 9)}">1 week ago</time>
+    </div>
+  </div>
+</div></li>"""
+
+
+def indeed_card(rng):
+    title, company, location, job_id = job(rng)
+    return f"""<li><div class="cardOutline tapItem"><div class="slider_container"><div class="job_seen_beacon">
+  <table class="jobCard_mainContent"><tbody><tr><td class="resultContent">
+    <h2 class="jobTitle css-1psdjh5"><a class="jcs-JobTitle" aria-label="{title}" href="/rc/clk?jk={job_id:x}&amp;fccid=ab12&amp;vjs=3"><span title="{title}">{title}</span></a></h2>
+    <div class="company_location"><span data-testid="company-name">{company}</span><div data-testid="text-location">{location}</div></div>
+  </td></tr></tbody></table>
+  <div class="metadata"><div class="attribute_snippet">Internship</div></div>
+  <div class="underShelfFooter"><ul><li>{escape(sentence(rng))}</li><li>{escape(sentence(rng))}</li></ul></div>
+</div></div></div></li>"""
+
+
+def glassdoor_card(rng):
+    title, company, location, job_id = job(rng)
+    return f"""<li class="react-job-listing css-108gl9c" data-id="{job_id}">
+  <div class="d-flex"><div class="employer-name">{company}</div><div class="rating">4.1</div></div>
+  <a class="job-title" href="/job-listing/{job_id}.htm?jl={job_id}&amp;pos=101&amp;ao=1136043">{title}</a>
+  <span class="job-location">{location}</span>
+  <div class="job-description">{escape(sentence(rng, 30))}</div>
+  <div class="salary-estimate">$30 - $45 Per Hour (Employer est.)</div>
+</li>"""
+
+
+def handshake_card(rng):
+    title, company, location, job_id = job(rng)
+    return f"""<div class="job-card style__card___1rhof" data-hook="job-{job_id}">
+  <a href="/jobs/{job_id}" class="style__link___1fA2F"><h3>{title}</h3></a>
+  <div class="company-name">{company}</div>
+  <div class="location">{location}</div>
+  <div class="tags"><span>Internship</span><span>Paid</span><span>{escape(sentence(rng, 4))}</span></div>
+</div>"""
+
+
+def builtin_card(rng):
+    title, company, location, job_id = job(rng)
+    return f"""<div class="job-item job-bounded-responsive" data-id="{job_id}">
+  <div class="company-logo"><img src="/logos/{job_id}.png" alt=""></div>
+  <h2 class="job-title"><a href="/job/{job_id}">{title}</a></h2>
+  <span class="company-name">{company}</span>
+  <span class="location">{location}</span>
+  <div class="job-info">{escape(sentence(rng, 25))}</div>
+</div>"""
+
+
+def company_card(rng):
+    title, _, location, job_id = job(rng)
+    return f"""<li class="job">
+  <h3><a href="/job/{job_id}/{title.lower().replace(' ', '-')}">{title}</a></h3>
+  <span class="job-location">{location}</span>
+  <span class="job-date-posted">10/0{rng.randrange(1, 9)}/2026</span>
+  <p class="description">{escape(sentence(rng, 25))}</p>
+</li>"""
+
+
+def builtin_company_card(rng):
+    _, company, _, job_id = job(rng)
+    return f"""<div class="company-card"><a class="company-title" href="/company/{job_id}">{company}</a>
+  <div class="company-info">{escape(sentence(rng, 15))}</div></div>"""
+
+
+def ycombinator_card(rng):
+    _, company, location, job_id = job(rng)
+    return f"""<a class="_company_86jzd_338" href="/companies/{job_id}">
+  <div class="_logo"><img src="/logos/{job_id}.png" alt=""></div>
+  <div><span class="_coName_86jzd_453">{company}</span><span class="_coLocation_86jzd_469">{location}</span></div>
+  <div class="_coDescription">{escape(sentence(rng, 12))}</div>
+</a>"""
+
+
+# fixture name -> (page title, card builder, number of cards)
+FIXTURES = {
+    "linkedin": ("Hardware Intern Jobs | LinkedIn", linkedin_card, 60),
+    "indeed": ("Hardware Intern Jobs - Indeed", indeed_card, 50),
+    "glassdoor": ("Hardware Intern Jobs | Glassdoor", glassdoor_card, 30),
+    "handshake": ("Jobs | Handshake", handshake_card, 30),
+    "builtin": ("Hardware Jobs | Built In", builtin_card, 40),
+    "company": ("Search Jobs | Careers", company_card, 40),
+    "builtin_companies": ("Hardware Companies | Built In", builtin_company_card, 80),
+    "ycombinator": ("Startup Directory | Y Combinator", ycombinator_card, 80),
+}
+
+
+SIMPLIFY_LISTINGS = 2000
+
+
+def simplify_listing(rng, i):
+    """One entry shaped like Simplify's listings.json"""
+    title, company, location, job_id = job(rng)
+    return {
+        "source": "Simplify",
+        "company_name": company,
+        "id": f"{job_id:x}-{i}",
+        "title": title,
+        "active": rng.random() < 0.8,
+        "terms": ["Summer 2026"],
+        "date_updated": 1760000000 + i * 60,
+        "url": f"https://simplify.jobs/p/{job_id:x}?utm_source=GHList",
+        "locations": [location] + ([rng.choice(LOCATIONS)] if rng.random() < 0.3 else []),
+        "company_url": f"https://simplify.jobs/c/{company.replace(' ', '-')}",
+        "is_visible": True,
+        "date_posted": 1760000000 + i * 45,
+        "sponsorship": rng.choice(["Offers Sponsorship", "Does Not Offer Sponsorship", "Other"]),
+    }
+
+
+def main():
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+
+    for name, (title, card, count) in FIXTURES.items():
+        rng = random.Random(name)
+        cards = "\n".join(card(rng) for _ in range(count))
+        path = os.path.join(FIXTURE_DIR, f"{name}.html")
+        with open(path, 'w') as f:
+            f.write(page(rng, title, cards))
+        print(f"Wrote {path} ({os.path.getsize(path) // 1024} KB)")
+
+    rng = random.Random("simplify")
+    path = os.path.join(FIXTURE_DIR, "simplify.json")
+    with open(path, 'w') as f:
+        json.dump([simplify_listing(rng, i) for i in range(SIMPLIFY_LISTINGS)], f, indent=4)
+    print(f"Wrote {path} ({os.path.getsize(path) // 1024} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -32,6 +32,24 @@ INTERNSHIP_KEYWORDS = [
     "intern", "internship", "summer 2026", "co-op", "coop"
 ]
 
+# Title keywords that mark a listing as EE/hardware relevant, per scraper
+# (each source keeps its own list, so tuning one doesn't change the others)
+RELEVANCE_KEYWORDS = {
+    "simplify": [
+        "hardware", "electrical", "circuit", "analog", "digital",
+        "semiconductor", "vlsi", "fpga", "embedded", "firmware"
+    ],
+    "builtin": [
+        "hardware", "electrical", "circuit", "chip", "silicon",
+        "semiconductor", "vlsi", "fpga", "embedded", "firmware"
+    ],
+    "company": [
+        "hardware", "electrical", "circuit", "analog", "digital",
+        "semiconductor", "vlsi", "asic", "fpga", "chip", "silicon",
+        "embedded", "firmware", "pcb", "rf", "mixed-signal"
+    ],
+}
+
 # Location preferences (can be modified)
 LOCATIONS = [
     "United States",
@@ -67,3 +85,66 @@ PRIORITY_COMPANIES = [
 # Scraping settings
 SCRAPE_INTERVAL_HOURS = 6  # How often to scrape (for local testing)
 MAX_JOBS_PER_SOURCE = 100  # Maximum jobs to fetch per source per run
+MAX_JOBS_BY_SOURCE = {  # Per-source overrides of MAX_JOBS_PER_SOURCE (None = keep them all)
+    "Simplify": None,  # One streamed feed request however many listings it keeps
+}
+
+# How each board is searched for JOB_KEYWORDS: boards with an OR operator get the
+# keywords packed into queries up to max_length characters; the rest search one
+# keyword per request. Past max_queries requests, runs rotate through the keywords.
+QUERY_PLANS = {
+    "LinkedIn": {"operator": "OR", "max_length": 120, "max_queries": 3},
+    "Indeed": {"operator": "OR", "max_length": 120, "max_queries": 3},
+    "Glassdoor": {"max_queries": 3},
+    "Handshake": {"max_queries": 3},
+}
+LINKEDIN_MAX_PAGES = 5  # Result pages per LinkedIn keyword (times the keywords a packed query covers); crawling stops early at a page of known jobs
+LINKEDIN_PAGE_SIZE = 25  # Cards LinkedIn returns per result page
+INDEED_CARDS_PER_KEYWORD = 50  # Result cards read per Indeed keyword (times the keywords a packed query covers)
+INDEED_PAGE_SIZE = 10  # Offset step between Indeed result pages
+
+# Concurrency settings (used by `python scraper_main.py --concurrent`)
+MAX_SOURCE_WORKERS = 7  # Scrapers run at the same time
+MAX_REQUESTS_PER_HOST = 1  # In-flight requests allowed per hostname
+
+# Per-host token buckets: rate = requests per second, burst = requests allowed back to back
+RATE_LIMIT_DEFAULT = {"rate": 0.5, "burst": 1}
+RATE_LIMITS = {  # Keyed by host or domain
+    "linkedin.com": {"rate": 1 / 3, "burst": 1},  # Be extra respectful with LinkedIn
+    "glassdoor.com": {"rate": 1 / 3, "burst": 1},
+}
+RATE_LIMIT_MAX_BACKOFF = 120  # Longest wait (seconds) after a 429/503, even if Retry-After asks for more
+RATE_LIMIT_RETRIES = 2  # Retries of a request answered with 429/503
+
+# HTTP session settings (shared by all scrapers)
+HTTP_POOL_CONNECTIONS = 32  # Number of hosts to keep connection pools for
+HTTP_POOL_MAXSIZE = 4  # Keep-alive connections per host
+HTTP_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+HTTP_CACHE_FILE = "data/http_cache.json"  # ETag/Last-Modified validators for conditional GETs
+COMPANY_PROFILES_FILE = "data/company_profiles.json"  # Card/title/location selectors learned per company
+SOURCE_HEALTH_FILE = "data/source_health.json"  # Per-source/company health records for the circuit breaker
+WATERMARKS_FILE = "data/watermarks.json"  # Last successful crawl per source and keyword
+WATERMARK_OVERLAP_HOURS = 6  # Extra hours each incremental crawl re-covers, for postings indexed late
+
+# Circuit breaker: after this many failed runs in a row (errors or block pages),
+# or this many empty runs in a row (normal answers that parsed no cards at all),
+# a source is skipped, then probed again after 12h, 24h, ... (capped). Runs that
+# parse cards but find nothing new are healthy. The first backoff is longer than
+# SCRAPE_INTERVAL_HOURS so a tripped source sits out at least one scheduled run.
+HEALTH_FAILURE_THRESHOLD = 3
+HEALTH_EMPTY_THRESHOLD = 3
+HEALTH_BASE_BACKOFF_HOURS = 2 * SCRAPE_INTERVAL_HOURS
+HEALTH_MAX_BACKOFF_HOURS = 168
+
+# Storage settings
+STORAGE_BACKEND = "json"  # "json" (rewrite data/jobs_*.json), "segments" (append-only) or "sqlite"
+SEGMENT_STORE_DIR = "data/store"  # Where the segments backend keeps its files
+SQLITE_DB_PATH = "data/jobs.db"  # Database file for the sqlite backend
+DEDUP_INDEX_FILE = "data/dedup_index.jsonl"  # Append-only MinHash/LSH index log for cross-source duplicates
+NEAR_DUPLICATE_THRESHOLD = 0.8  # Title similarity (Jaccard) needed to merge two jobs
+SHARD_DIR = "data/shards"  # Shards of jobs_all.json (numbered from the oldest) plus manifest.json, for the site
+SHARD_SIZE = 100  # Jobs per shard (the site renders the first shard before loading the rest)
+PUBLISH_REPORT_FILE = "data/publish_report.json"  # Bytes on disk and on the wire per format of the site files (encode times are only printed, so it only changes with the data)
+PRETTY_JSON = False  # Indent data/jobs_*.json for reading (site files are always minified)
@@ -36,6 +36,7 @@ def main():
     ]
 
     scraper.scrape(keywords)
+    scraper.watermarks.save()
 
     print("\n✅ Discovery complete!")
     print("\nNext steps:")
@@ -2,6 +2,25 @@
 let allJobs = [];
 let filteredJobs = [];
 let applicationStatus = {};
+let filterActive = false;
+
+// Sharded data: fixed-size shards counted from the oldest job, listed newest first in
+// the manifest; only the newest shard can be partly full
+const SHARD_PATH = '../data/shards/';
+let manifest = null;
+let nextShard = 0;
+let shardJobs = [];
+let shardRequests = [];
+
+// Descriptions and links live in a details file per shard, fetched when a job is expanded
+let detailShards = [];
+let detailRequests = [];
+const expandedJobs = new Set();
+
+// Inverted index over the shards (sorted tokens -> gap-encoded job positions)
+let searchIndexRequest = null;
+let indexedResults = false;
+let filterRun = 0;
 
 // Load application status from localStorage
 function loadApplicationStatus() {
@@ -30,20 +49,31 @@ function updateJobStatus(jobId, status) {
 // Fetch jobs from data file
 async function fetchJobs() {
     try {
-        // Try to fetch from the aggregated jobs file
-        // This path will be relative to the GitHub Pages site
-        const response = await fetch('../data/jobs_all.json');
+        manifest = await fetchManifest();
 
-        if (!response.ok) {
-            throw new Error('Failed to fetch jobs');
+        if (manifest) {
+            // Only the newest shard is needed to show the first page
+            await loadNextShard();
+        } else {
+            // No shards published yet: fall back to the aggregated jobs file
+            // This path will be relative to the GitHub Pages site
+            const response = await fetch('../data/jobs_all.json');
+
+            if (!response.ok) {
+                throw new Error('Failed to fetch jobs');
+            }
+
+            allJobs = await response.json();
         }
 
-        allJobs = await response.json();
         filteredJobs = allJobs;
 
         renderJobs();
         updateStats();
         updateLastUpdated();
+
+        // Fetch the search index in the background so the first search is instant
+        loadSearchIndex();
     } catch (error) {
         console.error('Error fetching jobs:', error);
         document.getElementById('jobsList').innerHTML = `
@@ -56,16 +86,286 @@ async function fetchJobs() {
     }
 }
 
+// Fetch the shard manifest (null if the site only has jobs_all.json)
+async function fetchManifest() {
+    try {
+        const response = await fetch(`${SHARD_PATH}manifest.json`, { cache: 'no-cache' });
+        return response.ok ? await response.json() : null;
+    } catch (error) {
+        return null;
+    }
+}
+
+// Fetch one shard (each is requested at most once)
+function loadShard(index) {
+    if (!shardRequests[index]) {
+        const shard = manifest.shards[index];
+
+        // Each shard's version changes only with its own content, so older shards stay cached
+        shardRequests[index] = fetch(`${SHARD_PATH}${shard.file}?v=${encodeURIComponent(shard.version || manifest.updated)}`)
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error(`Failed to fetch ${shard.file}`);
+                }
+                return response.json();
+            })
+            .then(jobs => {
+                jobs.forEach(job => {
+                    job._shard = index;
+                });
+                shardJobs[index] = jobs;
+            })
+            .catch(error => {
+                shardRequests[index] = null;
+                throw error;
+            });
+    }
+
+    return shardRequests[index];
+}
+
+// Fetch one shard's details (job id -> description, url, urls)
+function loadDetailShard(index) {
+    if (!detailRequests[index]) {
+        const shard = manifest.shards[index];
+
+        detailRequests[index] = fetch(`${SHARD_PATH}${shard.details}?v=${encodeURIComponent(shard.details_version || manifest.updated)}`)
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error(`Failed to fetch ${shard.details}`);
+                }
+                return response.json();
+            })
+            .then(details => {
+                detailShards[index] = details;
+            })
+            .catch(error => {
+                detailRequests[index] = null;
+                throw error;
+            });
+    }
+
+    return detailRequests[index];
+}
+
+// A job's detail if it is already loaded (records from jobs_all.json carry their own)
+function cachedDetail(job) {
+    if (job._shard === undefined) return job;
+    return (detailShards[job._shard] || {})[job.id] || null;
+}
+
+// Expand or collapse a job, fetching its shard's details the first time
+async function toggleDetails(jobId) {
+    if (expandedJobs.has(jobId)) {
+        expandedJobs.delete(jobId);
+        renderJobs();
+        return;
+    }
+
+    expandedJobs.add(jobId);
+    const job = filteredJobs.find(candidate => candidate.id === jobId);
+
+    if (job && !cachedDetail(job)) {
+        renderJobs();  // Shows "Loading details..." meanwhile
+        try {
+            await loadDetailShard(job._shard);
+        } catch (error) {
+            console.error('Error fetching job details:', error);
+            expandedJobs.delete(jobId);
+        }
+    }
+
+    renderJobs();
+}
+
+function renderDetail(job) {
+    const detail = cachedDetail(job);
+    if (!detail) {
+        return '<div class="job-description">Loading details...</div>';
+    }
+
+    return `
+        ${detail.description ? `
+            <div class="job-description">${escapeHtml(detail.description)}</div>
+        ` : ''}
+        <div class="job-actions">
+            <a href="${escapeHtml(detail.url)}" target="_blank" class="btn btn-primary">
+                View Job
+            </a>
+            ${(detail.urls || []).slice(1).map(link => `
+                <a href="${escapeHtml(link.url)}" target="_blank" class="btn btn-secondary">
+                    View on ${escapeHtml(link.source)}
+                </a>
+            `).join('')}
+        </div>
+    `;
+}
+
+// Position (newest first) of a shard's first job
+function shardStart(index) {
+    return index === 0 ? 0 : manifest.shards[0].count + (index - 1) * manifest.shard_size;
+}
+
+// [shard index, offset in the shard] of a position (newest first)
+function locate(position) {
+    const head = manifest.shards[0].count;
+    if (position < head) return [0, position];
+    const rest = position - head;
+    return [1 + Math.floor(rest / manifest.shard_size), rest % manifest.shard_size];
+}
+
+// Append the next (older) shard to allJobs
+async function loadNextShard() {
+    if (!manifest || nextShard >= manifest.shards.length) {
+        return;
+    }
+
+    await loadShard(nextShard);
+
+    // Searches may have fetched later shards already
+    while (shardJobs[nextShard] && allJobs.length === shardStart(nextShard)) {
+        allJobs = allJobs.concat(shardJobs[nextShard]);
+        nextShard++;
+    }
+}
+
+// Load every remaining shard (search, source filter and export need them all)
+async function loadAllShards() {
+    while (manifest && nextShard < manifest.shards.length) {
+        await loadNextShard();
+    }
+}
+
+// Fetch the search index (null if unavailable or built for other data)
+function loadSearchIndex() {
+    if (!manifest) {
+        return Promise.resolve(null);
+    }
+
+    if (!searchIndexRequest) {
+        searchIndexRequest = fetch(`${SHARD_PATH}search_index.json?v=${encodeURIComponent(manifest.updated)}`)
+            .then(response => response.ok ? response.json() : null)
+            .then(index => index && index.version === manifest.updated ? index : null)
+            .catch(() => null);
+    }
+
+    return searchIndexRequest;
+}
+
+// Gap-encoded postings -> ascending job positions
+function decodePostings(gaps) {
+    const positions = new Array(gaps.length);
+    let position = 0;
+    for (let i = 0; i < gaps.length; i++) {
+        position += gaps[i];
+        positions[i] = position;
+    }
+    return positions;
+}
+
+// Positions of jobs with any token starting with prefix
+function prefixPostings(index, prefix) {
+    // Binary search for the first token >= prefix; matches are contiguous from there
+    let low = 0;
+    let high = index.tokens.length;
+    while (low < high) {
+        const mid = (low + high) >> 1;
+        if (index.tokens[mid] < prefix) low = mid + 1; else high = mid;
+    }
+
+    const matches = new Set();
+    for (let i = low; i < index.tokens.length && index.tokens[i].startsWith(prefix); i++) {
+        for (const position of decodePostings(index.postings[i])) {
+            matches.add(position);
+        }
+    }
+    return [...matches].sort((a, b) => a - b);
+}
+
+// Intersect two ascending position lists (null means every job)
+function intersectPositions(a, b) {
+    if (a === null) return b;
+
+    const result = [];
+    let i = 0;
+    let j = 0;
+    while (i < a.length && j < b.length) {
+        if (a[i] === b[j]) {
+            result.push(a[i]);
+            i++;
+            j++;
+        } else if (a[i] < b[j]) {
+            i++;
+        } else {
+            j++;
+        }
+    }
+    return result;
+}
+
+// Positions matching every query token (as a prefix) and the source, or null for no constraint
+function searchPositions(index, searchTerm, sourceFilter) {
+    let positions = null;
+
+    for (const token of searchTerm.split(/[^a-z0-9]+/).filter(Boolean)) {
+        positions = intersectPositions(positions, prefixPostings(index, token));
+    }
+
+    if (sourceFilter !== 'all') {
+        positions = intersectPositions(positions, decodePostings(index.facets.source[sourceFilter] || []));
+    }
+
+    return positions;
+}
+
+// The jobs at the given positions, fetching only the shards they live in
+async function jobsAt(positions) {
+    const located = positions.map(locate);
+    const shards = [...new Set(located.map(([index]) => index))];
+    await Promise.all(shards.map(loadShard));
+    return located.map(([index, offset]) => shardJobs[index][offset]);
+}
+
+// Load older jobs once the end of the list scrolls into view
+const loadMoreObserver = new IntersectionObserver(async entries => {
+    if (!entries.some(entry => entry.isIntersecting)) return;
+
+    try {
+        await loadNextShard();
+    } catch (error) {
+        console.error('Error fetching jobs:', error);
+        return;
+    }
+
+    if (filterActive) {
+        filterJobs();
+    } else {
+        filteredJobs = allJobs;
+        renderJobs();
+        updateStats();
+    }
+});
+
 // Render jobs to the page
 function renderJobs() {
     const jobsList = document.getElementById('jobsList');
+    loadMoreObserver.disconnect();
 
     if (filteredJobs.length === 0) {
         jobsList.innerHTML = '<div class="no-jobs">No jobs match your current filters.</div>';
-        return;
+    } else {
+        jobsList.innerHTML = renderJobCards(filteredJobs);
     }
 
-    jobsList.innerHTML = filteredJobs.map(job => {
+    // Older shards not loaded yet: fetch the next one when this comes into view
+    if (!indexedResults && manifest && nextShard < manifest.shards.length) {
+        jobsList.insertAdjacentHTML('beforeend', '<div id="loadMore" class="loading">Loading older jobs...</div>');
+        loadMoreObserver.observe(document.getElementById('loadMore'));
+    }
+}
+
+function renderJobCards(jobs) {
+    return jobs.map(job => {
         const status = applicationStatus[job.id]?.status || 'not-applied';
         const statusClass = status.replace('_', '-');
 
@@ -87,16 +387,12 @@ function renderJobs() {
                     <span class="source-badge">${escapeHtml(job.source)}</span>
                 </div>
 
-                ${job.description ? `
-                    <div class="job-description">
-                        ${escapeHtml(job.description).substring(0, 200)}${job.description.length > 200 ? '...' : ''}
-                    </div>
-                ` : ''}
+                ${expandedJobs.has(job.id) ? renderDetail(job) : ''}
 
                 <div class="job-actions">
-                    <a href="${escapeHtml(job.url)}" target="_blank" class="btn btn-primary">
-                        View Job
-                    </a>
+                    <button onclick="toggleDetails('${job.id}')" class="btn btn-secondary">
+                        ${expandedJobs.has(job.id) ? 'Hide Details' : 'Details'}
+                    </button>
                     ${status === 'not-applied' ? `
                         <button onclick="updateJobStatus('${job.id}', 'applied')" class="btn btn-success">
                             Mark Applied
@@ -122,13 +418,46 @@ function renderJobs() {
 }
 
 // Filter jobs based on search and filters
-function filterJobs() {
+async function filterJobs() {
+    filterActive = true;
+    const run = ++filterRun;  // Results of an older keystroke that finish late are dropped
+
     const searchTerm = document.getElementById('searchInput').value.toLowerCase();
     const showNotApplied = document.getElementById('filterNotApplied').checked;
     const showApplied = document.getElementById('filterApplied').checked;
     const showInterviewing = document.getElementById('filterInterviewing').checked;
     const sourceFilter = document.getElementById('sourceFilter').value;
 
+    const matchesStatus = job => {
+        const status = applicationStatus[job.id]?.status || 'not-applied';
+        return (status === 'not-applied' && showNotApplied) ||
+            (status === 'applied' && showApplied) ||
+            (status === 'interviewing' && showInterviewing);
+    };
+
+    // Searches and source filters cover every job, not just the shards loaded so far:
+    // answer them from the search index, fetching only the shards with matches
+    const searching = searchTerm || sourceFilter !== 'all';
+    const index = searching ? await loadSearchIndex() : null;
+    const positions = index ? searchPositions(index, searchTerm, sourceFilter) : null;
+    indexedResults = positions !== null;
+
+    if (indexedResults) {
+        const jobs = await jobsAt(positions);
+        if (run !== filterRun) return;
+
+        filteredJobs = jobs.filter(matchesStatus);
+        renderJobs();
+        updateStats();
+        return;
+    }
+
+    // No index (older data): scan every job
+    if (searching) {
+        await loadAllShards();
+    }
+    if (run !== filterRun) return;
+
     filteredJobs = allJobs.filter(job => {
         // Search filter
         const matchesSearch = !searchTerm ||
@@ -137,17 +466,11 @@ function filterJobs() {
             job.location.toLowerCase().includes(searchTerm) ||
             (job.description && job.description.toLowerCase().includes(searchTerm));
 
-        // Status filter
-        const status = applicationStatus[job.id]?.status || 'not-applied';
-        const matchesStatus =
-            (status === 'not-applied' && showNotApplied) ||
-            (status === 'applied' && showApplied) ||
-            (status === 'interviewing' && showInterviewing);
+        // Source filter (merged duplicates also list their other sources)
+        const matchesSource = sourceFilter === 'all' || job.source === sourceFilter ||
+            (job.sources || (job.urls || []).map(link => link.source)).includes(sourceFilter);
 
-        // Source filter
-        const matchesSource = sourceFilter === 'all' || job.source === sourceFilter;
-
-        return matchesSearch && matchesStatus && matchesSource;
+        return matchesSearch && matchesStatus(job) && matchesSource;
     });
 
     renderJobs();
@@ -156,7 +479,7 @@ function filterJobs() {
 
 // Update statistics
 function updateStats() {
-    const totalJobs = allJobs.length;
+    const totalJobs = manifest ? manifest.total : allJobs.length;
     const appliedCount = Object.values(applicationStatus).filter(s => s.status === 'applied' || s.status === 'interviewing').length;
 
     // Calculate new jobs (scraped in the last 24 hours)
@@ -171,7 +494,9 @@ function updateStats() {
 
 // Update last updated timestamp
 function updateLastUpdated() {
-    if (allJobs.length > 0) {
+    if (manifest && manifest.updated) {
+        document.getElementById('lastUpdated').textContent = new Date(manifest.updated).toLocaleString();
+    } else if (allJobs.length > 0) {
         const latestJob = allJobs[0]; // Jobs are sorted by scraped_date
         const lastUpdated = new Date(latestJob.scraped_date);
         document.getElementById('lastUpdated').textContent = lastUpdated.toLocaleString();
@@ -179,12 +504,17 @@ function updateLastUpdated() {
 }
 
 // Export application data
-function exportData() {
+async function exportData() {
+    await loadAllShards();
+    if (manifest) {
+        await Promise.all(manifest.shards.map((shard, index) => loadDetailShard(index)));
+    }
+
     const exportData = allJobs.map(job => ({
         title: job.title,
         company: job.company,
         location: job.location,
-        url: job.url,
+        url: (cachedDetail(job) || {}).url || '',
         source: job.source,
         status: applicationStatus[job.id]?.status || 'not-applied',
         updatedAt: applicationStatus[job.id]?.updatedAt || '',
@@ -251,8 +581,9 @@ document.getElementById('filterInterviewing').addEventListener('change', filterJ
 document.getElementById('sourceFilter').addEventListener('change', filterJobs);
 document.getElementById('exportBtn').addEventListener('click', exportData);
 
-// Make updateJobStatus available globally
+// Make the card handlers available globally
 window.updateJobStatus = updateJobStatus;
+window.toggleDetails = toggleDetails;
 
 // Initialize
 loadApplicationStatus();
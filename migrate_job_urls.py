@@ -0,0 +1,101 @@
+"""
+One-time migration to canonical job URLs
+
+Job ids used to hash the raw URL, so LinkedIn's per-request refId/trackingId
+params gave the same posting a new id on every scrape. New jobs now get
+canonical URLs (scrapers/url_canonical.py); this script rewrites the stored
+datasets the same way and collapses the duplicates they built up.
+
+Safe to run more than once. Application statuses saved in the browser are
+keyed by job id, so statuses on LinkedIn jobs whose id changes are reset.
+
+Usage:
+    python migrate_job_urls.py
+"""
+
+import glob
+import os
+from typing import Dict, List, Tuple
+from scrapers.base_scraper import Job
+from scrapers.url_canonical import canonicalize_url
+from storage import open_store, AGGREGATED_FILE
+from storage.dedup import NearDuplicateIndex
+from config import DEDUP_INDEX_FILE, NEAR_DUPLICATE_THRESHOLD
+
+
+def canonical_record(record: Dict) -> Dict:
+    """The record with its canonical URL, id and source links"""
+    job = Job(record['title'], record['company'], record.get('location', ''),
+              record['url'], source=record.get('source', ''))
+    migrated = {**record, "id": job.id, "url": job.url}
+
+    if 'urls' in record:
+        migrated['urls'] = [{**link, "url": canonicalize_url(link['url'], link.get('source', ''))}
+                            for link in record['urls']]
+    return migrated
+
+
+def collapse(records: List[Dict]) -> Tuple[List[Dict], int]:
+    """
+    Canonicalize every record and keep one per id: the first sighting
+    (oldest scraped_date), with the newest non-empty description
+    Returns the jobs and how many records changed or were dropped
+    """
+    by_id: Dict[str, Dict] = {}
+    changed = 0
+
+    # Oldest first, so the kept record is the first time the job was seen
+    for record in sorted(records, key=lambda r: r['scraped_date']):
+        migrated = canonical_record(record)
+        if migrated != record:
+            changed += 1
+
+        kept = by_id.get(migrated['id'])
+        if kept is None:
+            by_id[migrated['id']] = migrated
+            continue
+
+        changed += 1
+        if migrated.get('description'):
+            kept['description'] = migrated['description']
+        for link in migrated.get('urls', []):
+            if link not in kept.setdefault('urls', []):
+                kept['urls'].append(link)
+
+    return list(by_id.values()), changed
+
+
+def migrate_dataset(filepath: str) -> bool:
+    """Rewrite one dataset in the configured backend, returning whether it changed"""
+    store = open_store(filepath)
+    records = store.load_sorted()
+    jobs, changed = collapse(records)
+
+    if not changed:
+        print(f"  {filepath}: already canonical ({len(records)} jobs)")
+        return False
+
+    store.replace(jobs)
+    store.export_json(filepath)  # No-op for the JSON backend, which just rewrote it
+    print(f"  {filepath}: {len(records)} -> {len(jobs)} jobs")
+    return True
+
+
+def main():
+    print("Migrating stored jobs to canonical URLs...")
+
+    datasets = sorted(glob.glob(os.path.join('data', 'jobs_*.json')))
+    changed = [filepath for filepath in datasets if migrate_dataset(filepath)]
+
+    # Ids changed, so the near-duplicate index is rebuilt from the migrated jobs
+    if AGGREGATED_FILE in changed or not os.path.exists(DEDUP_INDEX_FILE):
+        index = NearDuplicateIndex(DEDUP_INDEX_FILE, threshold=NEAR_DUPLICATE_THRESHOLD)
+        index.rebuild(open_store(AGGREGATED_FILE).iter_sorted())
+        index.save()
+        print(f"  Rebuilt {DEDUP_INDEX_FILE}")
+
+    print(f"Done: {len(changed)} of {len(datasets)} datasets rewritten")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,20 +2,29 @@
 Main scraper script that coordinates all job scrapers
 """
 
-import json
+import argparse
 import os
 from datetime import datetime
 from scrapers import (
-    IndeedScraper, LinkedInScraper, GlassdoorScraper,
+    BaseScraper, Job, IndeedScraper, LinkedInScraper, GlassdoorScraper,
     SimplifyScraper, HandshakeScraper, BuiltInScraper, CompanyScraper
 )
-from config import JOB_KEYWORDS, ROLE_KEYWORDS, INTERNSHIP_KEYWORDS, MAX_JOBS_PER_SOURCE
+from scrapers.orchestrator import run_sources
+from scrapers.source_health import SKIP, PROBE
+from storage import PersistencePipeline
+from config import (
+    JOB_KEYWORDS, ROLE_KEYWORDS, INTERNSHIP_KEYWORDS, MAX_JOBS_PER_SOURCE, MAX_JOBS_BY_SOURCE,
+    MAX_SOURCE_WORKERS
+)
 
 
-def main():
+def main(concurrent: bool = False, max_workers: int = MAX_SOURCE_WORKERS, all_sources: bool = False):
     """Run all scrapers and aggregate results"""
     print(f"Starting job scraper at {datetime.now()}")
 
+    # Every job scraped in this run shares one scraped_date
+    Job.start_run()
+
     # Create data directory if it doesn't exist
     os.makedirs('data', exist_ok=True)
 
@@ -30,34 +39,43 @@ def main():
         CompanyScraper(),
     ]
 
+    # Skip sources that keep coming back empty; their time goes to the rest
+    health = BaseScraper.health
+    if not all_sources:
+        scrapers = select_healthy(scrapers)
+
+    # Each data file is read at most once and written once, at the end
+    pipeline = PersistencePipeline()
     all_jobs = []
     total_new_jobs = 0
 
-    # Run each scraper
+    # Loaded up front so incremental crawls can stop at jobs we already have
     for scraper in scrapers:
-        print(f"\n{'='*50}")
-        print(f"Running {scraper.name} scraper...")
-        print(f"{'='*50}")
+        scraper.known_ids = pipeline.known_ids(source_file(scraper))
 
-        try:
-            # Scrape jobs
-            jobs = scraper.scrape(JOB_KEYWORDS[:3], location="United States")  # Limit keywords to avoid rate limits
+    if concurrent:
+        # Sources run at the same time; per-host limits in BaseScraper.fetch keep it polite
+        print(f"Running {len(scrapers)} scrapers concurrently ({max_workers} workers)...")
+        results = run_sources(scrapers, collect_jobs, max_workers=max_workers)
+    else:
+        results = run_sequentially(scrapers)
 
-            # Filter jobs
-            filters = {
-                "internship_keywords": INTERNSHIP_KEYWORDS,
-                "role_keywords": ROLE_KEYWORDS
-            }
-            filtered_jobs = scraper.filter_jobs(jobs, filters)
+    # Results arrive in scraper order, so saving is identical in both modes
+    for scraper, jobs, error in results:
+        health.record(scraper.name, found=scraper.scraped_count, statuses=scraper.http_statuses,
+                      blocked=scraper.blocked_pages, error=error)
 
-            print(f"Found {len(jobs)} total jobs, {len(filtered_jobs)} after filtering")
+        if error is not None:
+            print(f"Error running {scraper.name} scraper: {error}")
+            BaseScraper.watermarks.reset(scraper.name)  # Its jobs weren't saved, so re-crawl the full window
+            continue
 
+        try:
             # Update scraper's jobs with filtered results
-            scraper.jobs = filtered_jobs[:MAX_JOBS_PER_SOURCE]
+            scraper.jobs = jobs
 
-            # Save to individual scraper file
-            scraper_file = f"data/jobs_{scraper.name.lower()}.json"
-            new_count = scraper.save_jobs(scraper_file)
+            # Stage for the individual scraper file
+            new_count = scraper.save_jobs(source_file(scraper), pipeline)
             total_new_jobs += new_count
 
             all_jobs.extend([job.to_dict() for job in scraper.jobs])
@@ -65,42 +83,95 @@ def main():
         except Exception as e:
             print(f"Error running {scraper.name} scraper: {e}")
 
-    # Save aggregated results
-    save_aggregated_jobs(all_jobs)
+    # Save aggregated results and write every data file
+    pipeline.save_aggregated(all_jobs)
+    health.save()
+    BaseScraper.watermarks.save()  # Only after the jobs they cover are written
+    BaseScraper.http_cache.save()  # Likewise, so unsaved listings aren't answered with a 304
 
     print(f"\n{'='*50}")
     print(f"Scraping completed at {datetime.now()}")
     print(f"Total new jobs found: {total_new_jobs}")
+    print_connection_stats()
     print(f"{'='*50}")
 
 
-def save_aggregated_jobs(new_jobs):
-    """Save all jobs to a single aggregated file"""
-    filepath = "data/jobs_all.json"
+def print_connection_stats():
+    """Show how many requests reused a pooled keep-alive connection"""
+    stats = BaseScraper.connection_stats()
+    if not stats:
+        return
+
+    total_requests = sum(host["requests"] for host in stats.values())
+    total_reused = sum(host["reused"] for host in stats.values())
+    print(f"HTTP requests: {total_requests} ({total_reused} reused a pooled connection)")
 
-    # Load existing jobs
-    try:
-        with open(filepath, 'r') as f:
-            existing_jobs = json.load(f)
-    except FileNotFoundError:
-        existing_jobs = []
+    for host, host_stats in sorted(stats.items()):
+        print(f"  {host}: {host_stats['requests']} requests, "
+              f"{host_stats['connections']} connections, {host_stats['reused']} reused")
 
-    # Merge jobs (avoid duplicates by ID)
-    existing_ids = {job['id'] for job in existing_jobs}
-    unique_new_jobs = [job for job in new_jobs if job['id'] not in existing_ids]
 
-    all_jobs = existing_jobs + unique_new_jobs
+def source_file(scraper) -> str:
+    """The scraper's own data file"""
+    return f"data/jobs_{scraper.name.lower()}.json"
+
+
+def select_healthy(scrapers):
+    """Drop scrapers whose circuit is open; ones due for a probe still run"""
+    selected = []
+
+    for scraper in scrapers:
+        state = BaseScraper.health.check(scraper.name)
+        if state == SKIP:
+            print(f"Skipping {scraper.name} (failing or empty in recent runs, see data/source_health.json)")
+            continue
+        if state == PROBE:
+            print(f"Probing {scraper.name} after repeated failed or empty runs")
+        selected.append(scraper)
+
+    return selected
+
+
+def run_sequentially(scrapers):
+    """Run scrapers one after another, yielding (scraper, jobs, error)"""
+    for scraper in scrapers:
+        try:
+            yield scraper, collect_jobs(scraper), None
+        except Exception as e:
+            yield scraper, [], e
+
+
+def collect_jobs(scraper):
+    """Scrape and filter jobs for a single scraper"""
+    print(f"\n{'='*50}")
+    print(f"Running {scraper.name} scraper...")
+    print(f"{'='*50}")
+
+    # Scrape jobs
+    # Each scraper packs the keywords into as few requests as its board allows
+    jobs = scraper.scrape(JOB_KEYWORDS, location="United States")
+    scraper.scraped_count = len(jobs)
 
-    # Sort by scraped date (most recent first)
-    all_jobs.sort(key=lambda x: x['scraped_date'], reverse=True)
+    # Filter jobs
+    filters = {
+        "internship_keywords": INTERNSHIP_KEYWORDS,
+        "role_keywords": ROLE_KEYWORDS
+    }
+    filtered_jobs = scraper.filter_jobs(jobs, filters)
 
-    # Save to file
-    with open(filepath, 'w') as f:
-        json.dump(all_jobs, f, indent=2)
+    print(f"[{scraper.name}] Found {len(jobs)} total jobs, {len(filtered_jobs)} after filtering")
 
-    print(f"\nSaved aggregated jobs to {filepath}")
-    print(f"Total jobs in database: {len(all_jobs)}")
+    return filtered_jobs[:MAX_JOBS_BY_SOURCE.get(scraper.name, MAX_JOBS_PER_SOURCE)]
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Run all job scrapers")
+    parser.add_argument("--concurrent", action="store_true",
+                        help="run sources at the same time instead of one after another")
+    parser.add_argument("--workers", type=int, default=MAX_SOURCE_WORKERS,
+                        help="maximum number of scrapers running at once")
+    parser.add_argument("--all-sources", action="store_true",
+                        help="run every source, even ones the circuit breaker is skipping")
+    args = parser.parse_args()
+
+    main(concurrent=args.concurrent, max_workers=args.workers, all_sources=args.all_sources)
@@ -3,11 +3,11 @@ Quick scraper - Uses only reliable sources to get you jobs FAST
 Run this to quickly populate your site while the main scraper is being debugged
 """
 
-import json
 import os
 from datetime import datetime
-from scrapers import SimplifyScraper
-from config import JOB_KEYWORDS, ROLE_KEYWORDS, INTERNSHIP_KEYWORDS
+from scrapers import BaseScraper, Job, SimplifyScraper
+from storage import PersistencePipeline
+from config import JOB_KEYWORDS, ROLE_KEYWORDS, INTERNSHIP_KEYWORDS, MAX_JOBS_PER_SOURCE, MAX_JOBS_BY_SOURCE
 
 
 def main():
@@ -15,6 +15,9 @@ def main():
     print(f"Starting QUICK job scraper at {datetime.now()}")
     print("Using only fast, reliable sources...")
 
+    # Every job scraped in this run shares one scraped_date
+    Job.start_run()
+
     # Create data directory
     os.makedirs('data', exist_ok=True)
 
@@ -39,15 +42,17 @@ def main():
         print(f"Found {len(jobs)} total jobs, {len(filtered_jobs)} after filtering")
 
         # Save jobs
-        scraper.jobs = filtered_jobs[:100]
+        scraper.jobs = filtered_jobs[:MAX_JOBS_BY_SOURCE.get(scraper.name, MAX_JOBS_PER_SOURCE)]
 
-        # Save to file
+        # Stage for the source file, then write it and jobs_all.json in one flush
+        pipeline = PersistencePipeline()
         scraper_file = f"data/jobs_{scraper.name.lower()}.json"
-        new_count = scraper.save_jobs(scraper_file)
+        new_count = scraper.save_jobs(scraper_file, pipeline)
 
         # Save aggregated
         all_jobs = [job.to_dict() for job in scraper.jobs]
-        save_aggregated_jobs(all_jobs)
+        pipeline.save_aggregated(all_jobs)
+        BaseScraper.http_cache.save()  # Validators only once their listings are stored
 
         print(f"\n{'='*50}")
         print(f"Quick scraping completed at {datetime.now()}")
@@ -63,33 +68,5 @@ def main():
         traceback.print_exc()
 
 
-def save_aggregated_jobs(new_jobs):
-    """Save all jobs to a single aggregated file"""
-    filepath = "data/jobs_all.json"
-
-    # Load existing jobs
-    try:
-        with open(filepath, 'r') as f:
-            existing_jobs = json.load(f)
-    except FileNotFoundError:
-        existing_jobs = []
-
-    # Merge jobs (avoid duplicates by ID)
-    existing_ids = {job['id'] for job in existing_jobs}
-    unique_new_jobs = [job for job in new_jobs if job['id'] not in existing_ids]
-
-    all_jobs = existing_jobs + unique_new_jobs
-
-    # Sort by scraped date (most recent first)
-    all_jobs.sort(key=lambda x: x['scraped_date'], reverse=True)
-
-    # Save to file
-    with open(filepath, 'w') as f:
-        json.dump(all_jobs, f, indent=2)
-
-    print(f"\nSaved aggregated jobs to {filepath}")
-    print(f"Total jobs in database: {len(all_jobs)}")
-
-
 if __name__ == "__main__":
     main()
@@ -0,0 +1,68 @@
+"""
+asyncio fetch engine for sweeping many pages at once
+Requests to different hosts run in parallel; requests to the same host are
+paced by the shared per-host rate limiter instead of a global sleep.
+"""
+
+import asyncio
+from collections import namedtuple
+from typing import Dict, List, Optional, Tuple
+from .rate_limiter import RateLimiter
+
+try:
+    import aiohttp
+except ImportError:  # Optional dependency - callers fall back to sequential fetching
+    aiohttp = None
+
+
+# Result of one fetch: status_code is None when the request itself failed
+FetchedPage = namedtuple("FetchedPage", ["status_code", "content", "error"])
+
+
+def is_available() -> bool:
+    """Whether the async engine can be used (aiohttp is installed)"""
+    return aiohttp is not None
+
+
+async def _fetch_one(session, limiter: RateLimiter, url: str, params: Dict, retries: int) -> FetchedPage:
+    for attempt in range(retries + 1):
+        # Reserving is non-blocking; the wait happens here without holding up other hosts
+        await asyncio.sleep(limiter.reserve(url))
+
+        try:
+            async with session.get(url, params=params) as response:
+                content = await response.read()
+                page = FetchedPage(response.status, content, None)
+                backoff = limiter.record(url, response.status, response.headers)
+        except Exception as e:
+            return FetchedPage(None, b"", e)
+
+        if backoff is None or attempt == retries:
+            return page
+
+
+async def _fetch_all(requests: List[Tuple[str, str, Dict]], headers: Dict, timeout: float,
+                     limiter: RateLimiter, limit_per_host: int, retries: int) -> Dict[str, FetchedPage]:
+    connector = aiohttp.TCPConnector(limit_per_host=limit_per_host)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+    async with aiohttp.ClientSession(headers=headers, connector=connector,
+                                     timeout=client_timeout) as session:
+        pages = await asyncio.gather(*[
+            _fetch_one(session, limiter, url, params, retries) for _, url, params in requests
+        ])
+
+    return {key: page for (key, _, _), page in zip(requests, pages)}
+
+
+def fetch_all(requests: List[Tuple[str, str, Dict]], limiter: RateLimiter, headers: Optional[Dict] = None,
+              timeout: float = 15, limit_per_host: int = 1, retries: int = 2) -> Dict[str, FetchedPage]:
+    """
+    Fetch every (key, url, params) request concurrently, paced by `limiter`
+    (429/503 answers are retried up to `retries` times after the host's backoff)
+    Returns a dict mapping each key to its FetchedPage
+    """
+    if aiohttp is None:
+        raise RuntimeError("aiohttp is not installed")
+
+    return asyncio.run(_fetch_all(requests, headers or {}, timeout, limiter, limit_per_host, retries))
@@ -3,28 +3,96 @@ Base scraper class that all job board scrapers inherit from
 """
 
 import hashlib
-import json
+import sys
+import threading
+import time
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Tuple
+from urllib.parse import urlsplit
+import requests
+from storage import open_store, PersistencePipeline
+from config import (
+    MAX_REQUESTS_PER_HOST, HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_HEADERS,
+    HTTP_CACHE_FILE, RATE_LIMIT_DEFAULT, RATE_LIMITS, RATE_LIMIT_MAX_BACKOFF, RATE_LIMIT_RETRIES,
+    SOURCE_HEALTH_FILE, HEALTH_FAILURE_THRESHOLD, HEALTH_EMPTY_THRESHOLD,
+    HEALTH_BASE_BACKOFF_HOURS, HEALTH_MAX_BACKOFF_HOURS,
+    WATERMARKS_FILE, WATERMARK_OVERLAP_HOURS, QUERY_PLANS, SCRAPE_INTERVAL_HOURS,
+    INTERNSHIP_KEYWORDS, ROLE_KEYWORDS
+)
+from .host_limiter import HostLimiter
+from .rate_limiter import RateLimiter
+from .source_health import HealthTracker, is_blocked_page
+from .http_cache import HttpCache
+from .watermarks import Watermarks
+from .query_planner import SearchQuery, plan_queries
+from .keyword_matcher import contains_any, matcher_for
+from .http_session import build_session, connection_stats
+from .url_canonical import canonicalize_url
+from .html_parsing import CardSelector, find_cards
+
+
+def _intern(value):
+    """Intern strings that repeat across many jobs (source, company, location)"""
+    return sys.intern(value) if type(value) is str else value
 
 
 class Job:
     """Represents a job posting"""
 
+    __slots__ = ("title", "company", "location", "_raw_url", "_url", "description",
+                 "posted_date", "scraped_date", "source", "_id")
+
+    # One timestamp per run, shared by every job created during it
+    _run_posted_date: Optional[str] = None
+    _run_scraped_date: Optional[str] = None
+
     def __init__(self, title: str, company: str, location: str, url: str,
                  description: str = "", posted_date: str = "", source: str = ""):
+        if Job._run_scraped_date is None:
+            Job.start_run()
+
         self.title = title
-        self.company = company
-        self.location = location
-        self.url = url
+        self.company = _intern(company)
+        self.location = _intern(location)
         self.description = description
-        self.posted_date = posted_date or datetime.now().strftime("%Y-%m-%d")
-        self.source = source
-        self.scraped_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.id = self._generate_id()
+        self.posted_date = posted_date or Job._run_posted_date
+        self.source = _intern(source)
+        self.scraped_date = Job._run_scraped_date
+        self.url = url
+        self._id = None
+
+    @classmethod
+    def start_run(cls, timestamp: Optional[datetime] = None):
+        """Capture the timestamp used as scraped_date for every job in this run"""
+        timestamp = timestamp or datetime.now()
+        cls._run_posted_date = timestamp.strftime("%Y-%m-%d")
+        cls._run_scraped_date = timestamp.strftime("%Y-%m-%d %H:%M:%S")
+
+    @property
+    def url(self) -> str:
+        """Canonical URL, computed on first use so cards dropped by filtering never parse theirs"""
+        if self._url is None:
+            self._url = canonicalize_url(self._raw_url, self.source)
+        return self._url
+
+    @url.setter
+    def url(self, value: str):
+        self._raw_url = value
+        self._url = None
+
+    @property
+    def id(self) -> str:
+        """Unique ID, computed on first use"""
+        if self._id is None:
+            self._id = self._generate_id()
+        return self._id
+
+    @id.setter
+    def id(self, value: str):
+        self._id = value
 
     def _generate_id(self) -> str:
-        """Generate unique ID based on job details"""
+        """Generate unique ID based on job details (and the canonical URL)"""
         unique_string = f"{self.title}{self.company}{self.url}"
         return hashlib.md5(unique_string.encode()).hexdigest()
 
@@ -49,10 +117,131 @@ class Job:
 class BaseScraper:
     """Base class for all job scrapers"""
 
+    # Shared by every scraper so concurrent sources stay polite per host
+    host_limiter = HostLimiter(MAX_REQUESTS_PER_HOST)
+    rate_limiter = RateLimiter(RATE_LIMIT_DEFAULT, RATE_LIMITS, RATE_LIMIT_MAX_BACKOFF)
+
+    # Pooled keep-alive session shared by every scraper (created on first use)
+    _session: Optional[requests.Session] = None
+    _session_lock = threading.Lock()
+
+    # ETag/Last-Modified validators for stable URLs, persisted under data/
+    http_cache = HttpCache(HTTP_CACHE_FILE)
+
+    # Health records behind the circuit breaker, saved by the runner
+    health = HealthTracker(SOURCE_HEALTH_FILE, HEALTH_FAILURE_THRESHOLD,
+                           HEALTH_BASE_BACKOFF_HOURS, HEALTH_MAX_BACKOFF_HOURS,
+                           empty_threshold=HEALTH_EMPTY_THRESHOLD)
+
+    # Last successful crawl per (source, keyword), for narrowing date-window parameters
+    watermarks = Watermarks(WATERMARKS_FILE, WATERMARK_OVERLAP_HOURS)
+
+    # Job card elements on the source's result pages (tried in order)
+    card_selectors: Tuple[CardSelector, ...] = ()
+
     def __init__(self, name: str):
         self.name = name
         self.jobs: List[Job] = []
 
+        # Ids already stored for this source; incremental crawls stop when they reach them
+        self.known_ids: Set[str] = set()
+
+        # What this run produced and what fetch() saw, for the source's health record
+        self.scraped_count = 0
+        self.http_statuses: List[int] = []
+        self.blocked_pages = 0
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        """Get the shared HTTP session, creating it on first use"""
+        with BaseScraper._session_lock:
+            if BaseScraper._session is None:
+                BaseScraper._session = build_session(HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_HEADERS)
+            return BaseScraper._session
+
+    @classmethod
+    def connection_stats(cls) -> Dict[str, Dict[str, int]]:
+        """Per-host request/connection counts for the shared session"""
+        if BaseScraper._session is None:
+            return {}
+        return connection_stats(BaseScraper._session)
+
+    def fetch(self, url: str, conditional: bool = False, **kwargs) -> requests.Response:
+        """
+        GET a URL through the shared session, paced by its host's rate limit
+        and holding one of the host's request slots; 429/503 answers are
+        retried after the host's backoff
+        With conditional=True the request carries the cached validators for `url`,
+        so an unchanged resource comes back as a bodiless 304. Call
+        self.http_cache.remember(url, response) once a 200 has been processed;
+        the entry point saves the cache after the jobs are written.
+        """
+        if conditional:
+            kwargs["headers"] = {**self.http_cache.conditional_headers(url), **kwargs.get("headers", {})}
+
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            # Only waits if this host was hit recently (or asked us to back off)
+            self.rate_limiter.acquire(url)
+            with self.host_limiter.limit(url):
+                response = self.get_session().get(url, **kwargs)
+            self._note_response(response, streamed=kwargs.get("stream", False))
+
+            backoff = self.rate_limiter.record(url, response.status_code, response.headers)
+            if backoff is None or attempt == RATE_LIMIT_RETRIES:
+                return response
+
+            print(f"{urlsplit(url).hostname} answered {response.status_code}, retrying in {backoff:.0f}s")
+            response.close()
+
+    def _note_response(self, response: requests.Response, streamed: bool = False):
+        """Keep the status (and whether it was a block page) for the health record"""
+        self.http_statuses.append(response.status_code)
+        # A streamed body hasn't been read yet, so only its status can be checked
+        if is_blocked_page(response.status_code, b"" if streamed else response.content):
+            self.blocked_pages += 1
+
+    def plan_queries(self, keywords: List[str]) -> List[SearchQuery]:
+        """Search requests covering `keywords`, packed as this source allows (see QUERY_PLANS)"""
+        plan = QUERY_PLANS.get(self.name, {"max_queries": len(keywords)})
+        run = int(time.time() // (SCRAPE_INTERVAL_HOURS * 3600))  # Rotates keywords that don't fit this run
+        return plan_queries(keywords, rotation=run, **plan)
+
+    def window_hours(self, query: SearchQuery, max_hours: float) -> float:
+        """Posting window for a query: the widest any of its keywords' watermarks needs"""
+        return max(self.watermarks.window_hours(self.name, keyword, max_hours) for keyword in query.keywords)
+
+    def advance_watermarks(self, query: SearchQuery, jobs: List[Job]):
+        """Record a successful crawl of every keyword the query covers"""
+        for keyword, matched in query.assign(jobs).items():
+            self.watermarks.advance(self.name, keyword, [job.posted_date for job in matched])
+
+    def caught_up(self, page_jobs: List[Job]) -> bool:
+        """
+        Whether a result page only holds jobs we already have
+        Only jobs that pass the run's filters are ever stored (and so known),
+        so off-topic cards are left out of the comparison
+        """
+        relevant = self.filter_jobs(page_jobs, {"internship_keywords": INTERNSHIP_KEYWORDS,
+                                                "role_keywords": ROLE_KEYWORDS})
+        return bool(relevant) and all(job.id in self.known_ids for job in relevant)
+
+    def find_cards(self, content) -> List:
+        """Parse just the job cards out of a result page"""
+        return find_cards(content, *self.card_selectors)
+
+    def fetch_cards(self, url: str, **kwargs) -> List:
+        """
+        GET a result page and return its job cards
+        Error and block pages (LinkedIn's 999 authwall, captchas) raise
+        instead of passing for an empty page, so callers don't mistake
+        them for a finished crawl
+        """
+        response = self.fetch(url, **kwargs)
+        response.raise_for_status()
+        if response.status_code != 200 or is_blocked_page(response.status_code, response.content):
+            raise requests.HTTPError(f"Blocked or unexpected response ({response.status_code})", response=response)
+        return self.find_cards(response.content)
+
     def scrape(self, keywords: List[str], location: str = "United States") -> List[Job]:
         """
         Scrape jobs based on keywords and location
@@ -62,48 +251,36 @@ class BaseScraper:
 
     def filter_jobs(self, jobs: List[Job], filters: Dict) -> List[Job]:
         """Filter jobs based on criteria"""
+        matcher = matcher_for(tuple(filters.get("internship_keywords", [])),
+                              tuple(filters.get("role_keywords", [])))
+        internship_keywords = matcher.groups["internship"]
+        role_keywords = matcher.groups["role"]
         filtered = []
 
         for job in jobs:
-            # Check if job matches filters
-            title_lower = job.title.lower()
-            desc_lower = job.description.lower()
+            # Lowercase title and description once, then check both keyword groups
+            text = f"{job.title}\n{job.description}".lower()
 
-            # Check for internship keywords
-            is_internship = any(keyword in title_lower or keyword in desc_lower
-                              for keyword in filters.get("internship_keywords", []))
-
-            # Check for role keywords
-            has_role_keyword = any(keyword.lower() in title_lower or keyword.lower() in desc_lower
-                                  for keyword in filters.get("role_keywords", []))
-
-            if is_internship and has_role_keyword:
+            if contains_any(text, internship_keywords) and contains_any(text, role_keywords):
                 filtered.append(job)
 
         return filtered
 
-    def save_jobs(self, filepath: str):
-        """Save scraped jobs to JSON file"""
+    def save_jobs(self, filepath: str, pipeline: Optional[PersistencePipeline] = None):
+        """
+        Save scraped jobs to the store for a JSON file (see STORAGE_BACKEND)
+        With a pipeline the jobs are only staged; pipeline.flush() writes them
+        """
         jobs_dict = [job.to_dict() for job in self.jobs]
 
-        # Load existing jobs if file exists
-        try:
-            with open(filepath, 'r') as f:
-                existing_jobs = json.load(f)
-        except FileNotFoundError:
-            existing_jobs = []
-
-        # Merge jobs (avoid duplicates)
-        existing_ids = {job['id'] for job in existing_jobs}
-        new_jobs = [job for job in jobs_dict if job['id'] not in existing_ids]
-
-        all_jobs = existing_jobs + new_jobs
-
-        # Sort by scraped date (most recent first)
-        all_jobs.sort(key=lambda x: x['scraped_date'], reverse=True)
-
-        with open(filepath, 'w') as f:
-            json.dump(all_jobs, f, indent=2)
+        # Merge jobs (the store skips ids it already has)
+        if pipeline is not None:
+            new_count = pipeline.add(filepath, jobs_dict)
+            total = pipeline.count(filepath)
+        else:
+            store = open_store(filepath)
+            new_count = store.add(jobs_dict)
+            total = store.count()
 
-        print(f"Saved {len(new_jobs)} new jobs from {self.name} (total: {len(all_jobs)})")
-        return len(new_jobs)
+        print(f"Saved {new_count} new jobs from {self.name} (total: {total})")
+        return new_count
@@ -2,16 +2,16 @@
 Built In scraper - Tech job board for startups and companies
 """
 
-import requests
-from bs4 import BeautifulSoup
 from typing import List
-import time
-from .base_scraper import BaseScraper, Job
+from .base_scraper import BaseScraper, CardSelector, Job
+from .keyword_matcher import DEFAULT_MATCHER
 
 
 class BuiltInScraper(BaseScraper):
     """Scraper for Built In job boards"""
 
+    card_selectors = (CardSelector('div', 'job-item'),)
+
     def __init__(self):
         super().__init__("BuiltIn")
         self.base_urls = [
@@ -27,35 +27,29 @@ class BuiltInScraper(BaseScraper):
         """Scrape Built In for jobs"""
         self.jobs = []
 
-        # Search across different Built In locations
+        # The internship listing isn't searched by keyword; every keyword is
+        # covered by the relevance filter on titles instead
         for base_url in self.base_urls[:3]:  # Limit to 3 locations
             try:
-                jobs = self._scrape_builtin(base_url, keywords[0])
+                jobs = self._scrape_builtin(base_url)
                 self.jobs.extend(jobs)
-                time.sleep(2)
             except Exception as e:
                 print(f"Error scraping {base_url}: {e}")
 
         return self.jobs
 
-    def _scrape_builtin(self, base_url: str, keyword: str) -> List[Job]:
+    def _scrape_builtin(self, base_url: str) -> List[Job]:
         """Scrape Built In for a specific location"""
         jobs = []
 
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-
         try:
             # Built In job search URL
             search_url = f"{base_url}/jobs/internship"
 
-            response = requests.get(search_url, headers=headers, timeout=10)
+            response = self.fetch(search_url, timeout=10)
 
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-
-                job_cards = soup.find_all('div', class_='job-item')
+                job_cards = self.find_cards(response.content)
 
                 for card in job_cards[:20]:
                     try:
@@ -70,10 +64,7 @@ class BuiltInScraper(BaseScraper):
 
                         # Filter for EE/hardware roles
                         title_lower = title.lower()
-                        is_relevant = any(kw in title_lower for kw in [
-                            'hardware', 'electrical', 'circuit', 'chip', 'silicon',
-                            'semiconductor', 'vlsi', 'fpga', 'embedded', 'firmware'
-                        ])
+                        is_relevant = DEFAULT_MATCHER.matches_prepared(title_lower, "relevance_builtin")
 
                         if not is_relevant:
                             continue
@@ -4,17 +4,24 @@ This scraper searches job boards and discovers new companies posting EE/hardware
 then you can add them to the main company scraper.
 """
 
-import requests
-from bs4 import BeautifulSoup
 from typing import List, Set, Dict
 import json
-import time
-from .base_scraper import BaseScraper, Job
+from .base_scraper import BaseScraper, CardSelector, Job
+from .html_parsing import find_cards
+from .source_health import is_blocked_page
+from .watermarks import indeed_fromage, linkedin_time_range
 
 
 class CompanyDiscoveryScraper(BaseScraper):
     """Meta-scraper that discovers companies posting EE/hardware internships"""
 
+    # Company name elements on each directory/search page
+    LINKEDIN_COMPANIES = CardSelector('h4', 'base-search-card__subtitle')
+    INDEED_COMPANIES = CardSelector('span', attrs={'data-testid': 'company-name'})
+    BUILTIN_COMPANIES = CardSelector('a', 'company-title')
+    YC_COMPANIES = CardSelector('a', '_company_86jzd_338')
+    LINKS = CardSelector('a')
+
     def __init__(self):
         super().__init__("Company Discovery")
         self.discovered_companies: Set[str] = set()
@@ -42,25 +49,22 @@ class CompanyDiscoveryScraper(BaseScraper):
         """Discover companies from LinkedIn job postings"""
         print("Discovering companies from LinkedIn...")
 
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-
         try:
             # Search for hardware/semiconductor internships
             url = "https://www.linkedin.com/jobs/search"
+            query = 'hardware intern OR semiconductor intern OR circuit design intern'
+            hours = self.watermarks.window_hours(self.name, query, max_hours=30 * 24)
             params = {
-                'keywords': 'hardware intern OR semiconductor intern OR circuit design intern',
+                'keywords': query,
                 'location': 'United States',
                 'f_JT': 'I',  # Internship
-                'f_TPR': 'r2592000',  # Past month
+                'f_TPR': linkedin_time_range(hours),  # Since the last discovery run (at most a month)
             }
 
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self.fetch(url, params=params, timeout=10)
 
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                company_elements = soup.find_all('h4', class_='base-search-card__subtitle')
+                company_elements = find_cards(response.content, self.LINKEDIN_COMPANIES)
 
                 for elem in company_elements:
                     company_name = elem.text.strip()
@@ -68,34 +72,31 @@ class CompanyDiscoveryScraper(BaseScraper):
                         self.discovered_companies.add(company_name)
 
                 print(f"Found {len(company_elements)} companies on LinkedIn")
+                if company_elements and not is_blocked_page(response.status_code, response.content):
+                    self.watermarks.advance(self.name, query)  # An empty or block page keeps the window
 
         except Exception as e:
             print(f"Error discovering from LinkedIn: {e}")
 
-        time.sleep(2)
-
     def _discover_from_indeed(self, keywords: List[str]):
         """Discover companies from Indeed job postings"""
         print("Discovering companies from Indeed...")
 
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-
         try:
             url = "https://www.indeed.com/jobs"
+            query = 'hardware engineer intern OR semiconductor intern'
+            hours = self.watermarks.window_hours(self.name, query, max_hours=30 * 24)
             params = {
-                'q': 'hardware engineer intern OR semiconductor intern',
+                'q': query,
                 'l': 'United States',
                 'jt': 'internship',
-                'fromage': '30',  # Last 30 days
+                'fromage': indeed_fromage(hours),  # Since the last discovery run (at most 30 days)
             }
 
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self.fetch(url, params=params, timeout=10)
 
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                company_elements = soup.find_all('span', {'data-testid': 'company-name'})
+                company_elements = find_cards(response.content, self.INDEED_COMPANIES)
 
                 for elem in company_elements:
                     company_name = elem.text.strip()
@@ -103,20 +104,16 @@ class CompanyDiscoveryScraper(BaseScraper):
                         self.discovered_companies.add(company_name)
 
                 print(f"Found {len(company_elements)} companies on Indeed")
+                if company_elements and not is_blocked_page(response.status_code, response.content):
+                    self.watermarks.advance(self.name, query)  # An empty or block page keeps the window
 
         except Exception as e:
             print(f"Error discovering from Indeed: {e}")
 
-        time.sleep(2)
-
     def _discover_from_builtin(self):
         """Discover semiconductor/hardware startups from Built In"""
         print("Discovering companies from Built In...")
 
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-
         try:
             # Built In has curated lists of semiconductor/hardware companies
             urls = [
@@ -127,20 +124,17 @@ class CompanyDiscoveryScraper(BaseScraper):
 
             for url in urls:
                 try:
-                    response = requests.get(url, headers=headers, timeout=10)
+                    response = self.fetch(url, timeout=10)
 
                     if response.status_code == 200:
-                        soup = BeautifulSoup(response.content, 'html.parser')
                         # Built In company listings
-                        company_links = soup.find_all('a', class_='company-title')
+                        company_links = find_cards(response.content, self.BUILTIN_COMPANIES)
 
                         for link in company_links:
                             company_name = link.text.strip()
                             if company_name and len(company_name) < 100:
                                 self.discovered_companies.add(company_name)
 
-                    time.sleep(2)
-
                 except Exception as e:
                     print(f"Error with {url}: {e}")
                     continue
@@ -154,10 +148,6 @@ class CompanyDiscoveryScraper(BaseScraper):
         """Discover hardware/semiconductor startups from Y Combinator companies"""
         print("Discovering companies from Y Combinator...")
 
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-
         try:
             # YC companies directory
             url = "https://www.ycombinator.com/companies"
@@ -166,13 +156,11 @@ class CompanyDiscoveryScraper(BaseScraper):
                 'tags': 'semiconductors'
             }
 
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self.fetch(url, params=params, timeout=10)
 
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-
                 # YC company cards
-                company_cards = soup.find_all('a', class_='_company_86jzd_338')
+                company_cards = find_cards(response.content, self.YC_COMPANIES)
 
                 for card in company_cards:
                     company_name_elem = card.find('span', class_='_coName_86jzd_453')
@@ -240,22 +228,16 @@ class CompanyDiscoveryScraper(BaseScraper):
         Research a discovered company to get their careers page URL
         This can be called manually to research companies
         """
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-
         # Google search for careers page
         try:
             query = f"{company_name} careers internship hardware"
             search_url = f"https://www.google.com/search?q={query.replace(' ', '+')}"
 
-            response = requests.get(search_url, headers=headers, timeout=10)
+            response = self.fetch(search_url, timeout=10)
 
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-
                 # Try to find careers page link
-                links = soup.find_all('a')
+                links = find_cards(response.content, self.LINKS)
                 for link in links:
                     href = link.get('href', '')
                     if 'careers' in href.lower() or 'jobs' in href.lower():
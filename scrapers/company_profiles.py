@@ -0,0 +1,54 @@
+"""
+Learned selector profiles for company career pages
+Remembers which card/title/location selector worked for each company, so
+later runs try it first instead of walking the whole fallback cascade.
+"""
+
+import json
+import os
+import threading
+from typing import Dict, Optional
+
+
+class CompanyProfiles:
+    """Per-company selector keys (e.g. {"card": "li.job", "title": "h3"}) in a small JSON file"""
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self._profiles: Optional[Dict[str, Dict[str, str]]] = None
+        self._changed = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict[str, str]]:
+        if self._profiles is None:
+            try:
+                with open(self.filepath, 'r') as f:
+                    self._profiles = json.load(f)
+            except (FileNotFoundError, ValueError):
+                self._profiles = {}
+        return self._profiles
+
+    def get(self, company: str) -> Dict[str, str]:
+        """The company's known selector keys (empty if never learned)"""
+        with self._lock:
+            return dict(self._load().get(company, {}))
+
+    def learn(self, company: str, **keys: Optional[str]):
+        """Record the selector keys that just worked (None values are ignored)"""
+        with self._lock:
+            profile = self._load().setdefault(company, {})
+            for part, key in keys.items():
+                if key and profile.get(part) != key:
+                    profile[part] = key
+                    self._changed = True
+
+    def save(self):
+        """Write the profiles if anything was learned"""
+        with self._lock:
+            if not self._changed:
+                return
+
+            os.makedirs(os.path.dirname(self.filepath) or '.', exist_ok=True)
+            with open(self.filepath, 'w') as f:
+                json.dump(self._profiles, f, indent=2, sort_keys=True)
+            self._changed = False
@@ -3,16 +3,42 @@ Company-specific career page scraper
 Targets major semiconductor and hardware companies
 """
 
-import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict
-import time
-from .base_scraper import BaseScraper, Job
+from typing import List, Dict, Optional
+from config import MAX_REQUESTS_PER_HOST, HTTP_HEADERS, COMPANY_PROFILES_FILE, RATE_LIMIT_RETRIES
+from .base_scraper import BaseScraper, CardSelector, Job
+from .keyword_matcher import DEFAULT_MATCHER
+from .company_profiles import CompanyProfiles
+from .html_parsing import find_first, match_cards, prefer
+from .source_health import SKIP, PROBE, is_blocked_page
+from . import async_fetch
 
 
 class CompanyScraper(BaseScraper):
     """Scraper for company career pages"""
 
+    # Generic job card selectors, tried in order (adapt per company)
+    card_selectors = (
+        CardSelector('div', 'job-listing'),
+        CardSelector('div', 'job-card'),
+        CardSelector('li', 'job'),
+        CardSelector('tr', 'job-row'),
+        CardSelector('article'),
+    )
+    title_selectors = (
+        CardSelector('h2'),
+        CardSelector('h3'),
+        CardSelector('a', 'job-title'),
+        CardSelector('span', 'title'),
+    )
+    location_selectors = (
+        CardSelector('span', 'location'),
+        CardSelector('div', 'location'),
+        CardSelector('span', 'job-location'),
+    )
+
+    # Which of the selectors above worked for each company, persisted under data/
+    profiles = CompanyProfiles(COMPANY_PROFILES_FILE)
+
     def __init__(self):
         super().__init__("Company Careers")
 
@@ -128,107 +154,175 @@ class CompanyScraper(BaseScraper):
     def scrape(self, keywords: List[str], location: str = "United States") -> List[Job]:
         """Scrape company career pages"""
         self.jobs = []
+        companies = self._active_companies()
 
-        for company_name, company_info in self.companies.items():
+        if async_fetch.is_available():
+            self._scrape_concurrently(companies)
+            self.profiles.save()
+            return self.jobs
+
+        for company_name, company_info in companies.items():
             try:
                 print(f"Scraping {company_name}...")
                 jobs = self._scrape_company(company_name, company_info)
                 self.jobs.extend(jobs)
-                time.sleep(3)  # Be respectful with rate limiting
             except Exception as e:
                 print(f"Error scraping {company_name}: {e}")
 
+        self.profiles.save()
+        return self.jobs
+
+    def _active_companies(self) -> Dict[str, Dict]:
+        """Companies whose circuit is closed or due for a probe"""
+        companies = {}
+
+        for company_name, company_info in self.companies.items():
+            state = self.health.check(company_name, kind="companies")
+            if state == SKIP:
+                print(f"Skipping {company_name} (failing or empty in recent runs)")
+                continue
+            if state == PROBE:
+                print(f"Probing {company_name} after repeated failed or empty runs")
+            companies[company_name] = company_info
+
+        return companies
+
+    def _record_company(self, company_name: str, status_code: Optional[int], content: bytes = b"",
+                        cards: int = 0, error: Optional[Exception] = None):
+        """Update the company's health record with one page fetch"""
+        blocked = int(status_code is not None and is_blocked_page(status_code, content))
+        self.health.record(company_name, found=cards, statuses=[status_code] if status_code else [],
+                           blocked=blocked, error=error, kind="companies")
+
+    def _scrape_concurrently(self, companies: Dict[str, Dict]) -> List[Job]:
+        """Fetch every career page at once, only delaying repeat hits to the same host"""
+        print(f"Fetching {len(companies)} career pages concurrently...")
+
+        pages = async_fetch.fetch_all(
+            [(name, info["url"], info.get("search_params", {})) for name, info in companies.items()],
+            limiter=self.rate_limiter,
+            headers=HTTP_HEADERS,
+            timeout=15,
+            limit_per_host=MAX_REQUESTS_PER_HOST,
+            retries=RATE_LIMIT_RETRIES
+        )
+
+        for company_name, company_info in companies.items():
+            page = pages[company_name]
+
+            if page.error is not None:
+                print(f"Error fetching {company_name} jobs: {page.error}")
+                self._record_company(company_name, None, error=page.error)
+                continue
+
+            # fetch() isn't involved here, so note the source-level stats directly
+            self.http_statuses.append(page.status_code)
+            self.blocked_pages += int(is_blocked_page(page.status_code, page.content))
+
+            if page.status_code != 200:
+                self._record_company(company_name, page.status_code, page.content)
+            else:
+                try:
+                    jobs = self._parse_company_page(company_name, company_info["url"], page.content)
+                    print(f"Scraped {company_name}: {len(jobs)} jobs")
+                    self.jobs.extend(jobs)
+                except Exception as e:
+                    print(f"Error scraping {company_name}: {e}")
+
         return self.jobs
 
     def _scrape_company(self, company_name: str, company_info: Dict) -> List[Job]:
         """Scrape a specific company's career page"""
         jobs = []
 
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-
         try:
             url = company_info["url"]
 
-            response = requests.get(url, headers=headers, params=company_info.get("search_params", {}), timeout=15)
+            response = self.fetch(url, params=company_info.get("search_params", {}), timeout=15)
 
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-
-                # Generic job card selectors (adapt per company)
-                job_cards = (
-                    soup.find_all('div', class_='job-listing') or
-                    soup.find_all('div', class_='job-card') or
-                    soup.find_all('li', class_='job') or
-                    soup.find_all('tr', class_='job-row') or
-                    soup.find_all('article')
-                )
-
-                for card in job_cards[:20]:  # Limit to 20 per company
-                    try:
-                        # Try to extract title
-                        title_elem = (
-                            card.find('h2') or
-                            card.find('h3') or
-                            card.find('a', class_='job-title') or
-                            card.find('span', class_='title')
-                        )
-
-                        if not title_elem:
-                            continue
-
-                        title = title_elem.text.strip()
-
-                        # Filter for internships and relevant roles
-                        title_lower = title.lower()
-                        if 'intern' not in title_lower:
-                            continue
-
-                        is_relevant = any(kw in title_lower for kw in [
-                            'hardware', 'electrical', 'circuit', 'analog', 'digital',
-                            'semiconductor', 'vlsi', 'asic', 'fpga', 'chip', 'silicon',
-                            'embedded', 'firmware', 'pcb', 'rf', 'mixed-signal'
-                        ])
-
-                        if not is_relevant:
-                            continue
-
-                        # Extract URL
-                        link_elem = card.find('a')
-                        job_url = link_elem.get('href', '') if link_elem else ""
-                        if job_url and not job_url.startswith('http'):
-                            # Convert relative URL to absolute
-                            base = url.split('/search')[0] if '/search' in url else url
-                            job_url = base + job_url
-
-                        # Extract location
-                        location_elem = (
-                            card.find('span', class_='location') or
-                            card.find('div', class_='location') or
-                            card.find('span', class_='job-location')
-                        )
-                        job_location = location_elem.text.strip() if location_elem else "United States"
-
-                        # Extract description if available
-                        desc_elem = card.find('p', class_='description')
-                        description = desc_elem.text.strip() if desc_elem else ""
-
-                        job = Job(
-                            title=title,
-                            company=company_name,
-                            location=job_location,
-                            url=job_url,
-                            description=description,
-                            source=f"{company_name} Careers"
-                        )
-
-                        jobs.append(job)
-
-                    except Exception as e:
-                        continue
+                jobs = self._parse_company_page(company_name, url, response.content)
+            else:
+                self._record_company(company_name, response.status_code, response.content)
 
         except Exception as e:
             print(f"Error fetching {company_name} jobs: {e}")
+            self._record_company(company_name, None, error=e)
+
+        return jobs
+
+    def _parse_company_page(self, company_name: str, url: str, content: bytes) -> List[Job]:
+        """Extract internship cards from a company's career page"""
+        jobs = []
+        profile = self.profiles.get(company_name)
+
+        # The card selector that worked last time only needs a strained parse;
+        # the full cascade runs only when it stops yielding cards
+        card_selector, job_cards = None, []
+        known = [selector for selector in self.card_selectors if selector.key == profile.get("card")]
+        if known:
+            card_selector, job_cards = match_cards(content, known[0])
+        if not job_cards:
+            card_selector, job_cards = match_cards(content, *self.card_selectors)
+
+        title_selectors = prefer(self.title_selectors, profile.get("title"))
+        location_selectors = prefer(self.location_selectors, profile.get("location"))
+        title_key = location_key = None
+
+        for card in job_cards[:20]:  # Limit to 20 per company
+            try:
+                # Try to extract title
+                title_selector, title_elem = find_first(card, title_selectors)
+
+                if not title_elem:
+                    continue
+                title_key = title_key or title_selector.key
+
+                title = title_elem.text.strip()
+
+                # Filter for internships and relevant roles
+                title_lower = title.lower()
+                if 'intern' not in title_lower:
+                    continue
+
+                is_relevant = DEFAULT_MATCHER.matches_prepared(title_lower, "relevance_company")
+
+                if not is_relevant:
+                    continue
+
+                # Extract URL
+                link_elem = card.find('a')
+                job_url = link_elem.get('href', '') if link_elem else ""
+                if job_url and not job_url.startswith('http'):
+                    # Convert relative URL to absolute
+                    base = url.split('/search')[0] if '/search' in url else url
+                    job_url = base + job_url
+
+                # Extract location
+                location_selector, location_elem = find_first(card, location_selectors)
+                if location_selector:
+                    location_key = location_key or location_selector.key
+                job_location = location_elem.text.strip() if location_elem else "United States"
+
+                # Extract description if available
+                desc_elem = card.find('p', class_='description')
+                description = desc_elem.text.strip() if desc_elem else ""
+
+                job = Job(
+                    title=title,
+                    company=company_name,
+                    location=job_location,
+                    url=job_url,
+                    description=description,
+                    source=f"{company_name} Careers"
+                )
+
+                jobs.append(job)
+
+            except Exception as e:
+                continue
 
+        self.profiles.learn(company_name, card=card_selector and card_selector.key,
+                            title=title_key, location=location_key)
+        self._record_company(company_name, 200, content, cards=len(job_cards))
         return jobs
@@ -2,16 +2,15 @@
 Glassdoor job scraper
 """
 
-import requests
-from bs4 import BeautifulSoup
 from typing import List
-import time
-from .base_scraper import BaseScraper, Job
+from .base_scraper import BaseScraper, CardSelector, Job
 
 
 class GlassdoorScraper(BaseScraper):
     """Scraper for Glassdoor"""
 
+    card_selectors = (CardSelector('li', 'react-job-listing'),)
+
     def __init__(self):
         super().__init__("Glassdoor")
         self.base_url = "https://www.glassdoor.com"
@@ -20,13 +19,13 @@ class GlassdoorScraper(BaseScraper):
         """Scrape Glassdoor for jobs"""
         self.jobs = []
 
-        for keyword in keywords[:3]:  # Limit keywords
+        # One keyword per request; runs rotate through the rest (see QUERY_PLANS)
+        for query in self.plan_queries(keywords):
             try:
-                jobs = self._scrape_keyword(keyword, location)
+                jobs = self._scrape_keyword(query.text, location)
                 self.jobs.extend(jobs)
-                time.sleep(3)  # Be respectful
             except Exception as e:
-                print(f"Error scraping Glassdoor for '{keyword}': {e}")
+                print(f"Error scraping Glassdoor for '{query.text}': {e}")
 
         return self.jobs
 
@@ -35,7 +34,6 @@ class GlassdoorScraper(BaseScraper):
         jobs = []
 
         headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
         }
@@ -51,13 +49,11 @@ class GlassdoorScraper(BaseScraper):
             }
 
             url = f"{self.base_url}/Job/jobs.htm"
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self.fetch(url, headers=headers, params=params, timeout=10)
 
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-
                 # Glassdoor job cards
-                job_cards = soup.find_all('li', class_='react-job-listing')
+                job_cards = self.find_cards(response.content)
 
                 for card in job_cards[:30]:
                     try:
@@ -3,16 +3,15 @@ Handshake scraper - Popular for college recruiting
 Note: Handshake requires login, so this scraper uses their public job board
 """
 
-import requests
-from bs4 import BeautifulSoup
 from typing import List
-import time
-from .base_scraper import BaseScraper, Job
+from .base_scraper import BaseScraper, CardSelector, Job
 
 
 class HandshakeScraper(BaseScraper):
     """Scraper for Handshake public job board"""
 
+    card_selectors = (CardSelector('div', 'job-card'),)
+
     def __init__(self):
         super().__init__("Handshake")
         self.base_url = "https://joinhandshake.com"
@@ -21,13 +20,13 @@ class HandshakeScraper(BaseScraper):
         """Scrape Handshake for jobs"""
         self.jobs = []
 
-        for keyword in keywords[:3]:  # Limit keywords
+        # One keyword per request; runs rotate through the rest (see QUERY_PLANS)
+        for query in self.plan_queries(keywords):
             try:
-                jobs = self._scrape_keyword(keyword, location)
+                jobs = self._scrape_keyword(query.text, location)
                 self.jobs.extend(jobs)
-                time.sleep(2)
             except Exception as e:
-                print(f"Error scraping Handshake for '{keyword}': {e}")
+                print(f"Error scraping Handshake for '{query.text}': {e}")
 
         return self.jobs
 
@@ -35,10 +34,6 @@ class HandshakeScraper(BaseScraper):
         """Scrape jobs for a specific keyword"""
         jobs = []
 
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-
         try:
             # Handshake public job search
             params = {
@@ -48,13 +43,11 @@ class HandshakeScraper(BaseScraper):
             }
 
             url = f"{self.base_url}/jobs"
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self.fetch(url, params=params, timeout=10)
 
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-
                 # Note: Handshake structure may vary, this is a basic implementation
-                job_cards = soup.find_all('div', class_='job-card')
+                job_cards = self.find_cards(response.content)
 
                 for card in job_cards[:30]:
                     try:
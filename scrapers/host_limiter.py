@@ -0,0 +1,37 @@
+"""
+Per-host concurrency limits shared by all scrapers
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Dict
+from urllib.parse import urlsplit
+
+
+class HostLimiter:
+    """Caps the number of in-flight requests to each hostname"""
+
+    def __init__(self, max_per_host: int = 1):
+        self.max_per_host = max_per_host
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        """Get (or create) the semaphore guarding a host"""
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.max_per_host)
+                self._semaphores[host] = semaphore
+            return semaphore
+
+    @contextmanager
+    def limit(self, url: str):
+        """Hold one of the host's request slots while the block runs"""
+        host = urlsplit(url).hostname or ""
+        semaphore = self._semaphore(host)
+        semaphore.acquire()
+        try:
+            yield
+        finally:
+            semaphore.release()
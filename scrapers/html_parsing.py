@@ -0,0 +1,95 @@
+"""
+HTML parsing restricted to the job cards a scraper reads
+
+Scrapers only look at a handful of card elements, so building the tree
+for the whole page (scripts, navigation, filters, footer) is wasted work.
+Each scraper declares its card selector once, and find_cards() parses the
+page with a SoupStrainer so only those subtrees are built. lxml is used
+when installed, html.parser otherwise.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import Tag
+
+try:
+    import lxml  # noqa: F401
+    PARSER = "lxml"
+except ImportError:
+    PARSER = "html.parser"
+
+
+class CardSelector:
+    """A card element: tag name, optional CSS class and other exact attributes"""
+
+    __slots__ = ("tag", "attrs", "key")
+
+    def __init__(self, tag: str, class_: Optional[str] = None, attrs: Optional[Dict[str, str]] = None):
+        self.tag = tag
+        self.attrs = dict(attrs or {})
+
+        # Stable CSS-like name, e.g. "li.job" or "span[data-testid=company-name]"
+        self.key = tag + (f".{class_}" if class_ else "") + "".join(
+            f"[{name}={value}]" for name, value in sorted(self.attrs.items()))
+
+        if class_:
+            # Matches one class among several; a plain string only matches the
+            # whole class attribute while the strainer is filtering
+            self.attrs["class"] = re.compile(rf"(?:^|\s){re.escape(class_)}(?:\s|$)")
+
+    def strainer(self) -> SoupStrainer:
+        return SoupStrainer(self.tag, attrs=self.attrs)
+
+    def find_all(self, soup: BeautifulSoup) -> List[Tag]:
+        return soup.find_all(self.tag, attrs=self.attrs)
+
+    def find(self, element: Tag) -> Optional[Tag]:
+        return element.find(self.tag, attrs=self.attrs)
+
+    def __repr__(self):
+        return f"CardSelector({self.key!r})"
+
+
+def prefer(selectors: Tuple[CardSelector, ...], key: Optional[str]) -> Tuple[CardSelector, ...]:
+    """The selectors with the one named `key` (if any) moved to the front"""
+    preferred = tuple(selector for selector in selectors if selector.key == key)
+    return preferred + tuple(selector for selector in selectors if selector.key != key)
+
+
+def find_first(element: Tag, selectors: Tuple[CardSelector, ...]) -> Tuple[Optional[CardSelector], Optional[Tag]]:
+    """The first selector with a match inside `element`, and that match"""
+    for selector in selectors:
+        found = selector.find(element)
+        if found:
+            return selector, found
+    return None, None
+
+
+def find_cards(content, *selectors: CardSelector, parser: Optional[str] = None) -> List[Tag]:
+    """
+    Card elements of a page, in document order
+    With several selectors they are tried in order and the first that
+    matches wins; that fallback needs the whole tree, so it is parsed in
+    full once instead of once per selector.
+    """
+    return match_cards(content, *selectors, parser=parser)[1]
+
+
+def match_cards(content, *selectors: CardSelector,
+                parser: Optional[str] = None) -> Tuple[Optional[CardSelector], List[Tag]]:
+    """Like find_cards(), but also returns the selector that matched (None if none did)"""
+    parser = parser or PARSER
+
+    if len(selectors) == 1:
+        selector = selectors[0]
+        soup = BeautifulSoup(content, parser, parse_only=selector.strainer())
+        cards = selector.find_all(soup)
+        return (selector if cards else None), cards
+
+    soup = BeautifulSoup(content, parser)
+    for selector in selectors:
+        cards = selector.find_all(soup)
+        if cards:
+            return selector, cards
+    return None, []
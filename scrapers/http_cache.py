@@ -0,0 +1,75 @@
+"""
+Persistent conditional-GET cache
+Remembers the ETag / Last-Modified validators of stable URLs so later runs
+can send If-None-Match / If-Modified-Since and skip unchanged downloads.
+Validators are staged in memory and saved only after the run's jobs are
+written, so listings lost before that are downloaded again next time.
+"""
+
+import json
+import os
+import threading
+from typing import Dict, Optional
+import requests
+
+
+class HttpCache:
+    """Stores HTTP validators per URL in a small JSON file"""
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self._entries: Optional[Dict[str, Dict[str, str]]] = None
+        self._pending: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict[str, str]]:
+        if self._entries is None:
+            try:
+                with open(self.filepath, 'r') as f:
+                    self._entries = json.load(f)
+            except (FileNotFoundError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Headers that make a request for `url` conditional (empty if never seen)"""
+        with self._lock:
+            entry = self._load().get(url, {})
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def remember(self, url: str, response: requests.Response):
+        """
+        Stage the validators of a successfully processed 200 response
+        They are only written by save(), which runs once the jobs parsed from
+        the body are stored, so a run that fails before that is retried
+        """
+        if response.status_code != 200:
+            return
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        with self._lock:
+            self._pending[url] = {"etag": etag or "", "last_modified": last_modified or ""}
+
+    def save(self):
+        """Write the validators staged since the last save"""
+        with self._lock:
+            if not self._pending:
+                return
+
+            entries = self._load()
+            entries.update(self._pending)
+            self._pending = {}
+
+            os.makedirs(os.path.dirname(self.filepath) or '.', exist_ok=True)
+            with open(self.filepath, 'w') as f:
+                json.dump(entries, f, indent=2)
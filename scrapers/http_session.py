@@ -0,0 +1,47 @@
+"""
+Shared, pooled HTTP session used by every scraper
+Keeps connections alive between requests so repeat hits to the same host
+(e.g. one request per keyword on linkedin.com) reuse the TLS connection.
+"""
+
+from typing import Dict
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def build_session(pool_connections: int, pool_maxsize: int, headers: Dict[str, str]) -> requests.Session:
+    """
+    Create a session with per-host connection pools
+    pool_connections: number of hosts whose pools are kept around
+    pool_maxsize: connections kept alive per host
+    """
+    session = requests.Session()
+    session.headers.update(headers)
+
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
+def connection_stats(session: requests.Session) -> Dict[str, Dict[str, int]]:
+    """
+    Per-host request and connection counts for a session built by build_session
+    `reused` is the number of requests that skipped a new TCP/TLS handshake
+    """
+    stats = {}
+    adapter = session.get_adapter("https://")
+    pools = adapter.poolmanager.pools
+
+    for key in list(pools.keys()):
+        pool = pools.get(key)
+        if pool is None:
+            continue
+
+        host = stats.setdefault(key.key_host, {"requests": 0, "connections": 0, "reused": 0})
+        host["requests"] += pool.num_requests
+        host["connections"] += pool.num_connections
+        host["reused"] += max(pool.num_requests - pool.num_connections, 0)
+
+    return stats
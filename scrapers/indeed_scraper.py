@@ -3,16 +3,19 @@ Indeed job scraper
 Uses Indeed's RSS feeds and web scraping
 """
 
-import requests
-from bs4 import BeautifulSoup
-from typing import List
-import time
-from .base_scraper import BaseScraper, Job
+from math import ceil
+from typing import List, Optional
+from config import INDEED_CARDS_PER_KEYWORD, INDEED_PAGE_SIZE
+from .base_scraper import BaseScraper, CardSelector, Job
+from .query_planner import SearchQuery
+from .watermarks import indeed_fromage
 
 
 class IndeedScraper(BaseScraper):
     """Scraper for Indeed.com"""
 
+    card_selectors = (CardSelector('div', 'job_seen_beacon'),)
+
     def __init__(self):
         super().__init__("Indeed")
         self.base_url = "https://www.indeed.com"
@@ -21,85 +24,106 @@ class IndeedScraper(BaseScraper):
         """Scrape Indeed for jobs"""
         self.jobs = []
 
-        for keyword in keywords:
+        # Keywords are packed into a few OR queries (see QUERY_PLANS)
+        for query in self.plan_queries(keywords):
             try:
-                jobs = self._scrape_keyword(keyword, location)
+                jobs = self._scrape_query(query, location)
                 self.jobs.extend(jobs)
-                time.sleep(2)  # Be respectful with rate limiting
             except Exception as e:
-                print(f"Error scraping Indeed for '{keyword}': {e}")
+                print(f"Error scraping Indeed for '{query.text}': {e}")
 
         return self.jobs
 
-    def _scrape_keyword(self, keyword: str, location: str) -> List[Job]:
-        """Scrape jobs for a specific keyword"""
+    def _scrape_query(self, query: SearchQuery, location: str) -> List[Job]:
+        """
+        Scrape result pages for a query until we reach jobs we already have
+        A packed OR query reads up to INDEED_CARDS_PER_KEYWORD cards for each
+        keyword it covers, so packing doesn't shrink any keyword's share
+        """
         jobs = []
-
-        # Build search URL
-        params = {
-            'q': keyword,
-            'l': location,
-            'jt': 'internship',  # Job type: internship
-            'fromage': '7',  # Posted within last 7 days
-        }
-
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+        seen = set()
+        budget = INDEED_CARDS_PER_KEYWORD * len(query.keywords)
+        fromage = indeed_fromage(self.window_hours(query, max_hours=7 * 24))
+        read = 0
 
         try:
-            # Construct URL
-            query_string = '&'.join([f"{k}={v.replace(' ', '+')}" for k, v in params.items()])
-            url = f"{self.base_url}/jobs?{query_string}"
+            for page in range(ceil(budget / INDEED_PAGE_SIZE)):
+                job_cards = self._fetch_page(query.text, location, page, fromage)
+                if not job_cards and page == 0:
+                    break  # Possibly a block/interstitial page - keep the current window
+
+                page_jobs = [job for job in (self._parse_card(card, location) for card in job_cards[:budget - read]) if job]
+                read += len(job_cards)
+
+                for job in page_jobs:
+                    if job.id not in seen:  # Results can shift between pages while we crawl
+                        seen.add(job.id)
+                        jobs.append(job)
+
+                # A short page is the last one; a page of known jobs means we've caught up
+                caught_up = len(job_cards) < INDEED_PAGE_SIZE or self.caught_up(page_jobs)
+                if caught_up and read <= budget:
+                    # Only a crawl that read everything new may narrow the next run's window
+                    self.advance_watermarks(query, jobs)
+                if caught_up or read >= budget:
+                    break
 
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
+        except Exception as e:
+            print(f"Error fetching Indeed jobs for '{query.text}': {e}")
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+        return jobs
 
-            # Find job cards
-            job_cards = soup.find_all('div', class_='job_seen_beacon')
+    def _fetch_page(self, query: str, location: str, page: int, fromage: str = '7') -> List:
+        """Fetch one page of search results and return its job cards"""
+        params = {
+            'q': query,
+            'l': location,
+            'jt': 'internship',  # Job type: internship
+            'fromage': fromage,  # Posted since the last successful crawl (at most 7 days)
+            'start': str(page * INDEED_PAGE_SIZE),
+        }
 
-            for card in job_cards[:50]:  # Limit to 50 per keyword
-                try:
-                    # Extract job details
-                    title_elem = card.find('h2', class_='jobTitle')
-                    if not title_elem:
-                        continue
+        # Construct URL
+        query_string = '&'.join([f"{k}={v.replace(' ', '+')}" for k, v in params.items()])
+        url = f"{self.base_url}/jobs?{query_string}"
 
-                    title_link = title_elem.find('a')
-                    if not title_link:
-                        continue
+        # Find job cards
+        return self.fetch_cards(url, timeout=10)
 
-                    title = title_link.get('aria-label', '') or title_link.text.strip()
-                    job_url = self.base_url + title_link.get('href', '')
+    def _parse_card(self, card, location: str) -> Optional[Job]:
+        """Build a Job from one result card"""
+        try:
+            # Extract job details
+            title_elem = card.find('h2', class_='jobTitle')
+            if not title_elem:
+                return None
 
-                    company_elem = card.find('span', {'data-testid': 'company-name'})
-                    company = company_elem.text.strip() if company_elem else "Unknown"
+            title_link = title_elem.find('a')
+            if not title_link:
+                return None
 
-                    location_elem = card.find('div', {'data-testid': 'text-location'})
-                    job_location = location_elem.text.strip() if location_elem else location
+            title = title_link.get('aria-label', '') or title_link.text.strip()
+            job_url = self.base_url + title_link.get('href', '')
 
-                    # Get job description snippet
-                    desc_elem = card.find('div', class_='metadata')
-                    description = desc_elem.text.strip() if desc_elem else ""
+            company_elem = card.find('span', {'data-testid': 'company-name'})
+            company = company_elem.text.strip() if company_elem else "Unknown"
 
-                    job = Job(
-                        title=title,
-                        company=company,
-                        location=job_location,
-                        url=job_url,
-                        description=description,
-                        source="Indeed"
-                    )
+            location_elem = card.find('div', {'data-testid': 'text-location'})
+            job_location = location_elem.text.strip() if location_elem else location
 
-                    jobs.append(job)
+            # Get job description snippet
+            desc_elem = card.find('div', class_='metadata')
+            description = desc_elem.text.strip() if desc_elem else ""
 
-                except Exception as e:
-                    print(f"Error parsing job card: {e}")
-                    continue
+            return Job(
+                title=title,
+                company=company,
+                location=job_location,
+                url=job_url,
+                description=description,
+                source="Indeed"
+            )
 
         except Exception as e:
-            print(f"Error fetching Indeed jobs for '{keyword}': {e}")
-
-        return jobs
+            print(f"Error parsing job card: {e}")
+            return None
@@ -0,0 +1,78 @@
+"""
+Incremental parser for large top-level JSON arrays
+Decodes one array item at a time as chunks arrive, so memory stays bounded
+by the largest single item instead of the whole document.
+"""
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+def iter_json_array(chunks: Iterable[bytes], encoding: str = "utf-8") -> Iterator[Any]:
+    """Yield the items of a JSON array from an iterable of byte chunks"""
+    text_decoder = codecs.getincrementaldecoder(encoding)()
+    chunk_iter = iter(chunks)
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def read_more() -> bool:
+        """Append the next chunk to the buffer, returning False at end of input"""
+        nonlocal buffer, pos, eof
+        for chunk in chunk_iter:
+            if not chunk:
+                continue
+            # Drop everything already consumed before growing the buffer
+            buffer = buffer[pos:] + text_decoder.decode(chunk)
+            pos = 0
+            return True
+        buffer = buffer[pos:] + text_decoder.decode(b"", final=True)
+        pos = 0
+        eof = True
+        return False
+
+    def next_token() -> str:
+        """Skip whitespace and return the next character ('' at end of input)"""
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if eof or not read_more():
+                return ""
+
+    if next_token() != "[":
+        raise ValueError("Expected a JSON array")
+    pos += 1
+
+    if next_token() == "]":
+        return
+
+    while True:
+        try:
+            item, end = _decoder.raw_decode(buffer, pos)
+            # A value touching the end of the buffer may continue in the next chunk
+            if end == len(buffer) and not eof:
+                raise json.JSONDecodeError("Item may be incomplete", buffer, end)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            read_more()
+            continue
+
+        pos = end
+        yield item
+
+        token = next_token()
+        if token == ",":
+            pos += 1
+            next_token()
+        elif token == "]":
+            return
+        else:
+            raise ValueError(f"Unexpected {token!r} in JSON array")
@@ -0,0 +1,78 @@
+"""
+Precompiled multi-group keyword matcher
+Built once from the keyword lists in config.py and shared by filter_jobs
+and the scrapers' relevance checks (one group per source).
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, Set, Tuple
+from config import INTERNSHIP_KEYWORDS, ROLE_KEYWORDS, RELEVANCE_KEYWORDS
+
+
+def _compile_group(keywords: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Lowercase and dedupe a keyword group, dropping keywords that contain
+    another keyword of the same group (e.g. "internship" when "intern" is
+    present) - any text they match is already matched by the shorter one
+    """
+    unique = list(dict.fromkeys(keyword.lower() for keyword in keywords if keyword))
+    return tuple(keyword for keyword in unique
+                 if not any(other != keyword and other in keyword for other in unique))
+
+
+def contains_any(text: str, keywords: Tuple[str, ...]) -> bool:
+    """Whether an already-lowercased text contains any of the keywords"""
+    for keyword in keywords:
+        if keyword in text:
+            return True
+    return False
+
+
+class KeywordMatcher:
+    """
+    Matches named keyword groups against a text with substring semantics
+    Each text is lowercased once; each group stops at its first hit.
+    (CPython's substring search beats a compiled regex alternation for these
+    short keyword lists - see benchmarks/bench_filter.py)
+    """
+
+    def __init__(self, groups: Dict[str, Iterable[str]]):
+        self.groups = {name: _compile_group(keywords) for name, keywords in groups.items()}
+
+    @staticmethod
+    def prepare(*texts: str) -> str:
+        """Lowercase and join texts so they can be checked with the *_prepared methods"""
+        # Newline keeps keywords from matching across the title/description boundary
+        return "\n".join(texts).lower()
+
+    def matches_prepared(self, text: str, group: str) -> bool:
+        """Whether a prepared text contains any keyword of the group"""
+        return contains_any(text, self.groups[group])
+
+    def matches(self, text: str, group: str) -> bool:
+        """Whether the text contains any keyword of the group"""
+        return self.matches_prepared(text.lower(), group)
+
+    def groups_in(self, *texts: str) -> Set[str]:
+        """Names of every group with at least one keyword in the texts"""
+        text = self.prepare(*texts)
+        return {group for group in self.groups if self.matches_prepared(text, group)}
+
+    def matches_all(self, groups: Iterable[str], *texts: str) -> bool:
+        """Whether the texts match every one of the given groups"""
+        text = self.prepare(*texts)
+        return all(self.matches_prepared(text, group) for group in groups)
+
+
+@lru_cache(maxsize=None)
+def matcher_for(internship_keywords: Tuple[str, ...], role_keywords: Tuple[str, ...]) -> KeywordMatcher:
+    """Matcher for a filter_jobs filters dict, built once per distinct keyword lists"""
+    return KeywordMatcher({"internship": internship_keywords, "role": role_keywords})
+
+
+# Shared matcher for the default keyword lists in config.py
+DEFAULT_MATCHER = KeywordMatcher({
+    "internship": INTERNSHIP_KEYWORDS,
+    "role": ROLE_KEYWORDS,
+    **{f"relevance_{source}": keywords for source, keywords in RELEVANCE_KEYWORDS.items()},
+})
@@ -4,16 +4,18 @@ Note: LinkedIn heavily restricts scraping. This uses their public job search.
 For production, consider using LinkedIn's official API if available.
 """
 
-import requests
-from bs4 import BeautifulSoup
-from typing import List
-import time
-from .base_scraper import BaseScraper, Job
+from typing import List, Optional
+from config import LINKEDIN_MAX_PAGES, LINKEDIN_PAGE_SIZE
+from .base_scraper import BaseScraper, CardSelector, Job
+from .query_planner import SearchQuery
+from .watermarks import linkedin_time_range
 
 
 class LinkedInScraper(BaseScraper):
     """Scraper for LinkedIn Jobs"""
 
+    card_selectors = (CardSelector('div', 'base-card'),)
+
     def __init__(self):
         super().__init__("LinkedIn")
         self.base_url = "https://www.linkedin.com"
@@ -22,88 +24,104 @@ class LinkedInScraper(BaseScraper):
         """Scrape LinkedIn for jobs"""
         self.jobs = []
 
-        for keyword in keywords:
+        # Keywords are packed into a few OR queries (see QUERY_PLANS)
+        for query in self.plan_queries(keywords):
             try:
-                jobs = self._scrape_keyword(keyword, location)
+                jobs = self._scrape_query(query, location)
                 self.jobs.extend(jobs)
-                time.sleep(3)  # Be extra respectful with LinkedIn
             except Exception as e:
-                print(f"Error scraping LinkedIn for '{keyword}': {e}")
+                print(f"Error scraping LinkedIn for '{query.text}': {e}")
 
         return self.jobs
 
-    def _scrape_keyword(self, keyword: str, location: str) -> List[Job]:
-        """Scrape jobs for a specific keyword"""
+    def _scrape_query(self, query: SearchQuery, location: str) -> List[Job]:
+        """
+        Scrape result pages for a query until we reach jobs we already have
+        A packed OR query gets LINKEDIN_MAX_PAGES pages for each keyword it covers
+        """
         jobs = []
-
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+        seen = set()
+        time_range = linkedin_time_range(self.window_hours(query, max_hours=7 * 24))
 
         try:
-            # LinkedIn public job search URL
-            params = {
-                'keywords': keyword,
-                'location': location,
-                'f_JT': 'I',  # Internship
-                'f_TPR': 'r604800',  # Past week
-                'position': '1',
-                'pageNum': '0'
-            }
+            for page in range(LINKEDIN_MAX_PAGES * len(query.keywords)):
+                job_cards = self._fetch_page(query.text, location, page, time_range)
+                if not job_cards and page == 0:
+                    break  # Possibly a block/interstitial page - keep the current window
 
-            query_string = '&'.join([f"{k}={v.replace(' ', '%20')}" for k, v in params.items()])
-            url = f"{self.base_url}/jobs/search?{query_string}"
+                page_jobs = [job for job in (self._parse_card(card, location) for card in job_cards) if job]
 
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
+                for job in page_jobs:
+                    if job.id not in seen:  # Results can shift between pages while we crawl
+                        seen.add(job.id)
+                        jobs.append(job)
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+                # A short page is the last one; a page of known jobs means we've caught up
+                if len(job_cards) < LINKEDIN_PAGE_SIZE or self.caught_up(page_jobs):
+                    # Only a crawl that caught up may narrow the next run's window
+                    self.advance_watermarks(query, jobs)
+                    break
 
-            # Find job cards (LinkedIn's structure may change)
-            job_cards = soup.find_all('div', class_='base-card')
+        except Exception as e:
+            print(f"Error fetching LinkedIn jobs for '{query.text}': {e}")
 
-            for card in job_cards[:50]:  # Limit to 50 per keyword
-                try:
-                    # Extract job details
-                    title_elem = card.find('h3', class_='base-search-card__title')
-                    if not title_elem:
-                        continue
+        return jobs
 
-                    title = title_elem.text.strip()
+    def _fetch_page(self, keyword: str, location: str, page: int, time_range: str = 'r604800') -> List:
+        """Fetch one page of search results and return its job cards"""
+        # LinkedIn public job search URL
+        params = {
+            'keywords': keyword,
+            'location': location,
+            'f_JT': 'I',  # Internship
+            'f_TPR': time_range,  # Since the last successful crawl (at most a week)
+            'position': '1',
+            'pageNum': '0',
+            'start': str(page * LINKEDIN_PAGE_SIZE)
+        }
 
-                    link_elem = card.find('a', class_='base-card__full-link')
-                    if not link_elem:
-                        continue
+        query_string = '&'.join([f"{k}={v.replace(' ', '%20')}" for k, v in params.items()])
+        url = f"{self.base_url}/jobs/search?{query_string}"
 
-                    job_url = link_elem.get('href', '')
+        # Find job cards (LinkedIn's structure may change)
+        return self.fetch_cards(url, timeout=10)
 
-                    company_elem = card.find('h4', class_='base-search-card__subtitle')
-                    company = company_elem.text.strip() if company_elem else "Unknown"
+    def _parse_card(self, card, location: str) -> Optional[Job]:
+        """Build a Job from one result card"""
+        try:
+            # Extract job details
+            title_elem = card.find('h3', class_='base-search-card__title')
+            if not title_elem:
+                return None
 
-                    location_elem = card.find('span', class_='job-search-card__location')
-                    job_location = location_elem.text.strip() if location_elem else location
+            title = title_elem.text.strip()
 
-                    # Get posted date if available
-                    date_elem = card.find('time')
-                    posted_date = date_elem.get('datetime', '') if date_elem else ""
+            link_elem = card.find('a', class_='base-card__full-link')
+            if not link_elem:
+                return None
 
-                    job = Job(
-                        title=title,
-                        company=company,
-                        location=job_location,
-                        url=job_url,
-                        description="",  # LinkedIn doesn't show description in search results
-                        posted_date=posted_date,
-                        source="LinkedIn"
-                    )
+            job_url = link_elem.get('href', '')
 
-                    jobs.append(job)
+            company_elem = card.find('h4', class_='base-search-card__subtitle')
+            company = company_elem.text.strip() if company_elem else "Unknown"
 
-                except Exception as e:
-                    print(f"Error parsing LinkedIn job card: {e}")
-                    continue
+            location_elem = card.find('span', class_='job-search-card__location')
+            job_location = location_elem.text.strip() if location_elem else location
 
-        except Exception as e:
-            print(f"Error fetching LinkedIn jobs for '{keyword}': {e}")
+            # Get posted date if available
+            date_elem = card.find('time')
+            posted_date = date_elem.get('datetime', '') if date_elem else ""
 
-        return jobs
+            return Job(
+                title=title,
+                company=company,
+                location=job_location,
+                url=job_url,
+                description="",  # LinkedIn doesn't show description in search results
+                posted_date=posted_date,
+                source="LinkedIn"
+            )
+
+        except Exception as e:
+            print(f"Error parsing LinkedIn job card: {e}")
+            return None
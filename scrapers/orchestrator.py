@@ -0,0 +1,24 @@
+"""
+Runs several scrapers at the same time on a thread pool
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional, Tuple
+from .base_scraper import BaseScraper
+
+
+def run_sources(scrapers: List[BaseScraper], collect: Callable[[BaseScraper], List],
+                max_workers: Optional[int] = None) -> Iterator[Tuple[BaseScraper, List, Optional[Exception]]]:
+    """
+    Run collect(scraper) for every scraper concurrently
+    Yields (scraper, result, error) in the original scraper order, so callers
+    can save results exactly as the sequential loop would
+    """
+    with ThreadPoolExecutor(max_workers=max_workers or len(scrapers) or 1) as executor:
+        futures = [executor.submit(collect, scraper) for scraper in scrapers]
+
+        for scraper, future in zip(scrapers, futures):
+            try:
+                yield scraper, future.result(), None
+            except Exception as e:
+                yield scraper, [], e
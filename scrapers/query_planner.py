@@ -0,0 +1,81 @@
+"""
+Search query planner
+Packs the configured keywords into as few search requests as each job
+board allows (OR queries up to a length limit), and maps the results of a
+packed query back to the keywords they match.
+"""
+
+from typing import Dict, List, Optional
+
+
+class SearchQuery:
+    """One search request: its query text and the keywords it covers"""
+
+    def __init__(self, text: str, keywords: List[str]):
+        self.text = text
+        self.keywords = keywords
+
+    def __repr__(self) -> str:
+        return f"SearchQuery({self.text!r})"
+
+    def assign(self, jobs: List) -> Dict[str, List]:
+        """
+        Jobs per covered keyword, matched on title and description
+        A job that mentions none of them (the board matched on text we don't
+        see) is credited to every keyword of the query
+        """
+        assigned: Dict[str, List] = {keyword: [] for keyword in self.keywords}
+
+        for job in jobs:
+            text = f"{job.title}\n{job.description}".lower()
+            matched = [keyword for keyword in self.keywords if keyword.lower() in text] or self.keywords
+            for keyword in matched:
+                assigned[keyword].append(job)
+
+        return assigned
+
+
+def _term(keyword: str) -> str:
+    """A keyword as an OR operand (phrases are quoted)"""
+    return f'"{keyword}"' if ' ' in keyword else keyword
+
+
+def plan_queries(keywords: List[str], max_queries: int, operator: Optional[str] = None,
+                 max_length: int = 100, rotation: int = 0) -> List[SearchQuery]:
+    """
+    Plan at most `max_queries` requests covering `keywords`
+    With an operator (e.g. "OR") keywords are packed, longest first, into
+    the fewest queries no longer than `max_length`; without one each request
+    searches a single keyword. If the plan still needs more than
+    `max_queries` requests, `rotation` (e.g. the run number) picks which ones
+    run, so consecutive runs cycle through every keyword.
+    """
+    if operator:
+        groups: List[List[str]] = []
+        lengths: List[int] = []
+        separator = len(operator) + 2
+
+        for keyword in sorted(keywords, key=len, reverse=True):
+            size = len(_term(keyword))
+            for i, length in enumerate(lengths):
+                if length + separator + size <= max_length:
+                    groups[i].append(keyword)
+                    lengths[i] += separator + size
+                    break
+            else:
+                groups.append([keyword])
+                lengths.append(size)
+
+        # Keep the configured keyword order inside and across queries
+        order = {keyword: i for i, keyword in enumerate(keywords)}
+        groups = sorted((sorted(group, key=order.get) for group in groups), key=lambda group: order[group[0]])
+        queries = [SearchQuery(f" {operator} ".join(_term(k) for k in group) if len(group) > 1 else group[0], group)
+                   for group in groups]
+    else:
+        queries = [SearchQuery(keyword, [keyword]) for keyword in keywords]
+
+    if len(queries) <= max_queries:
+        return queries
+
+    start = (rotation * max_queries) % len(queries)
+    return [queries[(start + i) % len(queries)] for i in range(max_queries)]
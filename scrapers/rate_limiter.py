@@ -0,0 +1,132 @@
+"""
+Per-host token-bucket rate limiting shared by all scrapers
+Requests only wait when the same host was hit recently, instead of every
+scraper sleeping a fixed time after each keyword or company. Hosts that
+answer 429/503 are backed off (honoring Retry-After) until they recover.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+THROTTLE_STATUSES = (429, 503)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delay-seconds or HTTP-date)"""
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class _Bucket:
+    """Token bucket for one host; tokens may go negative to queue reservations"""
+
+    __slots__ = ("rate", "burst", "tokens", "updated", "penalty")
+
+    def __init__(self, rate: float, burst: int, now: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = now
+        self.penalty = 1.0  # Divides the rate while the host is throttling us
+
+    def reserve(self, now: float) -> float:
+        rate = self.rate / self.penalty
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+
+        self.tokens -= 1
+        return -self.tokens / rate if self.tokens < 0 else 0.0
+
+    def block(self, now: float, seconds: float):
+        """Make the next token available only `seconds` from now"""
+        self.tokens = 1.0
+        self.updated = now + seconds
+
+
+class RateLimiter:
+    """
+    Token buckets keyed by hostname
+    limits maps a host or domain (e.g. "linkedin.com") to {"rate": requests
+    per second, "burst": requests allowed back to back}; other hosts use
+    `default`.
+    """
+
+    def __init__(self, default: Mapping[str, float], limits: Optional[Mapping[str, Mapping[str, float]]] = None,
+                 max_backoff: float = 120):
+        self.default = default
+        self.limits = dict(limits or {})
+        self.max_backoff = max_backoff
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def _limits_for(self, host: str) -> Mapping[str, float]:
+        for domain, limits in self.limits.items():
+            if host == domain or host.endswith("." + domain):
+                return limits
+        return self.default
+
+    def _bucket(self, host: str, now: float) -> _Bucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            limits = self._limits_for(host)
+            bucket = _Bucket(limits["rate"], int(limits.get("burst", 1)), now)
+            self._buckets[host] = bucket
+        return bucket
+
+    def reserve(self, url: str) -> float:
+        """
+        Take the next request slot for the URL's host without blocking
+        Returns how many seconds the caller must wait before sending (async
+        callers sleep on it themselves).
+        """
+        host = urlsplit(url).hostname or ""
+        now = time.monotonic()
+        with self._lock:
+            return self._bucket(host, now).reserve(now)
+
+    def acquire(self, url: str):
+        """Block until a request to the URL's host is allowed"""
+        wait = self.reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+
+    def record(self, url: str, status_code: Optional[int], headers: Optional[Mapping[str, str]] = None) -> Optional[float]:
+        """
+        Feed a response back into the host's bucket
+        On 429/503 the host's next request waits for Retry-After (or the slowed
+        interval) and its rate is halved afterwards; returns that backoff in
+        seconds. Other responses slowly restore the configured rate and return None.
+        """
+        host = urlsplit(url).hostname or ""
+        now = time.monotonic()
+
+        with self._lock:
+            bucket = self._bucket(host, now)
+
+            if status_code not in THROTTLE_STATUSES:
+                bucket.penalty = max(1.0, bucket.penalty * 0.75)
+                return None
+
+            bucket.penalty = max(1.0, min(bucket.penalty * 2, bucket.rate * self.max_backoff))
+            retry_after = parse_retry_after((headers or {}).get("Retry-After"))
+            backoff = retry_after if retry_after is not None else bucket.penalty / bucket.rate
+            backoff = min(backoff, self.max_backoff)
+
+            bucket.block(now, backoff)
+            return backoff
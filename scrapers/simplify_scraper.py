@@ -2,10 +2,12 @@
 Simplify.jobs scraper - Popular for tech internships
 """
 
-import requests
-from typing import List
-import time
+from typing import Dict, List, Optional
 from .base_scraper import BaseScraper, Job
+from .keyword_matcher import DEFAULT_MATCHER
+from .json_stream import iter_json_array
+
+STREAM_CHUNK_SIZE = 64 * 1024  # Bytes read from the listings feed at a time
 
 
 class SimplifyScraper(BaseScraper):
@@ -24,44 +26,49 @@ class SimplifyScraper(BaseScraper):
             # They maintain a GitHub repo with internship listings
             api_url = "https://raw.githubusercontent.com/SimplifyJobs/Summer2025-Internships/dev/.github/scripts/listings.json"
 
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-
-            response = requests.get(api_url, headers=headers, timeout=10)
-
-            if response.status_code == 200:
-                listings = response.json()
-
-                for listing in listings[:100]:  # Limit to 100
-                    try:
-                        company = listing.get('company_name', 'Unknown')
-                        title = listing.get('title', '')
-                        locations = listing.get('locations', [])
-                        url = listing.get('url', '')
-
-                        # Filter for EE/hardware related roles
-                        title_lower = title.lower()
-                        is_relevant = any(keyword in title_lower for keyword in [
-                            'hardware', 'electrical', 'circuit', 'analog', 'digital',
-                            'semiconductor', 'vlsi', 'fpga', 'embedded', 'firmware'
-                        ])
-
-                        if is_relevant:
-                            job = Job(
-                                title=title,
-                                company=company,
-                                location=', '.join(locations) if locations else location,
-                                url=url,
-                                description="",
-                                source="Simplify"
-                            )
-                            self.jobs.append(job)
-
-                    except Exception as e:
-                        continue
+            # Stream the body so listings are parsed one at a time as they arrive
+            with self.fetch(api_url, conditional=True, stream=True, timeout=10) as response:
+                if response.status_code == 304:
+                    # Listings unchanged since the last run - nothing new to decode
+                    print("Simplify listings not modified since last run, skipping download")
+                    return self.jobs
+
+                if response.status_code == 200:
+                    for listing in iter_json_array(response.iter_content(chunk_size=STREAM_CHUNK_SIZE)):
+                        try:
+                            job = self._parse_listing(listing, location)
+                            if job:
+                                self.jobs.append(job)
+
+                        except Exception as e:
+                            continue
+
+                    self.http_cache.remember(api_url, response)
 
         except Exception as e:
             print(f"Error fetching Simplify jobs: {e}")
 
         return self.jobs
+
+    def _parse_listing(self, listing: Dict, location: str) -> Optional[Job]:
+        """Turn one listings.json entry into a Job if it's an EE/hardware role"""
+        company = listing.get('company_name', 'Unknown')
+        title = listing.get('title', '')
+        locations = listing.get('locations', [])
+        url = listing.get('url', '')
+
+        # Filter for EE/hardware related roles
+        title_lower = title.lower()
+        is_relevant = DEFAULT_MATCHER.matches_prepared(title_lower, "relevance_simplify")
+
+        if not is_relevant:
+            return None
+
+        return Job(
+            title=title,
+            company=company,
+            location=', '.join(locations) if locations else location,
+            url=url,
+            description="",
+            source="Simplify"
+        )
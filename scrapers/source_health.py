@@ -0,0 +1,136 @@
+"""
+Source health tracking and circuit breaking
+Keeps a persisted record per scraper and per company page (consecutive
+failed runs, recent HTTP statuses, blocked-page detections). Sources that
+keep failing - errors, block pages, no successful response - are skipped,
+and probed again on an exponential schedule, instead of spending their
+full request budget every run. A run that is answered normally but finds
+nothing (e.g. a narrow incremental window) is not a failure.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional
+
+# Statuses and page markers that mean we were served a block/captcha page
+BLOCKED_STATUSES = (403, 429, 999)
+ANSWERED_STATUSES = range(200, 400)  # The source answered normally (incl. 304 Not Modified)
+NOT_MODIFIED = 304  # Nothing to parse, but nothing changed either - not an empty result
+BLOCK_MARKERS = (b"captcha", b"unusual traffic", b"are you a robot", b"access denied", b"authwall")
+
+# Circuit states returned by HealthTracker.check()
+HEALTHY = "healthy"
+PROBE = "probe"
+SKIP = "skip"
+
+_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def is_blocked_page(status_code: Optional[int], content: bytes = b"") -> bool:
+    """Whether a response looks like a block or captcha page rather than results"""
+    if status_code in BLOCKED_STATUSES:
+        return True
+    head = content[:20000].lower()
+    return any(marker in head for marker in BLOCK_MARKERS)
+
+
+class HealthTracker:
+    """Health records for sources and companies in a small JSON file"""
+
+    def __init__(self, filepath: str, failure_threshold: int = 3, base_backoff_hours: float = 12,
+                 max_backoff_hours: float = 168, history: int = 20, empty_threshold: int = 3):
+        self.filepath = filepath
+        self.failure_threshold = failure_threshold
+        self.empty_threshold = empty_threshold
+        self.base_backoff_hours = base_backoff_hours
+        self.max_backoff_hours = max_backoff_hours
+        self.history = history
+        self._records: Optional[Dict[str, Dict[str, Dict]]] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict[str, Dict]]:
+        if self._records is None:
+            try:
+                with open(self.filepath, 'r') as f:
+                    self._records = json.load(f)
+            except (FileNotFoundError, ValueError):
+                self._records = {}
+        return self._records
+
+    def _entry(self, name: str, kind: str) -> Dict:
+        return self._load().setdefault(kind, {}).setdefault(name, {
+            "consecutive_failures": 0,
+            "consecutive_empty": 0,
+            "statuses": [],
+            "blocked_pages": 0,
+            "last_success": "",
+            "last_error": "",
+            "skip_until": "",
+        })
+
+    def check(self, name: str, kind: str = "sources", now: Optional[datetime] = None) -> str:
+        """HEALTHY (run), PROBE (run once to test recovery) or SKIP"""
+        with self._lock:
+            entry = self._load().get(kind, {}).get(name)
+
+        if not entry or self._over(entry) < 0:
+            return HEALTHY
+
+        now = now or datetime.now()
+        if entry["skip_until"] and now < datetime.strptime(entry["skip_until"], _TIME_FORMAT):
+            return SKIP
+        return PROBE
+
+    def record(self, name: str, found: int, statuses: Iterable[Optional[int]] = (), blocked: int = 0,
+               error: Optional[Exception] = None, kind: str = "sources", now: Optional[datetime] = None):
+        """
+        Record one run of a source
+        found is how many jobs/cards it parsed. The run failed if it raised,
+        or found nothing while every response was a block page or an error.
+        A normal answer that parsed no cards at all is an empty run; those
+        are counted separately and back off the same way, since a source
+        that keeps answering with nothing still costs a full scrape. Cards
+        parsed but nothing new (or a 304) is a healthy run.
+        """
+        now = now or datetime.now()
+        statuses = list(statuses)
+
+        with self._lock:
+            entry = self._entry(name, kind)
+            entry["statuses"] = (entry["statuses"] + statuses)[-self.history:]
+            entry["blocked_pages"] += blocked
+            entry["last_error"] = str(error) if error is not None else ""
+
+            answered = any(status in ANSWERED_STATUSES for status in statuses)
+            if error is None and (found > 0 or (answered and not blocked)):
+                empty = found == 0 and NOT_MODIFIED not in statuses
+                entry["consecutive_failures"] = 0
+                entry["consecutive_empty"] = entry.get("consecutive_empty", 0) + 1 if empty else 0
+                entry["last_success"] = now.strftime(_TIME_FORMAT)
+            else:
+                entry["consecutive_failures"] = entry.get("consecutive_failures", 0) + 1
+
+            over = self._over(entry)
+            if over >= 0:
+                # 12h, 24h, 48h, ... between probes, capped
+                hours = min(self.max_backoff_hours, self.base_backoff_hours * 2 ** over)
+                entry["skip_until"] = (now + timedelta(hours=hours)).strftime(_TIME_FORMAT)
+            else:
+                entry["skip_until"] = ""
+
+    def _over(self, entry: Dict) -> int:
+        """How many runs past a threshold the longer of the failure/empty streaks is (negative = healthy)"""
+        return max(entry.get("consecutive_failures", 0) - self.failure_threshold,
+                   entry.get("consecutive_empty", 0) - self.empty_threshold)
+
+    def save(self):
+        """Write the records to disk"""
+        with self._lock:
+            if self._records is None:
+                return
+
+            os.makedirs(os.path.dirname(self.filepath) or '.', exist_ok=True)
+            with open(self.filepath, 'w') as f:
+                json.dump(self._records, f, indent=2, sort_keys=True)
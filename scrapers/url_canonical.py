@@ -0,0 +1,86 @@
+"""
+URL canonicalization applied before job ids are generated
+
+Job ids hash the URL, so any per-request noise in it (LinkedIn's refId and
+trackingId, utm_* tags, ...) turns one posting into a new job on every
+scrape. canonicalize_url() strips that noise with generic rules plus
+per-source rules that reduce a board's URL to its stable job key.
+"""
+
+import re
+from typing import Callable, Dict, FrozenSet, Optional
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
+
+# Query params that only tag the click on any site, never identify the job
+TRACKING_PARAMS = frozenset({"fbclid", "gclid", "msclkid", "mc_cid", "mc_eid", "_hsenc", "_hsmi"})
+TRACKING_PREFIXES = ("utm_",)
+
+# LinkedIn's per-request search params
+LINKEDIN_TRACKING_PARAMS = frozenset({"refid", "trackingid", "trk", "trkinfo", "position", "pagenum"})
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_LINKEDIN_JOB_ID = re.compile(r"/jobs/view/(?:[^/?#]*-)?(\d+)/?$")
+
+
+def _generic(url: str, extra_tracking: FrozenSet[str] = frozenset()) -> str:
+    """Lowercase scheme/host, drop default ports, fragments and tracking params"""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    try:
+        port = parts.port
+    except ValueError:
+        return url.strip()  # Malformed authority - leave it alone rather than guess
+    if port and port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+
+    # Filter the raw query pieces so the kept params keep their exact encoding
+    kept = []
+    for piece in parts.query.split("&"):
+        name = piece.split("=", 1)[0].lower()
+        if piece and name not in TRACKING_PARAMS and name not in extra_tracking \
+                and not name.startswith(TRACKING_PREFIXES):
+            kept.append(piece)
+
+    return urlunsplit((scheme, host, parts.path, "&".join(kept), ""))
+
+
+def _linkedin(url: str) -> Optional[str]:
+    """https://www.linkedin.com/jobs/view/<numeric id>"""
+    parts = urlsplit(url)
+    if not (parts.hostname or "").endswith("linkedin.com"):
+        return None
+
+    match = _LINKEDIN_JOB_ID.search(parts.path)
+    if match:
+        return f"https://www.linkedin.com/jobs/view/{match.group(1)}"
+    return _generic(url, LINKEDIN_TRACKING_PARAMS)
+
+
+def _indeed(url: str) -> Optional[str]:
+    """https://www.indeed.com/viewjob?jk=<job key> (search results link via /rc/clk)"""
+    parts = urlsplit(url)
+    if not (parts.hostname or "").endswith("indeed.com"):
+        return None
+
+    job_key = dict(parse_qsl(parts.query)).get("jk")
+    if job_key:
+        return f"https://www.indeed.com/viewjob?jk={job_key}"
+    return None
+
+
+# Source name -> rule returning the canonical URL, or None to fall back to the generic rule
+SOURCE_RULES: Dict[str, Callable[[str], Optional[str]]] = {
+    "LinkedIn": _linkedin,
+    "Indeed": _indeed,
+}
+
+
+def canonicalize_url(url: str, source: str = "") -> str:
+    """Stable form of a job URL, so the same posting always gets the same id"""
+    if not url:
+        return url
+
+    rule = SOURCE_RULES.get(source)
+    canonical = rule(url) if rule else None
+    return canonical or _generic(url)
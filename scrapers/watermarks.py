@@ -0,0 +1,88 @@
+"""
+Crawl watermarks for incremental scraping
+Remembers, per (source, keyword), when the last successful crawl ran and
+the newest posted date it saw, so the next run can ask the job board for
+just the postings since then instead of the same week of results.
+"""
+
+import json
+import math
+import os
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class Watermarks:
+    """Last successful crawl and newest posted date per source and keyword, in a small JSON file"""
+
+    def __init__(self, filepath: str, overlap_hours: float = 6):
+        self.filepath = filepath
+        self.overlap_hours = overlap_hours  # Re-covered every run, in case postings show up late
+        self._marks: Optional[Dict[str, Dict[str, Dict[str, str]]]] = None
+        self._changed = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict[str, Dict[str, str]]]:
+        if self._marks is None:
+            try:
+                with open(self.filepath, 'r') as f:
+                    self._marks = json.load(f)
+            except (FileNotFoundError, ValueError):
+                self._marks = {}
+        return self._marks
+
+    def get(self, source: str, keyword: str) -> Dict[str, str]:
+        """The keyword's watermark (empty if it was never crawled successfully)"""
+        with self._lock:
+            return dict(self._load().get(source, {}).get(keyword, {}))
+
+    def window_hours(self, source: str, keyword: str, max_hours: float, now: Optional[datetime] = None) -> float:
+        """Hours of postings to ask for: the gap since the last success plus the overlap, capped"""
+        last_success = self.get(source, keyword).get("last_success")
+        if not last_success:
+            return max_hours
+
+        now = now or datetime.now()
+        gap = (now - datetime.strptime(last_success, _TIME_FORMAT)).total_seconds() / 3600
+        return max(0, min(max_hours, gap + self.overlap_hours))
+
+    def advance(self, source: str, keyword: str, posted_dates: Iterable[str] = (), now: Optional[datetime] = None):
+        """Record a successful crawl of the keyword and the newest posted date it returned"""
+        now = now or datetime.now()
+
+        with self._lock:
+            mark = self._load().setdefault(source, {}).setdefault(keyword, {})
+            mark["last_success"] = now.strftime(_TIME_FORMAT)
+            # ISO dates (what the boards hand us) compare correctly as strings
+            mark["newest_posted"] = max([mark.get("newest_posted", "")] + [d for d in posted_dates if d])
+            self._changed = True
+
+    def reset(self, source: str):
+        """Forget a source's watermarks, so its next run crawls the full window again"""
+        with self._lock:
+            if self._load().pop(source, None) is not None:
+                self._changed = True
+
+    def save(self):
+        """Write the watermarks if any crawl advanced them"""
+        with self._lock:
+            if not self._changed:
+                return
+
+            os.makedirs(os.path.dirname(self.filepath) or '.', exist_ok=True)
+            with open(self.filepath, 'w') as f:
+                json.dump(self._marks, f, indent=2, sort_keys=True)
+            self._changed = False
+
+
+def linkedin_time_range(hours: float) -> str:
+    """LinkedIn's f_TPR value for postings from the last `hours` hours"""
+    return f"r{max(3600, int(hours * 3600))}"
+
+
+def indeed_fromage(hours: float) -> str:
+    """Indeed's fromage value (whole days, at least one) covering the last `hours` hours"""
+    return str(max(1, math.ceil(hours / 24)))
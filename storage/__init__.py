@@ -0,0 +1,22 @@
+"""
+Job storage backends
+All stores share one interface: stage(jobs) -> new count, flush(),
+add(jobs) (stage + flush), known_ids(), count(), iter_sorted() /
+load_sorted() (newest first), export_json(path) and replace(jobs) for
+one-off migrations. publish_shards() splits the aggregated view into the
+shards the site loads, and SearchIndexBuilder indexes them.
+"""
+
+from .json_store import JsonFileStore, write_json_array
+from .segment_store import SegmentStore
+from .sqlite_store import SqliteStore
+from .backends import open_store
+from .pipeline import PersistencePipeline, AGGREGATED_FILE
+from .shards import publish_shards
+from .search_index import SearchIndexBuilder
+
+__all__ = [
+    'JsonFileStore', 'SegmentStore', 'SqliteStore', 'open_store',
+    'PersistencePipeline', 'AGGREGATED_FILE', 'write_json_array', 'publish_shards',
+    'SearchIndexBuilder'
+]
@@ -0,0 +1,48 @@
+"""
+Backend selection for job stores
+"""
+
+import os
+from config import STORAGE_BACKEND, SEGMENT_STORE_DIR, SQLITE_DB_PATH
+from .json_store import JsonFileStore
+from .segment_store import SegmentStore
+from .sqlite_store import SqliteStore
+
+# Segment stores are shared so background compaction is tracked per directory
+_segment_stores = {}
+
+
+def open_store(filepath: str):
+    """
+    Open the configured backend for a dataset identified by its JSON path
+    (e.g. data/jobs_all.json)
+    """
+    if STORAGE_BACKEND == "json":
+        return JsonFileStore(filepath)
+
+    name = os.path.splitext(os.path.basename(filepath))[0]
+
+    if STORAGE_BACKEND == "sqlite":
+        store = SqliteStore(SQLITE_DB_PATH, name)
+    elif STORAGE_BACKEND == "segments":
+        directory = os.path.join(SEGMENT_STORE_DIR, name)
+        if directory not in _segment_stores:
+            _segment_stores[directory] = SegmentStore(directory)
+        store = _segment_stores[directory]
+    else:
+        raise ValueError(f"Unknown STORAGE_BACKEND: {STORAGE_BACKEND}")
+
+    _seed_from_json(store, filepath)
+    return store
+
+
+def _seed_from_json(store, filepath: str):
+    """
+    Import an existing JSON dataset into a brand-new store, so switching
+    backends keeps the history (and jobs_all.json isn't exported empty)
+    """
+    if store.count() == 0 and os.path.exists(filepath):
+        jobs = JsonFileStore(filepath).load_sorted()
+        if jobs:
+            store.add(jobs)
+            print(f"Imported {len(jobs)} existing jobs from {filepath}")
@@ -0,0 +1,274 @@
+"""
+Cross-source near-duplicate detection with MinHash + LSH
+
+The same internship often arrives from several boards (e.g. LinkedIn and
+Simplify) with different URLs, so its id differs. Each job is reduced to
+word shingles of its normalized title, scoped to its normalized company,
+and summarized by a MinHash signature. Signatures are split into LSH bands
+and bucketed, so a new job is only compared against the few stored jobs
+sharing a bucket. Candidates are confirmed with the exact Jaccard
+similarity of their shingles, and must be in the same place (the same
+title in Austin and in San Jose is two postings).
+
+The index is persisted as an append-only JSON-lines log (a parameter
+header, then one record per canonical job or duplicate link), so a run
+only appends what it added instead of rewriting the whole index.
+"""
+
+import hashlib
+import json
+import os
+import random
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_TOKEN = re.compile(r"[a-z0-9]+")
+_COMPANY_SUFFIXES = {"inc", "llc", "ltd", "corp", "corporation", "co", "company", "plc", "gmbh", "the"}
+# Location parts that don't narrow a posting down to a place
+_GENERIC_PLACES = {"", "remote", "hybrid", "on site", "onsite", "us", "usa", "united states",
+                   "united states of america", "multiple locations", "various locations", "anywhere"}
+
+
+def normalize_company(company: str) -> str:
+    """Lowercase company name without punctuation or legal suffixes"""
+    tokens = [token for token in _TOKEN.findall(company.lower()) if token not in _COMPANY_SUFFIXES]
+    return " ".join(tokens)
+
+
+def normalize_title(title: str) -> str:
+    """Lowercase title reduced to alphanumeric words"""
+    return " ".join(_TOKEN.findall(title.lower()))
+
+
+def normalize_location(location: str) -> List[str]:
+    """
+    The specific places in a location string, e.g. "Austin, TX" -> ["austin"]
+    Comma-separated parts are normalized like titles; state codes, the
+    country and "Remote" are dropped since they don't tell postings apart.
+    """
+    parts = (" ".join(_TOKEN.findall(part.lower())) for part in location.split(","))
+    return sorted({part for part in parts if len(part) > 2 and part not in _GENERIC_PLACES})
+
+
+def same_place(a: List[str], b: List[str]) -> bool:
+    """Whether two normalized locations can be the same posting (unknown matches anything)"""
+    return not a or not b or not set(a).isdisjoint(b)
+
+
+def dedup_key(job: Dict) -> str:
+    """Normalized company|title string a job is compared on"""
+    return f"{normalize_company(job.get('company', ''))}|{normalize_title(job.get('title', ''))}"
+
+
+def shingles(key: str) -> Set[str]:
+    """Word unigrams and bigrams of the title, each scoped to the company"""
+    company, _, title = key.partition("|")
+    words = title.split()
+    grams = set(words) | {f"{a} {b}" for a, b in zip(words, words[1:])}
+    return {f"{company}|{gram}" for gram in grams}
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class NearDuplicateIndex:
+    """Persistent MinHash/LSH index of canonical jobs"""
+
+    def __init__(self, filepath: str, num_perm: int = 32, bands: int = 8, threshold: float = 0.8):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+
+        self.filepath = filepath
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+
+        rng = random.Random(1)  # Fixed seed: signatures must match across runs
+        self._perms = [(rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+                       for _ in range(num_perm)]
+
+        self.entries: List[Dict] = []  # {"id", "key", "source", "location"} per canonical job
+        self.links: Dict[str, List[Dict]] = {}  # canonical id -> extra {"source", "url"}
+        self.duplicate_ids: Set[str] = set()  # Ids of jobs merged into a canonical one
+        self._buckets: Dict[str, List[int]] = {}
+        self._positions: Dict[str, int] = {}
+        self._log: List[Dict] = []  # Records not yet written
+        self._rewrite = False  # Whether save() must write the whole log again
+        self.changed = False
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _header(self) -> Dict:
+        return {"num_perm": self.num_perm, "bands": self.bands}
+
+    def _apply(self, record: Dict):
+        """Replay one log record"""
+        if "link" in record:
+            if record.get("id"):
+                self.duplicate_ids.add(record["id"])
+            link = {"source": record["source"], "url": record["url"]}
+            links = self.links.setdefault(record["link"], [])
+            if link not in links:
+                links.append(link)
+            return
+
+        position = len(self.entries)
+        self.entries.append({"id": record["id"], "key": record["key"], "source": record["source"],
+                             "location": record.get("location", [])})
+        self._positions[record["id"]] = position
+        for band_key in record["bands"]:
+            self._buckets.setdefault(band_key, []).append(position)
+
+    def load(self) -> bool:
+        """Replay the index log from disk, returning False if there is none yet"""
+        try:
+            with open(self.filepath, 'r') as f:
+                lines = iter(f)
+                try:
+                    header = json.loads(next(lines, "{}"))
+                except ValueError:
+                    return False
+                if (header.get("num_perm"), header.get("bands")) != (self.num_perm, self.bands):
+                    return False  # Built with different parameters - rebuild
+
+                for line in lines:
+                    try:
+                        self._apply(json.loads(line))
+                    except ValueError:
+                        continue  # A record cut short by an interrupted run
+        except FileNotFoundError:
+            return False
+
+        return True
+
+    def _record(self, record: Dict):
+        self._log.append(record)
+        self.changed = True
+
+    def save(self):
+        """Append the records added since the last save (or write the whole log after a rebuild)"""
+        if not self._log and not self._rewrite:
+            return
+
+        os.makedirs(os.path.dirname(self.filepath) or '.', exist_ok=True)
+        lines = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in self._log)
+
+        if self._rewrite or not os.path.exists(self.filepath):
+            tmp_path = f"{self.filepath}.tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(json.dumps(self._header()) + "\n" + lines)
+            os.replace(tmp_path, self.filepath)
+        else:
+            with open(self.filepath, 'rb+') as f:
+                # Start on a fresh line if an interrupted run left a partial record
+                f.seek(0, os.SEEK_END)
+                if f.tell():
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        lines = "\n" + lines
+                f.write(lines.encode())
+
+        self._log = []
+        self._rewrite = False
+        self.changed = False
+
+    # ------------------------------------------------------------------
+    # MinHash / LSH
+    # ------------------------------------------------------------------
+
+    def _signature(self, shingle_set: Set[str]) -> List[int]:
+        hashes = [int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "little")
+                  for s in shingle_set] or [0]
+        return [min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in self._perms]
+
+    def _band_keys(self, signature: List[int]) -> List[str]:
+        keys = []
+        for band in range(self.bands):
+            rows = signature[band * self.rows:(band + 1) * self.rows]
+            digest = hashlib.blake2b(",".join(map(str, rows)).encode(), digest_size=6).hexdigest()
+            keys.append(f"{band}:{digest}")
+        return keys
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def __contains__(self, job_id: str) -> bool:
+        """Whether the id is a canonical job or a duplicate already merged into one"""
+        return job_id in self._positions or job_id in self.duplicate_ids
+
+    def add(self, job: Dict):
+        """Register a job as canonical"""
+        if job['id'] in self._positions:
+            return
+
+        key = dedup_key(job)
+        record = {"id": job['id'], "key": key, "source": job.get('source', ''),
+                  "location": normalize_location(job.get('location', '')),
+                  "bands": self._band_keys(self._signature(shingles(key)))}
+        self._apply(record)
+        self._record(record)
+
+    def rebuild(self, jobs: Iterable[Dict]):
+        """
+        Reset the index to these jobs as canonical, without matching them
+        against each other; source links already in their "urls" are kept
+        """
+        self.entries, self.links, self._buckets, self._positions = [], {}, {}, {}
+        self.duplicate_ids, self._log = set(), []
+        for job in jobs:
+            self.add(job)
+            for link in job.get('urls', [])[1:]:
+                self.link(job['id'], link)
+        self._rewrite = True
+        self.changed = True
+
+    def find_duplicate(self, job: Dict) -> Optional[str]:
+        """Id of the most similar canonical job from another source, if any passes the threshold"""
+        key = dedup_key(job)
+        job_shingles = shingles(key)
+        source = job.get('source', '')
+        places = normalize_location(job.get('location', ''))
+
+        candidates = set()
+        for band_key in self._band_keys(self._signature(job_shingles)):
+            candidates.update(self._buckets.get(band_key, ()))
+
+        best_id, best_score = None, self.threshold
+        for position in candidates:
+            entry = self.entries[position]
+            if entry["source"] == source:
+                continue  # Only merge across sources; same-board repeats are distinct postings
+            if not same_place(places, entry.get("location", [])):
+                continue  # Same role in another city
+
+            score = jaccard(job_shingles, shingles(entry["key"]))
+            if score >= best_score:
+                best_id, best_score = entry["id"], score
+
+        return best_id
+
+    def link(self, canonical_id: str, job: Dict):
+        """Record a duplicate's source and URL on its canonical job, and its id as seen"""
+        link = {"source": job.get('source', ''), "url": job.get('url', '')}
+        job_id = job.get('id', '')
+        if link in self.links.get(canonical_id, []) and (not job_id or job_id in self.duplicate_ids):
+            return
+
+        record = {"link": canonical_id, "id": job_id, **link}
+        self._apply(record)
+        self._record(record)
+
+    def annotate(self, job: Dict) -> Dict:
+        """Add a "urls" list (own link first) to canonical jobs that have duplicates"""
+        links = self.links.get(job['id'])
+        if not links:
+            return job
+        return {**job, "urls": [{"source": job.get('source', ''), "url": job.get('url', '')}] + links}
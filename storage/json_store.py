@@ -0,0 +1,192 @@
+"""
+Single JSON file job store (the original data/jobs_*.json format)
+"""
+
+import heapq
+import json
+import os
+from itertools import islice
+from typing import Callable, Dict, IO, Iterable, Iterator, List, Optional, Set
+from config import PRETTY_JSON
+
+# data/jobs_*.json are minified unless PRETTY_JSON asks for a readable copy
+DEFAULT_INDENT = 2 if PRETTY_JSON else None
+
+
+def dump_json_array(items: Iterable[Dict], f: IO[str], indent: Optional[int] = 2, chunk_size: int = 1000):
+    """
+    Write items as a JSON array without building the whole list first
+    Produces the same text as json.dump(list(items), f, indent=indent), or
+    the minified form (no whitespace at all) when indent is None.
+    Items are encoded a chunk at a time, each chunk as its own array whose
+    brackets are stripped, so nesting and indentation come out identical.
+    """
+    if indent is None:
+        encoder = json.JSONEncoder(separators=(',', ':'))
+        opening, separator, closing, strip = "[", ",", "]", 1
+    else:
+        encoder = json.JSONEncoder(indent=indent)
+        opening, separator, closing, strip = "[\n", ",\n", "\n]", 2
+    items = iter(items)
+    first = True
+
+    while True:
+        chunk = list(islice(items, chunk_size))
+        if not chunk:
+            break
+
+        # "[\n  {...},\n  {...}\n]" -> "  {...},\n  {...}"
+        body = encoder.encode(chunk)[strip:-strip]
+        f.write(opening + body if first else separator + body)
+        first = False
+
+    f.write("[]" if first else closing)
+
+
+def write_json_array(filepath: str, items: Iterable[Dict], indent: Optional[int] = DEFAULT_INDENT,
+                     transform: Optional[Callable[[Dict], Dict]] = None):
+    """
+    Stream items into a JSON array file, replacing it atomically
+    transform, if given, maps each item to the record that is written
+    """
+    tmp_path = f"{filepath}.tmp"
+    if transform is not None:
+        items = map(transform, items)
+
+    with open(tmp_path, 'w') as f:
+        dump_json_array(items, f, indent=indent)
+
+    os.replace(tmp_path, filepath)
+
+
+def _sort_key(job: Dict) -> str:
+    return job['scraped_date']
+
+
+def is_sorted_newest_first(jobs: List[Dict]) -> bool:
+    """Whether jobs are already ordered by scraped_date, newest first"""
+    return all(jobs[i]['scraped_date'] >= jobs[i + 1]['scraped_date'] for i in range(len(jobs) - 1))
+
+
+def merge_sorted_jobs(existing_jobs: Iterable[Dict], new_jobs: List[Dict]) -> Iterator[Dict]:
+    """
+    Merge a newest-first job sequence with a batch of new (unseen) jobs
+    Only the batch is sorted; the merge itself is one sequential pass.
+    """
+    batch = sorted(new_jobs, key=_sort_key, reverse=True)
+
+    # heapq.merge is stable, so ties keep existing jobs ahead of new ones
+    return heapq.merge(existing_jobs, batch, key=_sort_key, reverse=True)
+
+
+class JsonFileStore:
+    """
+    Jobs kept as one JSON array sorted by scraped_date (newest first)
+    The file is read at most once; stage() collects new jobs against the
+    in-memory id index and flush() writes the file once.
+    """
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self._jobs: Optional[List[Dict]] = None
+        self._ids: Optional[Set[str]] = None
+        self._pending: List[Dict] = []
+        self._dirty = False
+        self.transform: Optional[Callable[[Dict], Dict]] = None  # Applied to records on write
+
+    def _ensure_loaded(self):
+        if self._jobs is not None:
+            return
+
+        try:
+            with open(self.filepath, 'r') as f:
+                self._jobs = json.load(f)
+            exists = True
+        except FileNotFoundError:
+            self._jobs = []
+            exists = False
+
+        # The file is kept sorted; only re-sort it if something else wrote it out of order
+        if not is_sorted_newest_first(self._jobs):
+            self._jobs.sort(key=_sort_key, reverse=True)
+
+        self._ids = {job['id'] for job in self._jobs}
+        self._dirty = not exists
+
+    def known_ids(self) -> Set[str]:
+        """Ids already stored or staged"""
+        self._ensure_loaded()
+        return self._ids
+
+    def stage(self, jobs: List[Dict]) -> int:
+        """Queue jobs with unseen ids for the next flush and return how many were new"""
+        self._ensure_loaded()
+        new_count = 0
+
+        for job in jobs:
+            if job['id'] not in self._ids:
+                self._ids.add(job['id'])
+                self._pending.append(job)
+                new_count += 1
+
+        return new_count
+
+    def flush(self):
+        """Write staged jobs, merged into the sorted file (skipped if nothing changed)"""
+        self._ensure_loaded()
+        if not self._pending and not self._dirty:
+            return
+
+        # One merge pass instead of a full re-sort. The merged list is kept for the
+        # rest of the run (known ids, site publishing), so the whole dataset stays
+        # in memory; it shares the job dicts, so it only adds the list itself.
+        merged = []
+
+        def collected(jobs_iter):
+            for job in jobs_iter:
+                merged.append(job)
+                yield job
+
+        write_json_array(self.filepath, collected(merge_sorted_jobs(self._jobs, self._pending)),
+                         transform=self.transform)
+
+        self._jobs = merged
+        self._pending = []
+        self._dirty = False
+
+    def mark_dirty(self):
+        """Force the next flush to rewrite the file (e.g. after transform output changed)"""
+        self._dirty = True
+
+    def add(self, jobs: List[Dict]) -> int:
+        """Merge jobs into the file (skipping known ids) and return how many were new"""
+        new_count = self.stage(jobs)
+        self.flush()
+        return new_count
+
+    def replace(self, jobs: List[Dict]):
+        """Rewrite the dataset so it holds exactly these jobs (for migrations)"""
+        self._jobs = sorted(jobs, key=_sort_key, reverse=True)
+        self._ids = {job['id'] for job in self._jobs}
+        self._pending = []
+        self._dirty = True
+        self.flush()
+
+    def count(self) -> int:
+        """Number of jobs in the store (including staged ones)"""
+        self._ensure_loaded()
+        return len(self._jobs) + len(self._pending)
+
+    def iter_sorted(self) -> Iterator[Dict]:
+        """Jobs newest first (including staged ones)"""
+        self._ensure_loaded()
+        return merge_sorted_jobs(self._jobs, self._pending)
+
+    def load_sorted(self) -> List[Dict]:
+        """All jobs newest first"""
+        return list(self.iter_sorted())
+
+    def export_json(self, filepath: str):
+        """Write the sorted view to a JSON file (no-op for the store's own file)"""
+        if os.path.abspath(filepath) != os.path.abspath(self.filepath):
+            write_json_array(filepath, self.iter_sorted(), transform=self.transform)
@@ -0,0 +1,144 @@
+"""
+Single-pass persistence for a scraper run
+
+Each dataset (data/jobs_<source>.json, data/jobs_all.json) is opened once,
+its id index stays in memory for the whole run, and every output file is
+written in one flush at the end. Both scraper_main and scraper_quick use it.
+
+Jobs bound for data/jobs_all.json also pass through the near-duplicate
+index, so a posting seen on several boards is stored once with the extra
+source links attached, and are published as shards numbered from the oldest
+job (with a search index over them) too.
+"""
+
+import os
+from typing import Dict, List, Optional, Set
+from config import DEDUP_INDEX_FILE, NEAR_DUPLICATE_THRESHOLD, SHARD_DIR, SHARD_SIZE, PUBLISH_REPORT_FILE
+from .backends import open_store
+from .dedup import NearDuplicateIndex
+from .publish import PublishReport
+from .search_index import SearchIndexBuilder, SEARCH_INDEX_FILE
+from .shards import MANIFEST_FILE, publish_shards
+
+AGGREGATED_FILE = "data/jobs_all.json"
+
+
+class PersistencePipeline:
+    """Stages a run's jobs per dataset and writes everything in one flush"""
+
+    def __init__(self):
+        self._stores: Dict[str, object] = {}
+        self._published: Set[str] = set()
+        self._changed: Set[str] = set()
+        self._dedup: Optional[NearDuplicateIndex] = None
+        self.merged_duplicates = 0
+
+    def store(self, filepath: str):
+        """The (cached) store for a dataset"""
+        if filepath not in self._stores:
+            self._stores[filepath] = open_store(filepath)
+        return self._stores[filepath]
+
+    def add(self, filepath: str, jobs: List[Dict], publish: bool = False) -> int:
+        """
+        Stage jobs for a dataset and return how many are new
+        publish=True also writes the dataset's sorted JSON file on flush for
+        backends that don't store it as JSON already (the site reads it)
+        """
+        if publish:
+            self._published.add(filepath)
+        new_count = self.store(filepath).stage(jobs)
+        if new_count:
+            self._changed.add(filepath)
+        return new_count
+
+    def dedup_index(self) -> NearDuplicateIndex:
+        """The near-duplicate index for data/jobs_all.json (loaded or bootstrapped once)"""
+        if self._dedup is None:
+            store = self.store(AGGREGATED_FILE)
+            index = NearDuplicateIndex(DEDUP_INDEX_FILE, threshold=NEAR_DUPLICATE_THRESHOLD)
+
+            if not index.load():
+                # First run: index what is already stored without merging history
+                index.rebuild(store.iter_sorted())
+
+            store.transform = index.annotate
+            self._dedup = index
+        return self._dedup
+
+    def add_aggregated(self, jobs: List[Dict]) -> int:
+        """
+        Stage jobs for data/jobs_all.json and return how many are new
+        Jobs that near-duplicate a stored job from another source are linked
+        to it instead of being stored again
+        """
+        index = self.dedup_index()
+        known = self.known_ids(AGGREGATED_FILE)
+        unique = []
+
+        for job in jobs:
+            if job['id'] in known or job['id'] in index:
+                continue
+
+            canonical_id = index.find_duplicate(job)
+            if canonical_id:
+                index.link(canonical_id, job)
+                self.merged_duplicates += 1
+            else:
+                index.add(job)
+                unique.append(job)
+
+        return self.add(AGGREGATED_FILE, unique, publish=True)
+
+    def known_ids(self, filepath: str) -> Set[str]:
+        """Ids already stored (or staged) for a dataset"""
+        return self.store(filepath).known_ids()
+
+    def count(self, filepath: str) -> int:
+        """Number of jobs in a dataset, including staged ones"""
+        return self.store(filepath).count()
+
+    def flush(self):
+        """Write every dataset once, then the site's shards if jobs_all.json changed"""
+        if self._dedup is not None and self._dedup.changed:
+            self.store(AGGREGATED_FILE).mark_dirty()  # Source links may have changed
+            self._changed.add(AGGREGATED_FILE)
+
+        for filepath, store in self._stores.items():
+            store.flush()
+            if filepath in self._published:
+                store.export_json(filepath)
+
+        # A run that found nothing new leaves the site files (and data/) untouched
+        unpublished = not os.path.exists(os.path.join(SHARD_DIR, MANIFEST_FILE))
+        if AGGREGATED_FILE in self._published and (AGGREGATED_FILE in self._changed or unpublished):
+            self.publish_site_data()
+        self._changed.clear()
+
+        if self._dedup is not None:
+            self._dedup.save()
+
+    def publish_site_data(self):
+        """Write the shards of data/jobs_all.json and their search index in one pass"""
+        store = self.store(AGGREGATED_FILE)
+        jobs = store.iter_sorted()
+        if store.transform:
+            jobs = map(store.transform, jobs)
+
+        index = SearchIndexBuilder()
+        report = PublishReport()
+        manifest = publish_shards(index.collect(jobs), SHARD_DIR, SHARD_SIZE, report=report, total=store.count())
+        index.write(os.path.join(SHARD_DIR, SEARCH_INDEX_FILE), version=manifest["updated"], report=report)
+
+        report.write(PUBLISH_REPORT_FILE)
+        print(f"\nPublished {report.files} site files to {SHARD_DIR}:\n{report.summary()}")
+
+    def save_aggregated(self, new_jobs: List[Dict]):
+        """Stage the run's jobs for data/jobs_all.json, then flush every dataset"""
+        self.add_aggregated(new_jobs)
+        self.flush()
+
+        print(f"\nSaved aggregated jobs to {AGGREGATED_FILE}")
+        if self.merged_duplicates:
+            print(f"Merged {self.merged_duplicates} cross-source duplicates")
+        print(f"Total jobs in database: {self.count(AGGREGATED_FILE)}")
@@ -0,0 +1,108 @@
+"""
+Compact output for the site
+Every file the page loads is written as minified JSON, and left untouched
+when its content hasn't changed. A PublishReport adds up bytes on disk,
+bytes on the wire and encode time per format: gzip and brotli are only
+measured (GitHub Pages compresses on the fly and never serves precompressed
+siblings). Encode times only go to the printed summary (the CI log); the
+written report holds byte counts alone, so unchanged data produces an
+identical file.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import time
+from typing import Dict, Optional
+
+try:
+    import brotli
+except ImportError:  # Optional dependency - the report just leaves brotli out
+    brotli = None
+
+PRETTY = "pretty"
+MINIFIED = "minified"
+GZIP = "gzip"
+BROTLI = "brotli"
+
+
+class PublishReport:
+    """Size and encode time per format, summed over the published files"""
+
+    def __init__(self):
+        self.files = 0
+        self.formats: Dict[str, Dict[str, int]] = {}
+        self.encode_ms: Dict[str, float] = {}  # Printed, never written: timings differ on every run
+
+    def record(self, fmt: str, size: int, seconds: float = 0.0, written: bool = True):
+        """Add one encoded file (written=False for formats only measured for comparison)"""
+        entry = self.formats.setdefault(fmt, {"disk_bytes": 0, "wire_bytes": 0})
+        entry["disk_bytes"] += size if written else 0
+        entry["wire_bytes"] += size
+        self.encode_ms[fmt] = self.encode_ms.get(fmt, 0.0) + seconds * 1000
+
+    def to_dict(self) -> Dict:
+        return {"files": self.files, "formats": self.formats}
+
+    def write(self, filepath: str):
+        raw = json.dumps(self.to_dict(), indent=2).encode()
+        if not _unchanged(filepath, raw):
+            _write_bytes(filepath, raw)
+
+    def summary(self) -> str:
+        """One line per format, e.g. "gzip: 41.2 KB on the wire, 0.0 KB on disk, 3.1 ms" """
+        return "\n".join(f"  {fmt}: {entry['wire_bytes'] / 1024:.1f} KB on the wire, "
+                         f"{entry['disk_bytes'] / 1024:.1f} KB on disk, {self.encode_ms[fmt]:.1f} ms"
+                         for fmt, entry in self.formats.items())
+
+
+def _write_bytes(filepath: str, data: bytes):
+    """Replace a file atomically"""
+    tmp_path = f"{filepath}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, filepath)
+
+
+def _unchanged(filepath: str, data: bytes) -> bool:
+    """Whether the file already holds exactly these bytes"""
+    try:
+        with open(filepath, 'rb') as f:
+            return f.read() == data
+    except FileNotFoundError:
+        return False
+
+
+def publish_json(filepath: str, data, report: Optional[PublishReport] = None) -> str:
+    """
+    Write data as minified JSON
+    A file whose content hasn't changed is left untouched. Returns a short
+    content hash, for cache-busting URLs.
+    """
+    start = time.perf_counter()
+    raw = json.dumps(data, separators=(',', ':')).encode()
+    encoded = time.perf_counter() - start
+    if not _unchanged(filepath, raw):
+        _write_bytes(filepath, raw)
+
+    if report is not None:
+        # Only the minified file is published; the rest show what each format would cost
+        report.files += 1
+        report.record(MINIFIED, len(raw), encoded)
+
+        start = time.perf_counter()
+        pretty = json.dumps(data, indent=2).encode()
+        report.record(PRETTY, len(pretty), time.perf_counter() - start, written=False)
+
+        # mtime=0 keeps the gzip size independent of when the report is made
+        start = time.perf_counter()
+        gzipped = gzip.compress(raw, compresslevel=9, mtime=0)
+        report.record(GZIP, len(gzipped), encoded + time.perf_counter() - start, written=False)
+
+        if brotli is not None:
+            start = time.perf_counter()
+            brotlied = brotli.compress(raw)
+            report.record(BROTLI, len(brotlied), encoded + time.perf_counter() - start, written=False)
+
+    return hashlib.sha1(raw).hexdigest()[:10]
@@ -0,0 +1,74 @@
+"""
+Inverted search index for the site
+Built while the shards are written: maps every token of a job's title,
+company, location and description to the job's position in the
+newest-first order (the manifest's shard counts map it to a shard). Tokens are
+sorted so the page can answer prefix searches with a binary search, and
+postings are delta-encoded to keep the file small.
+"""
+
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional
+from .publish import PublishReport, publish_json
+
+SEARCH_INDEX_FILE = "search_index.json"
+SEARCH_FIELDS = ("title", "company", "location", "description")
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens (the page splits queries the same way)"""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def delta_encode(positions: List[int]) -> List[int]:
+    """Ascending positions as gaps: [3, 5, 9] -> [3, 2, 4]"""
+    return [position - previous for previous, position in zip([0] + positions, positions)]
+
+
+class SearchIndexBuilder:
+    """Collects postings for jobs in the order they are published"""
+
+    def __init__(self):
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        self._sources: Dict[str, List[int]] = defaultdict(list)
+        self.count = 0
+
+    def add(self, job: Dict):
+        """Index the next job (its position is the number of jobs added before it)"""
+        position = self.count
+        self.count += 1
+
+        text = " ".join(job.get(field) or "" for field in SEARCH_FIELDS)
+        for token in set(tokenize(text)):
+            self._postings[token].append(position)
+
+        # Merged duplicates are listed under every source they were found on
+        sources = {job.get("source", "")} | {link["source"] for link in job.get("urls", [])}
+        for source in sources:
+            if source:
+                self._sources[source].append(position)
+
+    def collect(self, jobs: Iterable[Dict]) -> Iterator[Dict]:
+        """Pass jobs through unchanged, indexing each one on the way"""
+        for job in jobs:
+            self.add(job)
+            yield job
+
+    def to_dict(self, version: str = "") -> Dict:
+        """The index as written: sorted tokens, gap-encoded postings and source facets"""
+        tokens = sorted(self._postings)
+        return {
+            "version": version,
+            "total": self.count,
+            "tokens": tokens,
+            "postings": [delta_encode(self._postings[token]) for token in tokens],
+            "facets": {"source": {source: delta_encode(positions)
+                                  for source, positions in sorted(self._sources.items())}},
+        }
+
+    def write(self, filepath: str, version: str = "", report: Optional[PublishReport] = None):
+        """Publish the index (minified)"""
+        publish_json(filepath, self.to_dict(version), report)
@@ -0,0 +1,259 @@
+"""
+Append-only segmented job store
+
+Each run writes only its new jobs as one JSON-lines segment (sorted newest
+first) and records it in a small manifest. Readers merge the segments into
+the sorted view the frontend expects. A background compaction step folds
+segments together once there are too many of them.
+
+Layout of a store directory:
+    manifest.json          - segment list, totals and counters
+    segment-000001.jsonl   - one job per line, newest first
+    ids.txt                - append-only list of every stored job id
+"""
+
+import heapq
+import json
+import os
+import threading
+from typing import Callable, Dict, IO, Iterator, List, Optional, Set
+from .json_store import merge_sorted_jobs, write_json_array
+
+MANIFEST_FILE = "manifest.json"
+IDS_FILE = "ids.txt"
+
+
+def _sort_key(job: Dict) -> str:
+    return job['scraped_date']
+
+
+class SegmentStore:
+    """Jobs stored as append-only JSON-lines segments plus a manifest"""
+
+    def __init__(self, directory: str, max_segments: int = 8):
+        self.directory = directory
+        self.max_segments = max_segments
+        self._lock = threading.Lock()
+        self._ids: Optional[Set[str]] = None
+        self._compaction: Optional[threading.Thread] = None
+        self._pending: List[Dict] = []
+        self.transform: Optional[Callable[[Dict], Dict]] = None  # Applied to exported records
+
+    # ------------------------------------------------------------------
+    # Manifest and id index
+    # ------------------------------------------------------------------
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _read_manifest(self) -> Dict:
+        try:
+            with open(self._path(MANIFEST_FILE), 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"segments": [], "total": 0, "next_segment": 1}
+
+    def _write_manifest(self, manifest: Dict):
+        tmp_path = self._path(MANIFEST_FILE + ".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, self._path(MANIFEST_FILE))
+
+    def _load_ids(self, manifest: Dict) -> Set[str]:
+        """
+        Load the id index, rebuilding it from the segments if it is out of
+        step with the manifest (e.g. a run died between the two writes)
+        """
+        if self._ids is not None:
+            return self._ids
+
+        try:
+            with open(self._path(IDS_FILE), 'r') as f:
+                ids = {line.strip() for line in f if line.strip()}
+        except FileNotFoundError:
+            ids = set()
+
+        if len(ids) != manifest["total"]:
+            ids = {job['id'] for job in self._iter_segments(manifest["segments"])}
+            with open(self._path(IDS_FILE), 'w') as f:
+                f.writelines(f"{job_id}\n" for job_id in sorted(ids))
+
+        self._ids = ids
+        return ids
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def _write_segment(self, manifest: Dict, jobs: Iterator[Dict]) -> Dict:
+        """Write jobs (already newest first) to the next segment file"""
+        name = f"segment-{manifest['next_segment']:06d}.jsonl"
+        manifest["next_segment"] += 1
+
+        count = 0
+        newest = oldest = ""
+        tmp_path = self._path(name + ".tmp")
+
+        with open(tmp_path, 'w') as f:
+            for job in jobs:
+                f.write(json.dumps(job) + "\n")
+                if count == 0:
+                    newest = job['scraped_date']
+                oldest = job['scraped_date']
+                count += 1
+
+        os.replace(tmp_path, self._path(name))
+        return {"file": name, "count": count, "newest": newest, "oldest": oldest}
+
+    def known_ids(self) -> Set[str]:
+        """Ids already stored or staged"""
+        with self._lock:
+            return self._load_ids(self._read_manifest())
+
+    def stage(self, jobs: List[Dict]) -> int:
+        """Queue jobs with unseen ids for the next flush and return how many were new"""
+        with self._lock:
+            ids = self._load_ids(self._read_manifest())
+            new_count = 0
+
+            for job in jobs:
+                if job['id'] not in ids:
+                    ids.add(job['id'])
+                    self._pending.append(job)
+                    new_count += 1
+
+            return new_count
+
+    def flush(self):
+        """Append staged jobs as one new segment"""
+        with self._lock:
+            if not self._pending:
+                return
+
+            os.makedirs(self.directory, exist_ok=True)
+            manifest = self._read_manifest()
+            new_jobs = sorted(self._pending, key=_sort_key, reverse=True)
+
+            segment = self._write_segment(manifest, iter(new_jobs))
+            manifest["segments"].append(segment)
+            manifest["total"] += segment["count"]
+            self._write_manifest(manifest)
+            self._pending = []
+
+            # The manifest is the source of truth; ids.txt is rebuilt if this append is lost
+            with open(self._path(IDS_FILE), 'a') as f:
+                f.writelines(f"{job['id']}\n" for job in new_jobs)
+
+            needs_compaction = len(manifest["segments"]) > self.max_segments
+
+        if needs_compaction:
+            self.compact_in_background()
+
+    def add(self, jobs: List[Dict]) -> int:
+        """Append jobs with unseen ids as a new segment and return how many were new"""
+        new_count = self.stage(jobs)
+        self.flush()
+        return new_count
+
+    def replace(self, jobs: List[Dict]):
+        """Rewrite the dataset as one segment holding exactly these jobs (for migrations)"""
+        self.wait_for_compaction()
+
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            manifest = self._read_manifest()
+            old_files = [segment["file"] for segment in manifest["segments"]]
+
+            segment = self._write_segment(manifest, iter(sorted(jobs, key=_sort_key, reverse=True)))
+            manifest["segments"] = [segment]
+            manifest["total"] = segment["count"]
+            self._write_manifest(manifest)
+
+            self._ids = {job['id'] for job in jobs}
+            self._pending = []
+            with open(self._path(IDS_FILE), 'w') as f:
+                f.writelines(f"{job_id}\n" for job_id in sorted(self._ids))
+
+        for name in old_files:
+            os.remove(self._path(name))
+
+    # ------------------------------------------------------------------
+    # Compaction
+    # ------------------------------------------------------------------
+
+    def compact(self):
+        """Merge all current segments into one sorted segment"""
+        with self._lock:
+            manifest = self._read_manifest()
+            segments = list(manifest["segments"])
+            if len(segments) < 2:
+                return
+            # Reserve the merged segment's number so concurrent adds don't reuse it
+            merged_number = manifest["next_segment"]
+            manifest["next_segment"] += 1
+            self._write_manifest(manifest)
+
+        # The slow part runs without the lock, so adds can keep appending segments
+        merged = self._write_segment({"next_segment": merged_number}, self._iter_segments(segments))
+        merged_files = {segment["file"] for segment in segments}
+
+        with self._lock:
+            manifest = self._read_manifest()
+            manifest["segments"] = [merged] + [
+                segment for segment in manifest["segments"] if segment["file"] not in merged_files
+            ]
+            self._write_manifest(manifest)
+
+        for name in merged_files:
+            os.remove(self._path(name))
+
+    def compact_in_background(self) -> threading.Thread:
+        """Start compaction on a background thread (at most one at a time)"""
+        if self._compaction is None or not self._compaction.is_alive():
+            self._compaction = threading.Thread(target=self.compact, name=f"compact-{self.directory}")
+            self._compaction.start()
+        return self._compaction
+
+    def wait_for_compaction(self):
+        """Block until a running background compaction finishes"""
+        if self._compaction is not None:
+            self._compaction.join()
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _iter_lines(f: IO[str]) -> Iterator[Dict]:
+        with f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def _iter_segments(self, segments: List[Dict]) -> Iterator[Dict]:
+        """
+        Merge already-sorted segments into one newest-first stream
+        Files are opened up front so a later compaction can't remove them mid-read
+        """
+        files = [open(self._path(segment["file"]), 'r') for segment in segments]
+        return heapq.merge(*[self._iter_lines(f) for f in files], key=_sort_key, reverse=True)
+
+    def count(self) -> int:
+        """Number of jobs in the store (including staged ones)"""
+        return self._read_manifest()["total"] + len(self._pending)
+
+    def iter_sorted(self) -> Iterator[Dict]:
+        """Jobs newest first (including staged ones), streamed from the segments"""
+        with self._lock:
+            return merge_sorted_jobs(self._iter_segments(self._read_manifest()["segments"]), list(self._pending))
+
+    def load_sorted(self) -> List[Dict]:
+        """All jobs newest first"""
+        return list(self.iter_sorted())
+
+    def export_json(self, filepath: str):
+        """Write the sorted view as a JSON array (e.g. data/jobs_all.json for the site)"""
+        write_json_array(filepath, self.iter_sorted(), transform=self.transform)
+
+    def mark_dirty(self):
+        """No-op: exports are always rewritten from the segments"""
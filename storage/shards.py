@@ -0,0 +1,102 @@
+"""
+Sharded output of data/jobs_all.json for the site
+Jobs are written in fixed-size shards counted from the oldest job
+(jobs_000.json holds the oldest), so a run that adds jobs only changes the
+newest, partly filled shard; older shard files keep their bytes and stay
+in browser caches. manifest.json lists the shards newest first, so the page
+can render the newest right away and fetch older ones only when the user
+scrolls to them.
+Shards hold only what the list shows; descriptions and links go to a
+details_NNN.json per shard, fetched when a job is expanded.
+Every file is minified (see publish.py).
+"""
+
+import glob
+import os
+from itertools import islice
+from math import ceil
+from typing import Dict, Iterable, Optional, Tuple
+from .publish import PublishReport, publish_json
+
+MANIFEST_FILE = "manifest.json"
+
+# Fields the job list renders; everything else is detail
+LIST_FIELDS = ("id", "title", "company", "location", "posted_date", "scraped_date", "source")
+
+
+def shard_name(index: int) -> str:
+    return f"jobs_{index:03d}.json"
+
+
+def details_name(index: int) -> str:
+    return f"details_{index:03d}.json"
+
+
+def split_record(job: Dict) -> Tuple[Dict, Dict]:
+    """A job's list entry and its detail (description, url, urls, ...)"""
+    summary = {field: job.get(field, "") for field in LIST_FIELDS}
+    if job.get("urls"):
+        summary["sources"] = [link["source"] for link in job["urls"]]  # For the source filter
+    detail = {field: value for field, value in job.items() if field not in LIST_FIELDS}
+    return summary, detail
+
+
+def publish_shards(jobs: Iterable[Dict], directory: str, shard_size: int = 100,
+                   report: Optional[PublishReport] = None, total: Optional[int] = None) -> Dict:
+    """
+    Write newest-first jobs as shards of `shard_size` plus a manifest
+    `total` is the number of jobs (counted from `jobs` if not given); it
+    sets how many go into the newest shard, so every older shard is full and
+    keeps its boundaries as jobs are added. Each shard gets a list file and
+    a details file keyed by job id, with a content version the page uses
+    for caching. Only one shard is held in memory at a time. Shards left
+    over from a longer earlier run are removed. Returns the manifest.
+    """
+    os.makedirs(directory, exist_ok=True)
+    if total is None:
+        jobs = list(jobs)
+        total = len(jobs)
+    jobs = iter(jobs)
+    count = ceil(total / shard_size)
+    shards = []
+
+    # Newest first: the partly filled shard, then full ones down to jobs_000.json
+    for number in range(count - 1, -1, -1):
+        shard = list(islice(jobs, total - number * shard_size if number == count - 1 else shard_size))
+        if not shard:
+            break
+
+        name = shard_name(number)
+        details = details_name(number)
+        summaries, detail_records = zip(*(split_record(job) for job in shard))
+        version = publish_json(os.path.join(directory, name), list(summaries), report)
+        details_version = publish_json(os.path.join(directory, details),
+                                       {job["id"]: detail for job, detail in zip(shard, detail_records)}, report)
+        shards.append({
+            "file": name,
+            "details": details,
+            "count": len(shard),
+            "newest": shard[0]["scraped_date"],
+            "oldest": shard[-1]["scraped_date"],
+            "version": version,
+            "details_version": details_version,
+        })
+
+    current = {shard[key] for shard in shards for key in ("file", "details")}
+    stale = [path for path in glob.glob(os.path.join(directory, "jobs_*.json")) + glob.glob(os.path.join(directory, "details_*.json"))
+             if os.path.basename(path) not in current]
+    # Earlier versions wrote .gz/.br copies next to every file; nothing serves them
+    stale += glob.glob(os.path.join(directory, "*.json.gz")) + glob.glob(os.path.join(directory, "*.json.br"))
+    for path in stale:
+        os.remove(path)
+
+    # No wall-clock timestamp, so an unchanged dataset produces identical files
+    manifest = {
+        "total": sum(shard["count"] for shard in shards),
+        "shard_size": shard_size,
+        "updated": shards[0]["newest"] if shards else "",
+        "shards": shards,
+    }
+
+    publish_json(os.path.join(directory, MANIFEST_FILE), manifest, report)
+    return manifest
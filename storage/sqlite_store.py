@@ -0,0 +1,189 @@
+"""
+SQLite job store
+
+All datasets share one database table keyed by job id, with indexes on
+source, company and scraped_date. Each add() is one batched transaction with
+upsert semantics. A dataset name (jobs_linkedin, jobs_all, ...) is kept per
+job so the per-source views can still be exported.
+"""
+
+import os
+import sqlite3
+import threading
+from typing import Callable, Dict, Iterator, List, Optional, Set
+from .json_store import write_json_array
+
+QUERY_BATCH_SIZE = 500  # Rows fetched at a time when streaming a query
+
+COLUMNS = ["id", "title", "company", "location", "url", "description",
+           "posted_date", "scraped_date", "source"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    company TEXT NOT NULL,
+    location TEXT NOT NULL,
+    url TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    posted_date TEXT NOT NULL DEFAULT '',
+    scraped_date TEXT NOT NULL,
+    source TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS dataset_jobs (
+    dataset TEXT NOT NULL,
+    job_id TEXT NOT NULL REFERENCES jobs(id),
+    PRIMARY KEY (dataset, job_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company);
+CREATE INDEX IF NOT EXISTS idx_jobs_scraped_date ON jobs(scraped_date);
+"""
+
+# First sighting wins for scraped_date (like the JSON files); other fields take the latest values
+UPSERT_SQL = f"""
+INSERT INTO jobs ({", ".join(COLUMNS)}) VALUES ({", ".join("?" for _ in COLUMNS)})
+ON CONFLICT(id) DO UPDATE SET
+    title = excluded.title,
+    company = excluded.company,
+    location = excluded.location,
+    url = excluded.url,
+    description = CASE WHEN excluded.description != '' THEN excluded.description ELSE jobs.description END,
+    posted_date = excluded.posted_date,
+    source = excluded.source
+"""
+
+
+class SqliteStore:
+    """One dataset's view of the shared SQLite job database"""
+
+    # One connection per database file, shared by every dataset view
+    _connections: Dict[str, sqlite3.Connection] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, db_path: str, dataset: str):
+        self.db_path = db_path
+        self.dataset = dataset
+        self._ids: Optional[Set[str]] = None
+        self._pending: List[Dict] = []
+        self.transform: Optional[Callable[[Dict], Dict]] = None  # Applied to exported records
+
+    def _connect(self) -> sqlite3.Connection:
+        with SqliteStore._lock:
+            conn = SqliteStore._connections.get(self.db_path)
+            if conn is None:
+                os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+                conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                conn.row_factory = sqlite3.Row
+                conn.executescript(SCHEMA)
+                SqliteStore._connections[self.db_path] = conn
+            return conn
+
+    def known_ids(self) -> Set[str]:
+        """Ids already in this dataset or staged for it"""
+        if self._ids is None:
+            conn = self._connect()
+            with SqliteStore._lock:
+                rows = conn.execute("SELECT job_id FROM dataset_jobs WHERE dataset = ?", (self.dataset,)).fetchall()
+            self._ids = {row[0] for row in rows}
+        return self._ids
+
+    def stage(self, jobs: List[Dict]) -> int:
+        """Queue jobs for the next flush and return how many are new to this dataset"""
+        ids = self.known_ids()
+        new_count = 0
+
+        for job in jobs:
+            if job['id'] not in ids:
+                ids.add(job['id'])
+                new_count += 1
+            # Known jobs are still upserted so their fields stay current
+            self._pending.append(job)
+
+        return new_count
+
+    def flush(self):
+        """Upsert staged jobs in one transaction"""
+        if not self._pending:
+            return
+
+        conn = self._connect()
+        rows = [tuple(job.get(column, "") for column in COLUMNS) for job in self._pending]
+
+        with SqliteStore._lock, conn:
+            conn.executemany(UPSERT_SQL, rows)
+            conn.executemany(
+                "INSERT OR IGNORE INTO dataset_jobs (dataset, job_id) VALUES (?, ?)",
+                [(self.dataset, job['id']) for job in self._pending]
+            )
+
+        self._pending = []
+
+    def add(self, jobs: List[Dict]) -> int:
+        """Upsert jobs in one transaction and return how many are new to this dataset"""
+        new_count = self.stage(jobs)
+        self.flush()
+        return new_count
+
+    def replace(self, jobs: List[Dict]):
+        """Rewrite the dataset so it holds exactly these jobs (for migrations)"""
+        conn = self._connect()
+        with SqliteStore._lock, conn:
+            conn.execute("DELETE FROM dataset_jobs WHERE dataset = ?", (self.dataset,))
+            # Jobs no other dataset references would otherwise linger forever
+            conn.execute("DELETE FROM jobs WHERE id NOT IN (SELECT job_id FROM dataset_jobs)")
+
+        self._ids = set()
+        self._pending = []
+        self.add(jobs)
+
+    def count(self) -> int:
+        """Number of jobs in this dataset (including staged ones)"""
+        return len(self.known_ids())
+
+    def query(self, where: str = "", params: tuple = (), limit: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Jobs in this dataset, newest first, optionally narrowed by a SQL condition
+        e.g. store.query("jobs.source = ?", ("LinkedIn",))
+        """
+        sql = (f"SELECT {', '.join('jobs.' + column for column in COLUMNS)} FROM jobs "
+               "JOIN dataset_jobs ON dataset_jobs.job_id = jobs.id "
+               "WHERE dataset_jobs.dataset = ?")
+        if where:
+            sql += f" AND ({where})"
+        # rowid breaks ties in insertion order, matching the JSON files
+        sql += " ORDER BY jobs.scraped_date DESC, jobs.rowid"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+
+        conn = self._connect()
+        with SqliteStore._lock:
+            cursor = conn.execute(sql, (self.dataset,) + tuple(params))
+
+        while True:
+            with SqliteStore._lock:
+                rows = cursor.fetchmany(QUERY_BATCH_SIZE)
+            if not rows:
+                return
+            for row in rows:
+                yield dict(row)
+
+    def iter_sorted(self) -> Iterator[Dict]:
+        """
+        Jobs newest first (including staged ones)
+        Staged jobs are flushed first: stage() also queues upserts of stored
+        ids, and only the database knows how they merge with the stored rows
+        """
+        self.flush()
+        return self.query()
+
+    def load_sorted(self) -> List[Dict]:
+        """All jobs newest first"""
+        return list(self.iter_sorted())
+
+    def export_json(self, filepath: str, where: str = "", params: tuple = ()):
+        """Write the query result as the static JSON the site reads"""
+        write_json_array(filepath, self.query(where, params), transform=self.transform)
+
+    def mark_dirty(self):
+        """No-op: exports are always rewritten from the database"""
@@ -26,6 +26,8 @@ def test_config():
         assert len(config.JOB_KEYWORDS) > 0, "No job keywords defined"
         assert len(config.ROLE_KEYWORDS) > 0, "No role keywords defined"
         assert len(config.INTERNSHIP_KEYWORDS) > 0, "No internship keywords defined"
+        assert config.MAX_JOBS_PER_SOURCE, "Paged sources are uncapped"
+        assert config.MAX_JOBS_BY_SOURCE.get("Simplify", config.MAX_JOBS_PER_SOURCE) is None, "Simplify feed capped"
 
         print(f"✓ Configuration valid")
         print(f"  - {len(config.JOB_KEYWORDS)} job keywords")
@@ -88,6 +90,636 @@ def test_job_class():
         print(f"✗ Job class error: {e}")
         return False
 
+def test_keyword_matcher():
+    """Test that each source keeps its own relevance keywords"""
+    print("\nTesting keyword matcher...")
+    try:
+        from scrapers.keyword_matcher import DEFAULT_MATCHER
+
+        for source in ("simplify", "builtin", "company"):
+            assert DEFAULT_MATCHER.matches("FPGA Design Intern", f"relevance_{source}"), f"{source} missed FPGA"
+        assert not DEFAULT_MATCHER.matches("Performance Marketing Intern", "relevance_simplify"), "Simplify matched 'rf'"
+        assert not DEFAULT_MATCHER.matches("Performance Marketing Intern", "relevance_builtin"), "Built In matched 'rf'"
+        assert not DEFAULT_MATCHER.matches("Chip Design Intern", "relevance_simplify"), "Simplify widened to 'chip'"
+        assert DEFAULT_MATCHER.matches("Chip Design Intern", "relevance_builtin"), "Built In lost 'chip'"
+
+        print(f"✓ Keyword matcher working correctly")
+        return True
+    except Exception as e:
+        print(f"✗ Keyword matcher error: {e}")
+        return False
+
+def test_url_canonical():
+    """Test that tracking params don't change job ids"""
+    print("\nTesting URL canonicalization...")
+    try:
+        from scrapers.base_scraper import Job
+        from scrapers.url_canonical import canonicalize_url
+
+        first = Job("Embedded Intern", "Skydio", "CA", "https://www.linkedin.com/jobs/view/embedded-intern-at-skydio-4315017655?position=3&refId=abc&trackingId=x", source="LinkedIn")
+        again = Job("Embedded Intern", "Skydio", "CA", "https://ca.linkedin.com/jobs/view/embedded-intern-at-skydio-4315017655?position=7&refId=def&trackingId=y", source="LinkedIn")
+
+        assert first._url is None, "URL parsed before anything used it"
+        assert first.url == "https://www.linkedin.com/jobs/view/4315017655", f"Unexpected URL: {first.url}"
+        assert again.id == first.id and again.to_dict()["url"] == first.url, "Tracking params changed the job id"
+        assert canonicalize_url("https://www.indeed.com/rc/clk?jk=abc123&fccid=z", "Indeed") == "https://www.indeed.com/viewjob?jk=abc123"
+        assert canonicalize_url("https://Jobs.Example.com/jobs/1?gh_jid=7&utm_source=Simplify#apply", "Simplify") == "https://jobs.example.com/jobs/1?gh_jid=7"
+
+        print(f"✓ URL canonicalization working correctly")
+        return True
+    except Exception as e:
+        print(f"✗ URL canonicalization error: {e}")
+        return False
+
+def test_html_parsing():
+    """Test that card parsing finds multi-class cards and falls back in order"""
+    print("\nTesting HTML card parsing...")
+    try:
+        from scrapers.html_parsing import CardSelector, PARSER, find_cards
+
+        page = b"""<html><body><nav><a href="/x">Nav</a></nav>
+            <div class="base-card job-search-card"><h3>FPGA Intern</h3></div>
+            <div class="base-card-extra"><h3>Not a card</h3></div>
+            <article><h3>Hardware Intern</h3></article></body></html>"""
+
+        cards = find_cards(page, CardSelector('div', 'base-card'))
+        assert [card.h3.text for card in cards] == ["FPGA Intern"], "Wrong cards matched"
+
+        fallback = find_cards(page, CardSelector('li', 'job'), CardSelector('article'))
+        assert [card.h3.text for card in fallback] == ["Hardware Intern"], "Fallback selector not used"
+
+        print(f"✓ HTML card parsing working correctly ({PARSER})")
+        return True
+    except Exception as e:
+        print(f"✗ HTML card parsing error: {e}")
+        return False
+
+def test_query_planner():
+    """Test packing keywords into OR queries and mapping results back"""
+    print("\nTesting query planner...")
+    try:
+        from config import JOB_KEYWORDS
+        from scrapers.base_scraper import Job
+        from scrapers.query_planner import plan_queries
+
+        queries = plan_queries(JOB_KEYWORDS, max_queries=3, operator="OR", max_length=120)
+        assert len(queries) <= 3 and all(len(q.text) <= 120 for q in queries), "Plan over budget"
+        assert sorted(k for q in queries for k in q.keywords) == sorted(JOB_KEYWORDS), "Keywords not all covered"
+        assert '"circuit design" OR' in queries[0].text, f"Phrases not quoted: {queries[0].text}"
+
+        # Without OR, consecutive runs rotate through every keyword
+        covered = {q.text for run in range(4) for q in plan_queries(JOB_KEYWORDS, max_queries=3, rotation=run)}
+        assert covered == set(JOB_KEYWORDS), "Rotation skipped keywords"
+
+        query = plan_queries(["FPGA", "VLSI"], max_queries=1, operator="OR")[0]
+        fpga = Job("FPGA Design Intern", "Acme", "Remote", "https://acme.com/1", "", source="Test")
+        other = Job("Hardware Intern", "Acme", "Remote", "https://acme.com/2", "", source="Test")
+        assigned = query.assign([fpga, other])
+        assert assigned == {"FPGA": [fpga, other], "VLSI": [other]}, f"Unexpected assignment: {assigned}"
+
+        print(f"✓ Query planner working correctly")
+        return True
+    except Exception as e:
+        print(f"✗ Query planner error: {e}")
+        return False
+
+def test_linkedin_pagination():
+    """Test that LinkedIn crawls until it reaches a page of known jobs"""
+    print("\nTesting LinkedIn pagination...")
+    try:
+        from config import LINKEDIN_PAGE_SIZE
+        from scrapers.linkedin_scraper import LinkedInScraper
+        from scrapers.query_planner import SearchQuery
+
+        def page(start, count):
+            cards = "".join(f"""<div class="base-card"><h3 class="base-search-card__title">Hardware Intern {i}</h3>
+                <a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/{i}"></a></div>"""
+                            for i in range(start, start + count))
+            return scraper.find_cards(cards.encode())
+
+        scraper = LinkedInScraper()
+        pages = [page(0, LINKEDIN_PAGE_SIZE), page(LINKEDIN_PAGE_SIZE, LINKEDIN_PAGE_SIZE), page(100, 3)]
+        query = SearchQuery("hardware intern", ["hardware intern"])
+        fetched = []
+        scraper._fetch_page = lambda keyword, location, number, *args: fetched.append(number) or pages[number]
+
+        jobs = scraper._scrape_query(query, "United States")
+        assert fetched == [0, 1, 2] and len(jobs) == 2 * LINKEDIN_PAGE_SIZE + 3, "Did not crawl to the short page"
+
+        # Once the first page is all known there is nothing left to catch up on
+        scraper.known_ids = {job.id for job in jobs}
+        fetched.clear()
+        assert len(scraper._scrape_query(query, "United States")) == LINKEDIN_PAGE_SIZE
+        assert fetched == [0], f"Fetched {fetched} after reaching known jobs"
+
+        # Off-topic cards are filtered out before saving, so they never become known
+        off_topic = scraper.find_cards(b"""<div class="base-card"><h3 class="base-search-card__title">Marketing Intern</h3>
+            <a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/999"></a></div>""")
+        pages = [cards + off_topic for cards in pages]
+        fetched.clear()
+        scraper._scrape_query(query, "United States")
+        assert fetched == [0], f"Off-topic card kept the crawl going: fetched {fetched}"
+        pages = [cards[:-1] for cards in pages]
+
+        # A query packing two keywords may read twice as many pages
+        from config import LINKEDIN_MAX_PAGES
+        packed = SearchQuery('"hardware intern" OR FPGA', ["hardware intern", "FPGA"])
+        fetched.clear()
+        scraper.known_ids = set()
+        scraper._fetch_page = lambda keyword, location, number, *args: fetched.append(number) or page(1000 + number * LINKEDIN_PAGE_SIZE, LINKEDIN_PAGE_SIZE)
+        scraper._scrape_query(packed, "United States")
+        assert len(fetched) == 2 * LINKEDIN_MAX_PAGES, f"Packed query read {len(fetched)} pages"
+
+        print(f"✓ LinkedIn pagination working correctly")
+        return True
+    except Exception as e:
+        print(f"✗ LinkedIn pagination error: {e}")
+        return False
+
+def test_watermarks():
+    """Test per-keyword crawl watermarks and the date windows they produce"""
+    print("\nTesting crawl watermarks...")
+    try:
+        import tempfile
+        from datetime import datetime, timedelta
+        from scrapers.watermarks import Watermarks, indeed_fromage, linkedin_time_range
+
+        with tempfile.TemporaryDirectory() as tmp:
+            marks = Watermarks(os.path.join(tmp, "watermarks.json"), overlap_hours=6)
+            now = datetime(2026, 1, 1, 12)
+
+            assert marks.window_hours("Indeed", "fpga intern", max_hours=168, now=now) == 168, "First crawl not full window"
+            marks.advance("Indeed", "fpga intern", ["2025-12-30", "2025-12-31", ""], now=now - timedelta(hours=6))
+            hours = marks.window_hours("Indeed", "fpga intern", max_hours=168, now=now)
+            assert hours == 12, f"Expected 12h window, got {hours}"
+            assert indeed_fromage(hours) == "1" and linkedin_time_range(hours) == "r43200"
+            assert indeed_fromage(168) == "7" and linkedin_time_range(168) == "r604800"
+
+            marks.save()
+            reloaded = Watermarks(marks.filepath)
+            assert reloaded.get("Indeed", "fpga intern")["newest_posted"] == "2025-12-31", "Newest date not kept"
+
+            reloaded.reset("Indeed")
+            assert reloaded.window_hours("Indeed", "fpga intern", max_hours=168, now=now) == 168, "Reset ignored"
+
+            # A page without cards (block/interstitial) must not narrow the next window
+            from types import SimpleNamespace
+            from scrapers.indeed_scraper import IndeedScraper
+            from scrapers.query_planner import SearchQuery
+
+            scraper = IndeedScraper()
+            scraper.watermarks = reloaded
+            query = SearchQuery("fpga intern", ["fpga intern"])
+            card = b'<div class="job_seen_beacon"><h2 class="jobTitle"><a href="/viewjob?jk=1">FPGA Intern</a></h2></div>'
+            for content, advanced in ((b"<html>Just a moment...</html>", False), (card, True)):
+                scraper.fetch = lambda url, **kwargs: SimpleNamespace(status_code=200, content=content,
+                                                                      raise_for_status=lambda: None)
+                scraper._scrape_query(query, "United States")
+                assert bool(reloaded.get("Indeed", "fpga intern")) == advanced, f"Advanced={not advanced} on {content[:30]}"
+
+            # LinkedIn's 999 authwall doesn't raise in raise_for_status(); it must not advance either
+            from scrapers.linkedin_scraper import LinkedInScraper
+            scraper = LinkedInScraper()
+            scraper.watermarks = reloaded
+            authwall = b'<html><a href="https://www.linkedin.com/authwall">Sign in</a></html>'
+            for status, content in ((999, authwall), (200, authwall), (200, b"<html></html>")):
+                scraper.fetch = lambda url, **kwargs: SimpleNamespace(status_code=status, content=content,
+                                                                      raise_for_status=lambda: None)
+                scraper._scrape_query(query, "United States")
+                assert not reloaded.get("LinkedIn", "fpga intern"), f"Advanced on a {status} block/empty page"
+
+        print(f"✓ Crawl watermarks working correctly")
+        return True
+    except Exception as e:
+        print(f"✗ Crawl watermarks error: {e}")
+        return False
+
+def test_company_profiles():
+    """Test that CompanyScraper learns and reuses each company's selectors"""
+    print("\nTesting company selector profiles...")
+    try:
+        import tempfile
+        from scrapers.company_scraper import CompanyScraper
+        from scrapers.company_profiles import CompanyProfiles
+
+        page = b"""<ul><li class="job"><h3><a href="/job/1">Hardware Engineering Intern</a></h3>
+            <span class="job-location">Austin, TX</span></li></ul>"""
+
+        with tempfile.TemporaryDirectory() as directory:
+            scraper = CompanyScraper()
+            scraper.profiles = CompanyProfiles(os.path.join(directory, "profiles.json"))
+
+            jobs = scraper._parse_company_page("Acme", "https://acme.com/search", page)
+            assert [job.location for job in jobs] == ["Austin, TX"], "Cascade did not find the card"
+            profile = scraper.profiles.get("Acme")
+            assert profile == {"card": "li.job", "title": "h3", "location": "span.job-location"}, f"Unexpected profile: {profile}"
+
+            # A stale profile falls back to the cascade and is corrected
+            scraper.profiles.learn("Acme", card="div.job-card")
+            assert len(scraper._parse_company_page("Acme", "https://acme.com/search", page)) == 1, "Fallback failed"
+            assert scraper.profiles.get("Acme")["card"] == "li.job", "Profile not corrected"
+
+            scraper.profiles.save()
+            assert CompanyProfiles(scraper.profiles.filepath).get("Acme") == profile, "Profile not persisted"
+
+        print(f"✓ Company selector profiles working correctly")
+        return True
+    except Exception as e:
+        print(f"✗ Company selector profiles error: {e}")
+        return False
+
+def test_rate_limiter():
+    """Test per-host token buckets and 429 backoff"""
+    print("\nTesting rate limiter...")
+    try:
+        from scrapers.rate_limiter import RateLimiter, parse_retry_after
+
+        limiter = RateLimiter({"rate": 2, "burst": 2}, {"example.com": {"rate": 1, "burst": 1}})
+
+        assert limiter.reserve("https://a.com/1") == 0 and limiter.reserve("https://a.com/2") == 0, "Burst not allowed"
+        assert 0.4 < limiter.reserve("https://a.com/3") <= 0.5, "Third request not delayed"
+        assert limiter.reserve("https://b.com/1") == 0, "Other host was delayed"
+        assert limiter.reserve("https://jobs.example.com/1") == 0
+        assert 0.9 < limiter.reserve("https://jobs.example.com/2") <= 1, "Domain limit not applied"
+
+        assert limiter.record("https://b.com/1", 200, {}) is None
+        assert limiter.record("https://b.com/1", 429, {"Retry-After": "5"}) == 5, "Retry-After ignored"
+        assert 4.9 < limiter.reserve("https://b.com/2") <= 5, "Host not backed off"
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0, "Past HTTP-date not handled"
+
+        print(f"✓ Rate limiter working correctly")
+        return True
+    except Exception as e:
+        print(f"✗ Rate limiter error: {e}")
+        return False
+
+def test_source_health():
+    """Test the circuit breaker for persistently failing sources"""
+    print("\nTesting source health...")
+    try:
+        import tempfile
+        from datetime import datetime, timedelta
+        from scrapers.source_health import HealthTracker, is_blocked_page, HEALTHY, PROBE, SKIP
+
+        with tempfile.TemporaryDirectory() as tmp:
+            health = HealthTracker(os.path.join(tmp, "health.json"), failure_threshold=2, base_backoff_hours=6)
+            now = datetime(2026, 1, 1)
+
+            health.record("LinkedIn", found=0, statuses=[999], blocked=1, now=now)
+            assert health.check("LinkedIn", now=now) == HEALTHY, "Tripped before the threshold"
+            health.record("LinkedIn", found=0, error=ConnectionError("timed out"), now=now)
+            assert health.check("LinkedIn", now=now) == SKIP, "Not skipped after repeated failures"
+            assert health.check("LinkedIn", now=now + timedelta(hours=7)) == PROBE, "Never probed again"
+
+            health.record("LinkedIn", found=0, statuses=[403], blocked=1, now=now + timedelta(hours=7))
+            assert health.check("LinkedIn", now=now + timedelta(hours=12)) == SKIP, "Backoff did not grow"
+
+            health.record("LinkedIn", found=5, now=now + timedelta(days=1))
+            assert health.check("LinkedIn", now=now + timedelta(days=1)) == HEALTHY, "Success did not reset"
+
+            for _ in range(3):
+                health.record("Simplify", found=0, statuses=[304], now=now)
+            assert health.check("Simplify", now=now) == HEALTHY, "304 counted as a failure"
+
+            # Cards parsed but nothing new is healthy, however often it happens
+            for _ in range(5):
+                health.record("Handshake", found=12, statuses=[200], now=now)
+            assert health.check("Handshake", now=now) == HEALTHY, "Parsed cards counted as empty"
+
+            # Normal answers that parse no cards at all back off on their own streak
+            empty = HealthTracker(os.path.join(tmp, "empty.json"), failure_threshold=2, base_backoff_hours=6,
+                                  empty_threshold=3)
+            for _ in range(2):
+                empty.record("Indeed", found=0, statuses=[200], now=now)
+            assert empty.check("Indeed", now=now) == HEALTHY, "Tripped before the empty threshold"
+            empty.record("Indeed", found=0, statuses=[200], now=now)
+            assert empty.check("Indeed", now=now) == SKIP, "Empty runs never backed off"
+            assert empty.check("Indeed", now=now + timedelta(hours=7)) == PROBE, "Empty source never probed"
+            empty.record("Indeed", found=8, statuses=[200], now=now + timedelta(hours=7))
+            assert empty.check("Indeed", now=now + timedelta(hours=7)) == HEALTHY, "Cards did not reset the empty streak"
+
+            health.save()
+            reloaded = HealthTracker(os.path.join(tmp, "health.json"))
+            assert reloaded.check("Acme", kind="companies") == HEALTHY
+
+        from config import HEALTH_BASE_BACKOFF_HOURS, SCRAPE_INTERVAL_HOURS
+        assert HEALTH_BASE_BACKOFF_HOURS > SCRAPE_INTERVAL_HOURS, "First backoff doesn't skip a scheduled run"
+        assert is_blocked_page(200, b"<html>Please complete the CAPTCHA</html>"), "Captcha page not detected"
+        assert not is_blocked_page(200, b"<html>Hardware Intern</html>")
+
+        print(f"✓ Source health working correctly")
+        return True
+    except Exception as e:
+        print(f"✗ Source health error: {e}")
+        return False
+
+def test_http_cache():
+    """Test that validators are only persisted by save()"""
+    print("\nTesting conditional-GET cache...")
+    try:
+        import tempfile
+        from types import SimpleNamespace
+        from scrapers.http_cache import HttpCache
+
+        url = "https://example.com/listings.json"
+        response = SimpleNamespace(status_code=200, headers={"ETag": '"abc"'})
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "http_cache.json")
+            HttpCache(path).remember(url, response)
+            assert not os.path.exists(path), "Validator written before the jobs were saved"
+            assert HttpCache(path).conditional_headers(url) == {}, "Unsaved validator reused"
+
+            cache = HttpCache(path)
+            cache.remember(url, response)
+            cache.save()
+            assert HttpCache(path).conditional_headers(url) == {"If-None-Match": '"abc"'}
+
+        print(f"✓ Conditional-GET cache working correctly")
+        return True
+    except Exception as e:
+        print(f"✗ Conditional-GET cache error: {e}")
+        return False
+
+def test_json_stream():
+    """Test incremental JSON array parsing across chunk boundaries"""
+    print("\nTesting streaming JSON parser...")
+    try:
+        import json
+        from scrapers.json_stream import iter_json_array
+
+        listings = [{"title": f"Hardware Intern {i}", "locations": ["Austin, TX"]} for i in range(50)]
+        raw = json.dumps(listings, indent=2).encode()
+
+        # Tiny chunks split items, strings and numbers mid-token
+        chunks = [raw[i:i + 7] for i in range(0, len(raw), 7)]
+        parsed = list(iter_json_array(chunks))
+
+        assert parsed == listings, "Streamed items differ from json.loads"
+        assert list(iter_json_array([b"[]"])) == [], "Empty array not handled"
+
+        print(f"✓ Streaming JSON parser working correctly")
+        print(f"  - Parsed {len(parsed)} items from {len(chunks)} chunks")
+        return True
+    except Exception as e:
+        print(f"✗ Streaming JSON parser error: {e}")
+        return False
+
+def test_segment_store():
+    """Test the append-only segment store (and SQLite) merge and dedupe correctly"""
+    print("\nTesting segment store...")
+    try:
+        import tempfile
+        from storage import SegmentStore
+
+        def make_job(i):
+            return {"id": f"job-{i}", "title": f"Intern {i}", "scraped_date": f"2026-01-{i % 28 + 1:02d} 00:00:00"}
+
+        with tempfile.TemporaryDirectory() as directory:
+            store = SegmentStore(directory, max_segments=2)
+
+            assert store.add([make_job(i) for i in range(0, 10)]) == 10
+            assert store.add([make_job(i) for i in range(5, 15)]) == 5, "Known ids were not skipped"
+            assert store.add([make_job(i) for i in range(15, 20)]) == 5
+            store.wait_for_compaction()
+
+            jobs = store.load_sorted()
+            dates = [job["scraped_date"] for job in jobs]
+
+            assert len(jobs) == store.count() == 20, "Wrong job count"
+            assert dates == sorted(dates, reverse=True), "Jobs not sorted newest first"
+
+            # Staged jobs are part of the sorted view, as with JsonFileStore
+            store.stage([make_job(27)])
+            assert store.count() == len(store.load_sorted()) == 21, "Staged job missing from iter_sorted"
+            assert store.load_sorted()[0]["id"] == "job-27", "Staged job not merged in order"
+
+            # SQLite stages upserts of stored ids too; they must not show up twice
+            from storage import SqliteStore
+            sqlite = SqliteStore(os.path.join(directory, "jobs.db"), "jobs_all")
+            sqlite.add([make_job(1), make_job(2)])
+            sqlite.stage([dict(make_job(1), title="Intern 1 (updated)"), make_job(3)])
+            ids = [job["id"] for job in sqlite.load_sorted()]
+            assert sqlite.count() == len(ids) == 3 and sorted(ids) == ["job-1", "job-2", "job-3"], f"Unexpected rows: {ids}"
+            assert {job["id"]: job["title"] for job in sqlite.load_sorted()}["job-1"] == "Intern 1 (updated)", "Upsert not applied"
+
+        print(f"✓ Segment store working correctly")
+        print(f"  - {len(jobs)} jobs read back in order")
+        return True
+    except Exception as e:
+        print(f"✗ Segment store error: {e}")
+        return False
+
+def test_near_duplicates():
+    """Test that cross-source duplicates are detected and variants are kept"""
+    print("\nTesting near-duplicate index...")
+    try:
+        import tempfile
+        from storage.dedup import NearDuplicateIndex
+
+        def make_job(job_id, title, company, source, location=""):
+            return {"id": job_id, "title": title, "company": company, "source": source,
+                    "location": location, "url": f"https://example.com/{job_id}"}
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "dedup.jsonl")
+            index = NearDuplicateIndex(path)
+            index.add(make_job("a", "Hardware Engineering Intern - Summer 2026", "Acme, Inc.", "Simplify", "Austin, TX"))
+
+            duplicate = make_job("b", "Summer 2026 Hardware Engineering Intern", "Acme", "LinkedIn", "Austin, Texas, United States")
+            variant = make_job("c", "Hardware Engineering Intern - Spring 2026", "Acme", "LinkedIn")
+            same_source = make_job("d", "Summer 2026 Hardware Engineering Intern", "Acme", "Simplify")
+            other_city = make_job("e", "Hardware Engineering Intern - Summer 2026", "Acme", "LinkedIn", "San Jose, CA")
+
+            assert index.find_duplicate(duplicate) == "a", "Reordered title not matched"
+            assert index.find_duplicate(variant) is None, "Different term was merged"
+            assert index.find_duplicate(same_source) is None, "Same-source job was merged"
+            assert index.find_duplicate(other_city) is None, "Same role in another city was merged"
+
+            index.link("a", duplicate)
+            assert "b" in index, "Linked duplicate not marked as seen"
+            index.save()
+            size = os.path.getsize(path)
+
+            reloaded = NearDuplicateIndex(path)
+            assert reloaded.load(), "Index not persisted"
+            assert reloaded.find_duplicate(duplicate) == "a", "Reloaded index lost buckets"
+            assert "b" in reloaded, "Duplicate id not persisted"
+            urls = reloaded.annotate(make_job("a", "Hardware Engineering Intern - Summer 2026", "Acme", "Simplify"))["urls"]
+            assert [link["source"] for link in urls] == ["Simplify", "LinkedIn"], "Source links missing"
+
+            # Re-linking a known duplicate writes nothing; new jobs are appended, not rewritten
+            reloaded.link("a", duplicate)
+            assert not reloaded.changed, "Known duplicate linked again"
+            reloaded.add(other_city)
+            reloaded.save()
+            with open(path) as f:
+                lines = f.readlines()
+            assert os.path.getsize(path) > size and len(lines) == 4, "Index not appended"
+
+        print(f"✓ Near-duplicate index working correctly")
+        return True
+    except Exception as e:
+        print(f"✗ Near-duplicate index error: {e}")
+        return False
+
+def test_shards():
+    """Test oldest-anchored shard output for the site"""
+    print("\nTesting sharded output...")
+    try:
+        import json
+        import tempfile
+        from storage import publish_shards
+
+        jobs = [{"id": str(i), "title": "Hardware Intern", "scraped_date": f"2026-01-01 00:{i // 60:02d}:{i % 60:02d}",
+                 "description": "x" * 500, "url": f"https://acme.com/{i}"} for i in range(250)]
+        jobs.reverse()
+
+        with tempfile.TemporaryDirectory() as directory:
+            open(os.path.join(directory, "jobs_009.json"), 'w').close()  # Left over from a longer run
+            manifest = publish_shards(iter(jobs), directory, shard_size=100)
+
+            # Counted from the oldest job: only the newest shard is partly full
+            assert [s["count"] for s in manifest["shards"]] == [50, 100, 100], f"Unexpected shards: {manifest['shards']}"
+            assert [s["file"] for s in manifest["shards"]] == ["jobs_002.json", "jobs_001.json", "jobs_000.json"]
+            assert manifest["total"] == 250 and manifest["updated"] == jobs[0]["scraped_date"]
+            with open(os.path.join(directory, "jobs_002.json")) as f:
+                listed = json.load(f)
+            assert [job["id"] for job in listed] == [job["id"] for job in jobs[:50]], "Newest shard is not the newest jobs"
+            assert "description" not in listed[0] and listed[0]["title"] == "Hardware Intern", "List entry not slim"
+
+            # Heavy fields are fetched per shard, keyed by id
+            with open(os.path.join(directory, manifest["shards"][0]["details"])) as f:
+                details = json.load(f)
+            assert details[jobs[0]["id"]] == {"description": "x" * 500, "url": jobs[0]["url"]}, "Detail missing"
+            with open(os.path.join(directory, "manifest.json")) as f:
+                assert json.load(f) == manifest, "Manifest not written"
+            assert not os.path.exists(os.path.join(directory, "jobs_009.json")), "Stale shard kept"
+
+            # New jobs only change the newest shard; older ones keep their files and versions
+            mtimes = {name: os.stat(os.path.join(directory, name)).st_mtime_ns for name in ("jobs_000.json", "details_001.json")}
+            newer = [dict(jobs[0], id=f"new-{i}", scraped_date="2026-02-01 00:00:00") for i in range(10)]
+            updated = publish_shards(newer + jobs, directory, shard_size=100)
+            assert [s["count"] for s in updated["shards"]] == [60, 100, 100], "New jobs moved shard boundaries"
+            assert updated["shards"][1:] == manifest["shards"][1:], "Older shards changed"
+            assert updated["shards"][0]["version"] != manifest["shards"][0]["version"], "Newest shard version not bumped"
+            for name, mtime in mtimes.items():
+                assert os.stat(os.path.join(directory, name)).st_mtime_ns == mtime, f"{name} rewritten"
+
+        print(f"✓ Sharded output working correctly")
+        return True
+    except Exception as e:
+        print(f"✗ Sharded output error: {e}")
+        return False
+
+def test_search_index():
+    """Test the inverted index published next to the shards"""
+    print("\nTesting search index...")
+    try:
+        from itertools import accumulate
+        from storage import SearchIndexBuilder
+
+        jobs = [
+            {"title": "FPGA Design Intern", "company": "Acme", "location": "Austin, TX", "source": "LinkedIn"},
+            {"title": "Analog Circuit Intern", "company": "Acme", "location": "Remote", "source": "Indeed",
+             "urls": [{"source": "Indeed", "url": "a"}, {"source": "LinkedIn", "url": "b"}]},
+            {"title": "Hardware Intern", "company": "Skydio", "location": "San Mateo, CA", "source": "Simplify",
+             "description": "FPGA bring-up"},
+        ]
+
+        builder = SearchIndexBuilder()
+        assert list(builder.collect(jobs)) == jobs, "Jobs not passed through"
+        index = builder.to_dict(version="v1")
+
+        assert index["tokens"] == sorted(index["tokens"]) and index["total"] == 3
+        postings = dict(zip(index["tokens"], (list(accumulate(gaps)) for gaps in index["postings"])))
+        assert postings["fpga"] == [0, 2] and postings["acme"] == [0, 1], f"Unexpected postings: {postings}"
+        assert list(accumulate(index["facets"]["source"]["LinkedIn"])) == [0, 1], "Linked source missing from facet"
+
+        print(f"✓ Search index working correctly")
+        return True
+    except Exception as e:
+        print(f"✗ Search index error: {e}")
+        return False
+
+def test_publish():
+    """Test minified site output and its size report"""
+    print("\nTesting compact publishing...")
+    try:
+        import gzip
+        import json
+        import tempfile
+        from storage.publish import PublishReport, publish_json, brotli
+        from storage.json_store import write_json_array
+
+        jobs = [{"id": str(i), "title": "Hardware Intern", "company": "Acme"} for i in range(200)]
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "jobs.json")
+            report = PublishReport()
+            publish_json(path, jobs, report)
+
+            with open(path, 'rb') as f:
+                raw = f.read()
+            assert raw == json.dumps(jobs, separators=(',', ':')).encode(), "Output not minified"
+            assert not os.path.exists(f"{path}.gz") and not os.path.exists(f"{path}.br"), "Compressed sibling written"
+
+            formats = report.to_dict()["formats"]
+            assert formats["pretty"]["disk_bytes"] == 0 and formats["gzip"]["disk_bytes"] == 0, "Measured format counted as written"
+            assert formats["gzip"]["wire_bytes"] == len(gzip.compress(raw, compresslevel=9, mtime=0))
+            assert formats["gzip"]["wire_bytes"] < formats["minified"]["wire_bytes"] < formats["pretty"]["wire_bytes"]
+            if brotli is not None:
+                assert formats["brotli"]["wire_bytes"] == len(brotli.compress(raw))
+            assert "ms" in report.summary() and "encode_ms" not in json.dumps(report.to_dict()), "Timings in the written report"
+
+            # Publishing the same data again leaves both the file and the report untouched
+            report_path = os.path.join(directory, "report.json")
+            report.write(report_path)
+            mtimes = [os.stat(p).st_mtime_ns for p in (path, report_path)]
+            again = PublishReport()
+            publish_json(path, jobs, again)
+            again.write(report_path)
+            assert [os.stat(p).st_mtime_ns for p in (path, report_path)] == mtimes, "Unchanged output rewritten"
+
+            # The streaming writer's minified form matches json.dumps too
+            write_json_array(path, iter(jobs), indent=None)
+            with open(path, 'rb') as f:
+                assert f.read() == raw, "Streamed minified JSON differs"
+
+        print(f"✓ Compact publishing working correctly")
+        return True
+    except Exception as e:
+        print(f"✗ Compact publishing error: {e}")
+        return False
+
+def test_parser_benchmark():
+    """Smoke-test the offline parser benchmark on one fixture (the full run is benchmarks/bench_scrapers.py)"""
+    print("\nTesting offline parser benchmark...")
+    try:
+        import json
+        from benchmarks.bench_scrapers import BASELINE, measure, compare
+
+        results = {"sources": {"linkedin": measure("linkedin", repeat=1)}}
+        result = results["sources"]["linkedin"]
+        assert result["cards"] > 0 and result["jobs"] > 0, "linkedin parsed nothing"
+        assert result["jobs"] <= result["cards"], "linkedin made more jobs than cards"
+        assert result["peak_kb"] > 0, "linkedin peak memory not traced"
+
+        assert compare(results, results, 0.25) == [], "Identical results flagged"
+        fewer = {"sources": {"linkedin": dict(result, jobs=0)}}
+        assert compare(fewer, results, 0.25), "Lost jobs not flagged"
+
+        # The committed baseline covers the same fixture and parse
+        with open(BASELINE) as f:
+            baseline = json.load(f)["sources"]["linkedin"]
+        assert (baseline["cards"], baseline["jobs"]) == (result["cards"], result["jobs"]), "Baseline out of date"
+
+        print(f"✓ Parser benchmark ran offline ({result['cards']} LinkedIn cards)")
+        return True
+    except Exception as e:
+        print(f"✗ Parser benchmark error: {e}")
+        return False
+
 def test_data_directory():
     """Test that data directory can be created"""
     print("\nTesting data directory...")
@@ -111,6 +743,23 @@ def main():
         test_config,
         test_scrapers,
         test_job_class,
+        test_keyword_matcher,
+        test_url_canonical,
+        test_html_parsing,
+        test_query_planner,
+        test_linkedin_pagination,
+        test_watermarks,
+        test_company_profiles,
+        test_rate_limiter,
+        test_source_health,
+        test_http_cache,
+        test_json_stream,
+        test_segment_store,
+        test_near_duplicates,
+        test_shards,
+        test_search_index,
+        test_publish,
+        test_parser_benchmark,
         test_data_directory,
     ]
 